@@ -0,0 +1,57 @@
+"""
+Memory benchmark: pre-rendered risk factor strings vs compact factor codes
+
+Run from the project root:
+    python -m benchmarks.bench_factor_codes
+"""
+
+import json
+import tracemalloc
+
+from benchmarks.bench_batch_scoring import make_applications
+from benchmarks.bench_rulebook import legacy_calculate_risk_score
+from services.risk_engine import calculate_risk_score, calculate_risk_scores_batch
+
+def legacy_result(company_data):
+    """Result dict shaped like the old engine output, with rendered factor strings"""
+    risk_score, risk_level, risk_factors = legacy_calculate_risk_score(company_data)
+    return {
+        "risk_score": risk_score,
+        "risk_level": risk_level,
+        "color": "🟢",
+        "risk_factors": risk_factors,
+        "recommendation": "Proceed"
+    }
+
+def retained_bytes(build):
+    """Bytes still allocated after build() returns, with the result kept alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+def main():
+    n = 100_000
+    df = make_applications(n)
+    records = df.to_dict("records")
+    
+    cases = [
+        ("rendered strings (old)", lambda: [legacy_result(row) for row in records]),
+        ("factor codes", lambda: [calculate_risk_score(row) for row in records]),
+        ("batch arrays", lambda: calculate_risk_scores_batch(df))
+    ]
+    
+    print(f"{'':<24} {'bytes/result':>14}")
+    for name, build in cases:
+        print(f"{name:<24} {retained_bytes(build) / n:>14.0f}")
+    
+    # Size of the risk_analysis block stored with every approval
+    old = json.dumps(legacy_result(records[0]))
+    new = json.dumps(calculate_risk_score(records[0]))
+    print(f"\nStored approval risk_analysis JSON: {len(old.encode())} bytes -> {len(new.encode())} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Batch AI explanations: sequential generate_llm_explanation vs the async fan-out
+
+Explains the same synthetic deals one at a time and with
+services.llm_batch.generate_llm_explanations against
+benchmarks/mock_openai_server.py, which adds latency and answers every Nth
+request with a 429. Reports wall time, how many items fell back to the
+rule-based explanation, and the peak number of requests the server saw in
+flight. The LLM response cache is disabled so every call goes over the wire.
+
+Run from the project root:
+    python -m benchmarks.bench_llm_batch
+    python -m benchmarks.bench_llm_batch --deals 100 --latency-ms 500 --rate-limit-every 10 --concurrency 16
+"""
+
+import argparse
+import os
+import time
+
+os.environ["AURA_LLM_CACHE_PATH"] = ""
+
+from benchmarks.mock_openai_server import start_mock_server
+from benchmarks.suite import make_deals
+from services.llm_batch import generate_llm_explanations
+from services.llm_integration import generate_fallback_explanation, generate_llm_explanation
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs concurrent LLM explanations against a mock server")
+    parser.add_argument("--deals", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--rate-limit-every", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--rpm", type=int, default=600, help="requests per minute budget for the async run")
+    parser.add_argument("--tpm", type=int, default=2_000_000, help="tokens per minute budget for the async run")
+    args = parser.parse_args()
+
+    server = start_mock_server(latency_ms=args.latency_ms, rate_limit_every=args.rate_limit_every)
+    os.environ["OPENAI_BASE_URL"] = server.base_url
+    os.environ["OPENAI_API_KEY"] = "sk-mock"
+
+    deals = make_deals(args.deals)
+    fallbacks = {generate_fallback_explanation(*deal) for deal in deals}
+
+    runs = [
+        ("sequential", lambda: [generate_llm_explanation(*deal) for deal in deals]),
+        (f"async x{args.concurrency}", lambda: generate_llm_explanations(
+            deals, concurrency=args.concurrency, requests_per_minute=args.rpm, tokens_per_minute=args.tpm
+        ))
+    ]
+
+    print(f"{'run':<12} {'seconds':>8} {'deals/s':>8} {'fallbacks':>10} {'429s':>6} {'peak in flight':>15}")
+    for name, run in runs:
+        rate_limited = server.rate_limited
+        server.peak_in_flight = 0
+        start = time.perf_counter()
+        explanations = run()
+        seconds = time.perf_counter() - start
+
+        print(
+            f"{name:<12} {seconds:>8.2f} {len(deals) / seconds:>8.1f} "
+            f"{sum(explanation in fallbacks for explanation in explanations):>10,} "
+            f"{server.rate_limited - rate_limited:>6,} {server.peak_in_flight:>15,}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Request latency: a new OpenAI client per call vs the shared pooled client
+
+Sends the same explanation prompt to benchmarks/mock_openai_server.py (or
+to --base-url) with a freshly constructed client per request, the old
+behaviour, and with services.openai_client.get_openai_client(), and reports
+per-request latency and how many TCP connections the mock server accepted.
+The LLM response cache is disabled so every call goes over the wire.
+
+Run from the project root:
+    python -m benchmarks.bench_openai_client
+    python -m benchmarks.bench_openai_client --requests 200 --latency-ms 20
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ["AURA_LLM_CACHE_PATH"] = ""
+
+from benchmarks.mock_openai_server import start_mock_server
+from benchmarks.suite import make_deals
+from services.llm_integration import build_explanation_prompt, explanation_request
+from services.openai_client import create_openai_client, get_openai_client
+
+def explain(client, prompt):
+    return client.chat.completions.create(**explanation_request(prompt)).choices[0].message.content
+
+def time_requests(make_client, prompts):
+    """Per-request latencies in ms"""
+    latencies = []
+    for prompt in prompts:
+        start = time.perf_counter()
+        client = make_client()
+        explain(client, prompt)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-call vs pooled OpenAI clients against a mock server")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=5)
+    parser.add_argument("--base-url", help="an already running server instead of the in-process mock")
+    args = parser.parse_args()
+
+    server = None if args.base_url else start_mock_server(latency_ms=args.latency_ms)
+    os.environ["OPENAI_BASE_URL"] = args.base_url or server.base_url
+    os.environ.setdefault("OPENAI_API_KEY", "sk-mock")
+
+    prompts = [build_explanation_prompt(*deal) for deal in make_deals(args.requests)]
+
+    # Per-call clients are closed after each run so their sockets do not pile up
+    opened_clients = []
+
+    def per_call():
+        opened_clients.append(create_openai_client(os.environ["OPENAI_API_KEY"], os.environ["OPENAI_BASE_URL"]))
+        return opened_clients[-1]
+
+    print(f"{'client':<10} {'p50 ms':>8} {'p95 ms':>8} {'mean ms':>8} {'connections':>12}")
+    for name, make_client in [("per-call", per_call), ("pooled", get_openai_client)]:
+        connections = server.connections if server else 0
+        explain(make_client(), prompts[0])
+        latencies = sorted(time_requests(make_client, prompts))
+        for client in opened_clients:
+            client.close()
+        opened_clients.clear()
+
+        opened = f"{server.connections - connections:>12,}" if server else f"{'n/a':>12}"
+        print(
+            f"{name:<10} {statistics.median(latencies):>8.2f} {latencies[int(len(latencies) * 0.95) - 1]:>8.2f} "
+            f"{statistics.mean(latencies):>8.2f} {opened}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+File size and build time per PDF output profile
+
+Builds the same term sheets and a small credit book with every profile in
+utils.pdf_generator.PDF_PROFILES. The "embedded" profile is only there
+when a TrueType font is configured (AURA_PDF_FONT_PATH). assets/logo.png is
+used as the header logo if it is a real image; --sample-logo draws a
+synthetic 1600x500 logo instead so downsampling shows up in the sizes.
+
+Run from the project root:
+    python -m benchmarks.bench_pdf_profiles
+    python -m benchmarks.bench_pdf_profiles --sample-logo --deals 50
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from PIL import Image, ImageDraw
+
+from benchmarks.suite import make_deals
+from services.explanation_engine import generate_explanation
+from utils import pdf_generator
+from utils.pdf_generator import PDF_PROFILES, generate_portfolio_report_pdf, generate_term_sheet_pdf
+
+def make_sample_logo(path):
+    """A large gradient logo, the kind of image that bloats PDFs when embedded at full size"""
+    image = Image.new("RGB", (1600, 500))
+    draw = ImageDraw.Draw(image)
+    for x in range(1600):
+        draw.line([(x, 0), (x, 500)], fill=(31, 71 + x % 64, 136 + x % 96))
+    draw.ellipse([60, 60, 440, 440], fill=(255, 255, 255))
+    image.save(path)
+
+def best_of(fn, repeat):
+    """Fastest of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF output profiles on size and build time")
+    parser.add_argument("--deals", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sample-logo", action="store_true")
+    args = parser.parse_args()
+
+    deals = make_deals(args.deals)
+    workdir = tempfile.mkdtemp(prefix="aura_pdf_")
+    if args.sample_logo:
+        pdf_generator.LOGO_PATH = os.path.join(workdir, "logo.png")
+        make_sample_logo(pdf_generator.LOGO_PATH)
+
+    print(f"{'profile':<10} {'term sheet':>12} {'ms/doc':>8} {'credit book':>13} {'ms/deal':>8}")
+    for profile in PDF_PROFILES:
+        def term_sheets():
+            return [
+                generate_term_sheet_pdf(
+                    company["company_name"], company["industry"], company["loan_amount"], company["purpose"],
+                    risk, terms, profile=profile
+                ).getbuffer().nbytes
+                for company, risk, terms in deals
+            ]
+
+        sizes = term_sheets()
+        term_sheet_time = best_of(term_sheets, args.repeat) / len(deals)
+
+        book_path = os.path.join(workdir, f"book_{profile}.pdf")
+        book = lambda: generate_portfolio_report_pdf(deals, book_path, explain=generate_explanation, profile=profile)
+        book_time = best_of(book, max(1, args.repeat // 2)) / len(deals)
+
+        print(
+            f"{profile:<10} {sum(sizes) / len(sizes) / 1024:>9.1f} KB {term_sheet_time * 1000:>8.2f} "
+            f"{os.path.getsize(book_path) / 1024:>10.1f} KB {book_time * 1000:>8.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
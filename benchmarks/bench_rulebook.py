@@ -0,0 +1,119 @@
+"""
+Micro-benchmark: compiled rulebook evaluator vs the hard-coded risk function
+
+Run from the project root:
+    python -m benchmarks.bench_rulebook
+"""
+
+import timeit
+
+from services.risk_engine import calculate_risk_score
+from services.rulebook import DEFAULT_RULEBOOK, compile_rulebook
+
+APPLICATION = {
+    "company_name": "ABC Manufacturing Corp",
+    "industry": "Energy",
+    "revenue": 25.0,
+    "loan_amount": 8.0,
+    "purpose": "Working Capital"
+}
+
+def legacy_calculate_risk_score(company_data):
+    """The if/elif implementation the rulebook replaced, kept here as the baseline"""
+    
+    risk_score = 0
+    risk_factors = []
+    
+    revenue = company_data.get("revenue", 0)
+    if revenue < 10:
+        risk_score += 30
+        risk_factors.append("⚠️ Low revenue base (<$10M)")
+    elif revenue < 50:
+        risk_score += 15
+        risk_factors.append("ℹ️ Moderate revenue ($10M-$50M)")
+    else:
+        risk_factors.append("✅ Strong revenue base (>$50M)")
+    
+    loan_amount = company_data.get("loan_amount", 0)
+    if revenue > 0:
+        ltv = (loan_amount / revenue) * 100
+        if ltv > 50:
+            risk_score += 25
+            risk_factors.append(f"⚠️ High loan-to-revenue ratio ({ltv:.1f}%)")
+        elif ltv > 25:
+            risk_score += 10
+            risk_factors.append(f"ℹ️ Moderate leverage ({ltv:.1f}%)")
+        else:
+            risk_factors.append(f"✅ Conservative leverage ({ltv:.1f}%)")
+    
+    high_risk_industries = ["Energy", "Hospitality", "Retail"]
+    industry = company_data.get("industry", "")
+    if industry in high_risk_industries:
+        risk_score += 20
+        risk_factors.append(f"⚠️ {industry} sector volatility")
+    else:
+        risk_factors.append(f"✅ {industry} sector stability")
+    
+    if company_data.get("purpose") == "Working Capital":
+        risk_score += 10
+        risk_factors.append("ℹ️ Working capital refinancing risk")
+    
+    if risk_score > 60:
+        risk_level = "HIGH RISK"
+    elif risk_score > 35:
+        risk_level = "MODERATE RISK"
+    else:
+        risk_level = "LOW RISK"
+    
+    return risk_score, risk_level, risk_factors
+
+def interpreted_risk_score(company_data, rulebook=DEFAULT_RULEBOOK):
+    """Walks the rulebook dict on every call; shows what compiling saves"""
+    
+    revenue = company_data.get("revenue", 0)
+    risk_score = 0
+    
+    for band in rulebook["revenue_bands"]:
+        if band["below"] is None or revenue < band["below"]:
+            risk_score += band["points"]
+            break
+    
+    if revenue > 0:
+        ltv = (company_data.get("loan_amount", 0) / revenue) * 100
+        for band in rulebook["leverage_bands"]:
+            if band["max"] is None or ltv <= band["max"]:
+                risk_score += band["points"]
+                break
+    
+    if company_data.get("industry", "") in rulebook["high_risk_industries"]:
+        risk_score += rulebook["industry_penalty"]
+    
+    penalty = rulebook["purpose_penalties"].get(company_data.get("purpose"))
+    if penalty:
+        risk_score += penalty["points"]
+    
+    for level in rulebook["risk_levels"]:
+        if level["max_score"] is None or risk_score <= level["max_score"]:
+            return risk_score, level["level"]
+
+def main():
+    compiled = compile_rulebook(DEFAULT_RULEBOOK)
+    evaluate = compiled.evaluate
+    data = APPLICATION
+    
+    cases = [
+        ("legacy hard-coded function", lambda: legacy_calculate_risk_score(data)),
+        ("interpreted rulebook", lambda: interpreted_risk_score(data)),
+        ("compiled evaluator", lambda: evaluate(data["revenue"], data["loan_amount"], data["industry"], data["purpose"])),
+        ("calculate_risk_score", lambda: calculate_risk_score(data, compiled))
+    ]
+    
+    number = 200_000
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        print(f"{name:<28} {best * 1e9:>8.0f} ns/call")
+    
+    print(f"{'compile_rulebook':<28} {min(timeit.repeat(lambda: compile_rulebook(DEFAULT_RULEBOOK), number=200, repeat=3)) / 200 * 1e6:>8.0f} us/call")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Overhead benchmark for shadow scoring
+
+Compares the champion batch scorer alone against champion + challenger in the
+same pass, and checks the shadow challenger matches a full challenger run.
+
+Run from the project root:
+    python -m benchmarks.bench_shadow_scoring
+    python -m benchmarks.bench_shadow_scoring --rows 1000000
+"""
+
+import argparse
+import copy
+import time
+
+import numpy as np
+
+from benchmarks.bench_batch_scoring import make_applications
+from services.risk_engine import calculate_risk_scores_batch
+from services.rulebook import DEFAULT_RULEBOOK, compile_rulebook, prepare_batch_inputs
+from services.shadow_scoring import shadow_score_batch
+
+def make_challenger():
+    """Stricter leverage, heavier industry penalty and a narrower low-risk band"""
+    challenger = copy.deepcopy(DEFAULT_RULEBOOK)
+    challenger["version"] = DEFAULT_RULEBOOK["version"] + "-challenger"
+    challenger["leverage_bands"][0]["max"] = 40
+    challenger["industry_penalty"] = 25
+    challenger["risk_levels"][0]["max_score"] = 25
+    return challenger
+
+def best_of(fn, repeat):
+    """Fastest of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shadow scoring overhead")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    df = make_applications(args.rows)
+    champion = compile_rulebook(DEFAULT_RULEBOOK)
+    challenger = compile_rulebook(make_challenger())
+
+    _, store = shadow_score_batch(df, challenger, champion)
+    full = challenger.evaluate_batch(prepare_batch_inputs(df))
+    baseline = champion.evaluate_batch(prepare_batch_inputs(df))
+    diff = store.disagreements()
+    assert np.array_equal(diff["row"], np.flatnonzero(full["band"] != baseline["band"]))
+    assert np.array_equal(diff["challenger_score"], full["risk_score"][diff["row"]])
+
+    champion_time = best_of(lambda: calculate_risk_scores_batch(df, champion), args.repeat)
+    shadow_time = best_of(lambda: shadow_score_batch(df, challenger, champion), args.repeat)
+
+    summary = store.summary()
+    print(f"{args.rows:,} rows, {summary['disagreements']:,} band disagreements ({summary['disagreement_rate']:.1%})")
+    print(f"champion only      {champion_time * 1000:>9.1f} ms")
+    print(f"champion + shadow  {shadow_time * 1000:>9.1f} ms  overhead {shadow_time / champion_time - 1:>6.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Scaling benchmark for the Monte Carlo stress test
+
+Run from the project root:
+    python -m benchmarks.bench_stress_test
+    python -m benchmarks.bench_stress_test --scenarios 10000 --loans 100000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.bench_batch_scoring import make_applications
+from services.stress_test import run_stress_test
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stress test across worker counts")
+    parser.add_argument("--scenarios", type=int, default=1000)
+    parser.add_argument("--loans", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument("--max-cells", type=int, default=2_000_000, help="Scenario x loan cells per block in a worker")
+    args = parser.parse_args()
+    
+    loans = make_applications(args.loans)
+    cells = args.scenarios * args.loans
+    baseline = None
+    
+    for workers in args.workers:
+        start = time.perf_counter()
+        run_stress_test(loans, args.scenarios, max_workers=workers, max_cells=args.max_cells)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers {elapsed:>9.2f} s {cells / elapsed:>16,.0f} loan-scenarios/s  speedup {baseline / elapsed:>5.2f}x")
+
+if __name__ == "__main__":
+    main()
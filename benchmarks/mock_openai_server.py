@@ -0,0 +1,128 @@
+"""
+Local stand-in for the OpenAI chat completions endpoint
+
+Answers POST /v1/chat/completions with a canned completion after a fixed
+latency, over HTTP/1.1 keep-alive. It counts the TCP connections it accepted
+and the peak number of requests in flight, so client-side connection reuse
+and concurrency limits show up directly, and can answer every Nth request
+with a 429 rate limit error (with retry-after headers) to exercise retries
+and fallbacks. Point the app or a benchmark at it with
+OPENAI_BASE_URL=http://127.0.0.1:PORT/v1 and any OPENAI_API_KEY.
+
+Run from the project root:
+    python -m benchmarks.mock_openai_server --port 8089 --latency-ms 50
+    python -m benchmarks.mock_openai_server --latency-ms 300 --rate-limit-every 5
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with self.server.lock:
+            self.server.requests += 1
+            number = self.server.requests
+            self.server.in_flight += 1
+            self.server.peak_in_flight = max(self.server.peak_in_flight, self.server.in_flight)
+        try:
+            self._complete(request, number)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _complete(self, request, number):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+
+        # Rate limit errors come back immediately, completions after the latency
+        every = self.server.rate_limit_every
+        if every and number % every == 0:
+            with self.server.lock:
+                self.server.rate_limited += 1
+            self._send_json(429, {"error": {"message": "Rate limit reached (mock)", "type": "requests", "code": "rate_limit_exceeded"}},
+                            {"retry-after-ms": str(self.server.retry_after_ms), "retry-after": str(max(1, self.server.retry_after_ms // 1000))})
+            return
+
+        time.sleep(self.server.latency)
+        prompt = request.get("messages", [{}])[-1].get("content", "")
+        content = f"Mock explanation ({len(prompt)} prompt characters)."
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(200, {
+            "id": f"chatcmpl-mock-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+def start_mock_server(port=0, latency_ms=0, rate_limit_every=0, retry_after_ms=50):
+    """
+    Serve in a daemon thread; returns the server
+
+    The server's base_url, connections, requests, rate_limited and
+    peak_in_flight attributes describe what it has seen so far.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), MockOpenAIHandler)
+    server.daemon_threads = True
+    server.latency = latency_ms / 1000
+    server.rate_limit_every = rate_limit_every
+    server.retry_after_ms = retry_after_ms
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.requests = 0
+    server.rate_limited = 0
+    server.in_flight = 0
+    server.peak_in_flight = 0
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock OpenAI chat completions endpoint")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="answer every Nth request with a 429 (0 = never)")
+    parser.add_argument("--retry-after-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_mock_server(args.port, args.latency_ms, args.rate_limit_every, args.retry_after_ms)
+    print(f"Mock OpenAI API at {server.base_url} ({args.latency_ms:g} ms latency), Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
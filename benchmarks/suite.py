@@ -0,0 +1,310 @@
+"""
+Regression benchmark suite for the service hot paths
+
+Every case builds seeded synthetic inputs and times its target over the
+whole input set, looping short cases so each sample lasts at least 0.2 s, and
+keeps the fastest per-call time. Results are
+compared with the stored baselines in benchmarks/baselines.json and the run
+fails (exit code 1) if any case is slower than its baseline by more than the
+tolerance and by more than an absolute floor (a few microseconds), so
+noise on microsecond cases is not reported as a regression. At least
+MIN_REPEAT samples are needed for a comparison. Runs headless: no Streamlit, no network (the LLM path is never
+called and OPENAI_API_KEY is cleared).
+
+Run from the project root:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --tolerance 0.5 --only risk_score loan_terms
+    python -m benchmarks.suite --update-baselines
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+os.environ.pop("OPENAI_API_KEY", None)
+
+from benchmarks.bench_batch_scoring import INDUSTRIES, PURPOSES
+from services.amortization import amortization_schedule
+from services.explanation_engine import generate_explanation
+from services.financial_calculator import calculate_all_ratios, calculate_ratio_panel, calculate_ttm_ratios, period_over_period
+from services.llm_integration import generate_fallback_explanation
+from services.risk_engine import calculate_risk_score
+from services.structure_optimizer import optimize_loan_structure
+from services.term_generator import generate_loan_terms
+from utils.audit_log import filter_audit_log, load_audit_log
+from utils.pdf_generator import generate_portfolio_report_pdf, generate_term_sheet_pdf
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+DEFAULT_TOLERANCE = 0.25
+# Slowdowns smaller than this are timer and scheduler noise, whatever the percentage
+DEFAULT_MIN_DELTA_US = 5.0
+# Fewer samples than this do not give a stable fastest time
+MIN_REPEAT = 5
+SEED = 42
+
+USERS = ["admin", "analyst", "manager"]
+ACTIONS = ["Risk Analysis", "Term Sheet Generated", "Approved", "Rejected", "Document Upload"]
+
+def make_companies(n, seed=SEED):
+    """Company records like the Risk Analysis form produces"""
+    rng = np.random.default_rng(seed)
+    revenue = np.round(rng.lognormal(mean=3.2, sigma=1.0, size=n), 1) + 0.1
+    loan_amount = np.round(rng.lognormal(mean=1.8, sigma=0.9, size=n), 1)
+    return [
+        {
+            "company_name": f"Company {i:05d}",
+            "industry": INDUSTRIES[rng.integers(len(INDUSTRIES))],
+            "revenue": float(revenue[i]),
+            "loan_amount": float(loan_amount[i]),
+            "years_in_business": int(rng.integers(1, 40)),
+            "employees": int(rng.integers(5, 5000)),
+            "purpose": PURPOSES[rng.integers(len(PURPOSES))]
+        }
+        for i in range(n)
+    ]
+
+def make_deals(n, seed=SEED):
+    """(company_data, risk_analysis, loan_terms) triples"""
+    deals = []
+    for company in make_companies(n, seed):
+        risk_analysis = calculate_risk_score(company)
+        deals.append((company, risk_analysis, generate_loan_terms(company, risk_analysis)))
+    return deals
+
+def make_financials(n, seed=SEED):
+    """Financial statement inputs like the Financial Ratios page, including zero denominators"""
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.lognormal(mean=1.5, sigma=0.8, size=(n, 5)), 2)
+    values[rng.random((n, 5)) < 0.05] = 0.0
+    keys = ["ebitda", "debt_service", "total_debt", "ebit", "interest_expense"]
+    return [dict(zip(keys, map(float, row))) for row in values]
+
+def make_financial_panel(n_borrowers, n_periods, seed=SEED):
+    """Quarterly borrower x period panel with some zero denominators and missing quarters"""
+    rng = np.random.default_rng(seed)
+    panel = {}
+    for field in ["ebitda", "debt_service", "total_debt", "ebit", "interest_expense"]:
+        values = np.round(rng.lognormal(mean=1.5, sigma=0.8, size=(n_borrowers, n_periods)), 2)
+        values[rng.random(values.shape) < 0.03] = 0.0
+        values[rng.random(values.shape) < 0.01] = np.nan
+        panel[field] = values
+    return panel
+
+def make_audit_log(n, seed=SEED):
+    """Audit entries spread over the last 90 days, in the shape the pages write"""
+    rng = np.random.default_rng(seed)
+    now = datetime(2024, 6, 30, 12, 0, 0)
+    offsets = rng.uniform(0, 90 * 86400, n)
+    return [
+        {
+            "timestamp": (now - timedelta(seconds=float(offset))).isoformat(),
+            "user": USERS[rng.integers(len(USERS))],
+            "action": ACTIONS[rng.integers(len(ACTIONS))],
+            "company": f"Company {i % 500:05d}",
+            "risk_score": int(rng.integers(0, 100))
+        }
+        for i, offset in enumerate(offsets)
+    ]
+
+# Each case setup takes a scratch directory and returns (run, calls per run)
+
+def _risk_score_case(workdir):
+    companies = make_companies(2000)
+    return lambda: [calculate_risk_score(company) for company in companies], len(companies)
+
+def _loan_terms_case(workdir):
+    deals = make_deals(2000)
+    return lambda: [generate_loan_terms(company, risk) for company, risk, _ in deals], len(deals)
+
+def _ratios_case(workdir):
+    financials = make_financials(5000)
+    return lambda: [calculate_all_ratios(data) for data in financials], len(financials)
+
+def _ratio_panel_case(workdir):
+    panel = make_financial_panel(100_000, 24)
+
+    def run():
+        ratios = calculate_ratio_panel(panel)
+        period_over_period(ratios)
+        period_over_period(calculate_ttm_ratios(panel), lag=4, relative=True)
+
+    return run, 1
+
+def _amortization_case(workdir):
+    rng = np.random.default_rng(SEED)
+    n = 10_000
+    principal = rng.uniform(1, 50, n)
+    annual_rate = rng.uniform(3, 12, n)
+    years = rng.choice([3, 5, 7], n)
+
+    def run():
+        amortization_schedule(principal, annual_rate, years, "monthly", "ACT/365", date(2024, 1, 15))
+        amortization_schedule(principal, annual_rate, years, "quarterly", "30/360")
+
+    return run, 1
+
+def _structure_optimizer_case(workdir):
+    financial_data = {"ebitda": 12.0, "debt_service": 3.0, "total_debt": 30.0, "ebit": 9.0, "interest_expense": 2.0}
+    return lambda: optimize_loan_structure(15.0, financial_data), 1
+
+def _explanation_case(workdir):
+    deals = make_deals(500)
+    return lambda: [generate_explanation(*deal) for deal in deals], len(deals)
+
+def _fallback_explanation_case(workdir):
+    deals = make_deals(500)
+    return lambda: [generate_fallback_explanation(*deal) for deal in deals], len(deals)
+
+def _term_sheet_pdf_case(workdir):
+    deals = make_deals(10)
+
+    def run():
+        for company, risk, terms in deals:
+            generate_term_sheet_pdf(
+                company["company_name"], company["industry"], company["loan_amount"], company["purpose"], risk, terms
+            )
+
+    return run, len(deals)
+
+def _portfolio_report_case(workdir):
+    deals = make_deals(20)
+    path = os.path.join(workdir, "credit_book.pdf")
+    return lambda: generate_portfolio_report_pdf(deals, path, explain=generate_explanation), len(deals)
+
+def _audit_log_load_case(workdir):
+    path = os.path.join(workdir, "audit_log.json")
+    with open(path, "w") as f:
+        json.dump(make_audit_log(20_000), f, indent=2)
+    return lambda: load_audit_log(path), 1
+
+def _audit_log_filter_case(workdir):
+    audit_log = make_audit_log(20_000)
+    now = datetime(2024, 6, 30, 12, 0, 0)
+    filters = [
+        {},
+        {"user": "analyst"},
+        {"action": "Risk Analysis", "date_filter": "Last 30 Days"},
+        {"user": "manager", "date_filter": "Last 7 Days", "newest_first": False},
+        {"date_filter": "Today"}
+    ]
+    return lambda: [filter_audit_log(audit_log, now=now, **kwargs) for kwargs in filters], len(filters)
+
+CASES = {
+    "risk_score": _risk_score_case,
+    "loan_terms": _loan_terms_case,
+    "financial_ratios": _ratios_case,
+    "ratio_panel": _ratio_panel_case,
+    "amortization_schedule": _amortization_case,
+    "structure_optimizer": _structure_optimizer_case,
+    "explanation": _explanation_case,
+    "fallback_explanation": _fallback_explanation_case,
+    "term_sheet_pdf": _term_sheet_pdf_case,
+    "portfolio_report_pdf": _portfolio_report_case,
+    "audit_log_load": _audit_log_load_case,
+    "audit_log_filter": _audit_log_filter_case
+}
+
+def run_case(name, repeat, workdir, min_sample=0.2):
+    """Fastest seconds per call over repeat samples of at least min_sample seconds each"""
+    fn, calls = CASES[name](workdir)
+    loops = max(1, int(min_sample / _timed(fn, 1)) + 1)  # the first run also warms imports and caches
+    best = min(_timed(fn, loops) for _ in range(repeat))
+    return best / (loops * calls)
+
+def _timed(fn, loops):
+    # Like timeit, keep the garbage collector out of the measurement
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+def load_baselines(path=BASELINES_PATH):
+    """Stored baselines, or an empty set if none have been recorded"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"cases": {}}
+
+def save_baselines(results, path=BASELINES_PATH):
+    """Record results as the new baselines, with the machine they were measured on"""
+    baselines = load_baselines(path)
+    baselines["machine"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+    baselines["recorded"] = datetime.now().isoformat(timespec="seconds")
+    baselines["cases"].update({name: {"seconds_per_call": seconds} for name, seconds in results.items()})
+    with open(path, "w") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def compare(results, baselines, tolerance, min_delta=DEFAULT_MIN_DELTA_US / 1e6):
+    """Per-case report lines and the names of cases slower than baseline * (1 + tolerance) and baseline + min_delta seconds"""
+    lines = []
+    regressions = []
+    for name, seconds in results.items():
+        baseline = baselines["cases"].get(name, {}).get("seconds_per_call")
+        if baseline is None:
+            lines.append(f"{name:<22} {seconds * 1e6:>12.2f} us   (no baseline)")
+            continue
+        change = seconds / baseline - 1
+        regressed = change > tolerance and seconds - baseline > min_delta
+        if regressed:
+            regressions.append(name)
+        lines.append(
+            f"{name:<22} {seconds * 1e6:>12.2f} us   baseline {baseline * 1e6:>12.2f} us   "
+            f"{change:>+7.1%}{'   REGRESSION' if regressed else ''}"
+        )
+    return lines, regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the AURA benchmark suite against stored baselines")
+    parser.add_argument("--only", nargs="+", choices=sorted(CASES), help="Run only these cases")
+    parser.add_argument("--repeat", type=int, default=MIN_REPEAT, help=f"Samples per case (at least {MIN_REPEAT})")
+    parser.add_argument("--tolerance", type=float, default=float(os.getenv("AURA_BENCH_TOLERANCE", DEFAULT_TOLERANCE)),
+                        help="Allowed slowdown as a fraction of baseline (default 0.25, or AURA_BENCH_TOLERANCE)")
+    parser.add_argument("--min-delta-us", type=float, default=float(os.getenv("AURA_BENCH_MIN_DELTA_US", DEFAULT_MIN_DELTA_US)),
+                        help="Ignore slowdowns smaller than this many microseconds (default 5, or AURA_BENCH_MIN_DELTA_US)")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--update-baselines", action="store_true", help="Store this run as the new baselines")
+    args = parser.parse_args()
+    if args.repeat < MIN_REPEAT:
+        parser.error(f"--repeat must be at least {MIN_REPEAT} for a stable timing")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in args.only or CASES:
+            results[name] = run_case(name, args.repeat, workdir)
+
+    assert "streamlit" not in sys.modules, "benchmark suite must run without Streamlit"
+
+    if args.update_baselines:
+        save_baselines(results, args.baselines)
+        print(f"Baselines for {len(results)} cases written to {args.baselines}")
+        return
+
+    lines, regressions = compare(results, load_baselines(args.baselines), args.tolerance, args.min_delta_us / 1e6)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+    print(f"All cases within {args.tolerance:.0%} of baseline")
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,10 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import json
 import os
+from services.scoring_cache import scoring_cache_stats
+from services.llm_cache import llm_cache_stats
+from services.pdf_cache import pdf_cache_stats
+from services.covenant_monitor import DEFAULT_STATE_PATH as COVENANT_STATE_PATH, load_covenant_monitor
 
 if not st.session_state.get("logged_in"):
     st.warning("Please login first")
@@ -70,6 +74,11 @@ def generate_demo_data():
     
     return demo_audit_log, demo_approvals
 
+@st.cache_resource
+def get_covenant_monitor(state_mtime):
+    """Covenant monitor with its breach index, reloaded only when the state file changes"""
+    return load_covenant_monitor(COVENANT_STATE_PATH)
+
 # Load or generate data
 try:
     with open("data/audit_log.json", "r") as f:
@@ -273,6 +282,35 @@ with col_port2:
 
 st.divider()
 
+# Covenant Compliance
+st.subheader("🛡️ Covenant Compliance")
+
+covenant_monitor = get_covenant_monitor(os.path.getmtime(COVENANT_STATE_PATH) if os.path.exists(COVENANT_STATE_PATH) else None)
+breach_summary = covenant_monitor.breach_summary()
+
+if breach_summary["monitored"]:
+    col_cov1, col_cov2, col_cov3 = st.columns(3)
+    
+    with col_cov1:
+        st.metric("Borrowers Monitored", breach_summary["monitored"])
+    
+    with col_cov2:
+        st.metric("In Breach", breach_summary["in_breach"])
+    
+    with col_cov3:
+        breach_rate = breach_summary["in_breach"] / breach_summary["monitored"] * 100
+        st.metric("Breach Rate", f"{breach_rate:.1f}%")
+    
+    if breach_summary["by_covenant"]:
+        covenant_labels = {"dscr": "DSCR", "leverage_ratio": "Debt/EBITDA", "interest_coverage": "Interest Coverage"}
+        st.caption(" • ".join(
+            f"{covenant_labels.get(ratio, ratio)}: {count} in breach" for ratio, count in breach_summary["by_covenant"].items()
+        ))
+else:
+    st.info("📭 No covenant tests yet. Run `python -m services.covenant_monitor <financials.json>` after quarterly financials arrive.")
+
+st.divider()
+
 # Recent Activity Feed
 st.subheader("🕐 Recent Activity")
 
@@ -335,5 +373,25 @@ with col_qa3:
     if st.button("🔄 View Approvals", use_container_width=True):
         st.switch_page("pages/7_🔄_Approval_Workflow.py")
 
+# Scoring cache health (admins only)
+user_role = st.session_state.get("user_role") or st.session_state.get("role") or "analyst"
+
+if str(user_role).strip().lower() == "admin":
+    with st.expander("⚙️ Scoring Cache", expanded=False):
+        cache_stats = scoring_cache_stats()
+        col_cache1, col_cache2 = st.columns(2)
+        
+        for column, (label, stats) in zip([col_cache1, col_cache2], [("Risk Scores", cache_stats["risk_score"]), ("Loan Terms", cache_stats["loan_terms"])]):
+            with column:
+                st.metric(f"{label} Hit Rate", f"{stats['hit_rate'] * 100:.0f}%")
+                st.caption(f"{stats['hits']} hits • {stats['misses']} misses • {stats['size']}/{stats['maxsize']} entries • rulebook {stats['rulebook_version']}")
+        
+        pdf_stats = pdf_cache_stats()
+        st.caption(f"Term sheet PDFs: {pdf_stats['hit_rate'] * 100:.0f}% hit rate • {pdf_stats['hits']} memory / {pdf_stats['disk_hits']} disk hits • {pdf_stats['misses']} misses • {pdf_stats['size']} documents ({pdf_stats['memory_bytes'] / 1024:,.0f} KB)")
+        
+        llm_stats = llm_cache_stats()
+        if llm_stats:
+            st.caption(f"AI explanations: {llm_stats['hit_rate'] * 100:.0f}% hit rate • {llm_stats['hits']} hits • {llm_stats['misses']} misses ({llm_stats['expired']} expired) • {llm_stats['entries']} responses ({llm_stats['bytes'] / 1024:,.0f} KB) • {llm_stats['evictions']} evicted")
+
 st.divider()
 st.caption("📊 Real-time Dashboard - AURA Professional")
@@ -1,7 +1,13 @@
 import streamlit as st
-from services.risk_engine import calculate_risk_score
+from services.scoring_cache import cached_calculate_risk_score
+from services.risk_factors import format_risk_factors
 from services.llm_integration import generate_llm_explanation
+from services.loan_solver import solve_max_loan
+from services.rulebook import get_active_rulebook
+from services.sensitivity import risk_sensitivity_grid
+from utils.charts import risk_band_heatmap
 from datetime import datetime
+import numpy as np
 
 if not st.session_state.get("logged_in"):
     st.warning("Please login first")
@@ -11,6 +17,16 @@ if not st.session_state.get("logged_in"):
 if "audit_log" not in st.session_state:
     st.session_state.audit_log = []
 
+INDUSTRIES = ["Manufacturing", "IT Services", "Healthcare", "Energy", "Retail", "Construction", "Hospitality", "Finance", "Real Estate"]
+PURPOSES = ["Working Capital", "Equipment Purchase", "Expansion", "Acquisition", "Refinancing", "Real Estate"]
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_sensitivity_grid(revenue_max, loan_max, steps, industry, purpose, rulebook_version):
+    """Cached revenue x loan grid; rulebook_version is only part of the cache key"""
+    revenues = np.linspace(revenue_max / steps, revenue_max, steps)
+    loan_amounts = np.linspace(loan_max / steps, loan_max, steps)
+    return risk_sensitivity_grid(revenues, loan_amounts, [industry], [purpose])
+
 st.title("🔍 Risk Analysis")
 st.markdown("### Comprehensive Credit Risk Assessment")
 
@@ -23,19 +39,13 @@ with col1:
     
     company_name = st.text_input("Company Name *", placeholder="e.g., ABC Manufacturing Corp")
     
-    industry = st.selectbox(
-        "Industry *",
-        ["Manufacturing", "IT Services", "Healthcare", "Energy", "Retail", "Construction", "Hospitality", "Finance", "Real Estate"]
-    )
+    industry = st.selectbox("Industry *", INDUSTRIES)
     
     revenue = st.number_input("Annual Revenue ($M) *", min_value=0.0, value=25.0, step=1.0)
     
     loan_amount = st.number_input("Loan Amount ($M) *", min_value=0.0, value=5.0, step=0.5)
     
-    purpose = st.selectbox(
-        "Loan Purpose *",
-        ["Working Capital", "Equipment Purchase", "Expansion", "Acquisition", "Refinancing", "Real Estate"]
-    )
+    purpose = st.selectbox("Loan Purpose *", PURPOSES)
     
     years_in_business = st.number_input("Years in Business", min_value=0, value=5, step=1)
     
@@ -57,7 +67,7 @@ with col1:
                 "employees": employees
             }
             
-            risk_result = calculate_risk_score(company_data)
+            risk_result = cached_calculate_risk_score(company_data)
             
             st.session_state.risk_analysis = risk_result
             st.session_state.company_data = company_data
@@ -98,13 +108,24 @@ with col2:
         st.divider()
         
         st.markdown("**Key Risk Factors:**")
-        for factor in risk["risk_factors"]:
+        for factor in format_risk_factors(risk):
             st.markdown(f"- {factor}")
         
         st.divider()
         
         st.info(f"**Recommendation:** {risk['recommendation']}")
         
+        # Borrowing capacity per band for the analyzed company
+        if st.session_state.get("company_data", {}).get("revenue"):
+            capacity = solve_max_loan(st.session_state.company_data)["max_loan"]
+            capacity_text = []
+            for level, amount in capacity.items():
+                if amount is None or amount == float("inf"):
+                    continue
+                capacity_text.append(f"{level} up to ${amount:,.2f}M")
+            if capacity_text:
+                st.caption("💡 Borrowing capacity: " + " • ".join(capacity_text))
+        
         # Action buttons
         col_btn1, col_btn2 = st.columns(2)
         
@@ -119,6 +140,53 @@ with col2:
     else:
         st.info("👈 Enter company details and click **Analyze Risk**")
 
+# WHAT-IF SENSITIVITY
+if st.session_state.get("risk_analysis") and st.session_state.get("company_data"):
+    st.divider()
+    
+    with st.expander("📐 What-if Sensitivity", expanded=False):
+        current = st.session_state.company_data
+        current_revenue = float(current.get("revenue") or 0)
+        current_loan = float(current.get("loan_amount") or 0)
+        
+        col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+        
+        with col_s1:
+            revenue_max = st.number_input("Max Revenue ($M)", min_value=1.0, value=max(100.0, current_revenue * 2), step=10.0)
+        
+        with col_s2:
+            loan_max = st.number_input("Max Loan ($M)", min_value=0.5, value=max(50.0, current_loan * 2), step=5.0)
+        
+        with col_s3:
+            what_if_industry = st.selectbox(
+                "Industry",
+                INDUSTRIES,
+                index=INDUSTRIES.index(current["industry"]) if current.get("industry") in INDUSTRIES else 0
+            )
+        
+        with col_s4:
+            what_if_purpose = st.selectbox(
+                "Purpose",
+                PURPOSES,
+                index=PURPOSES.index(current["purpose"]) if current.get("purpose") in PURPOSES else 0
+            )
+        
+        steps = st.select_slider("Grid Resolution", options=[50, 100, 200], value=200)
+        
+        grid = compute_sensitivity_grid(revenue_max, loan_max, steps, what_if_industry, what_if_purpose, get_active_rulebook().version)
+        
+        fig = risk_band_heatmap(
+            grid["risk_score"][0, 0],
+            grid["band"][0, 0],
+            grid["revenues"],
+            grid["loan_amounts"],
+            grid["levels"],
+            current=(current_revenue, current_loan)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"{steps * steps:,} scenarios scored in one pass • ✕ marks the current application")
+
 # AI EXPLANATION SECTION - NEW FEATURE!
 st.divider()
 
@@ -1,7 +1,10 @@
 import streamlit as st
-from services.term_generator import generate_loan_terms
+import pandas as pd
+from services.scoring_cache import cached_generate_loan_terms
 from services.explanation_engine import generate_explanation
-from utils.pdf_generator import generate_term_sheet_pdf
+from services.pricing import price_loan
+from services.structure_optimizer import optimize_loan_structure
+from services.pdf_cache import cached_term_sheet_pdf
 from datetime import datetime
 import json
 
@@ -78,14 +81,16 @@ with col1:
     
     if st.button("📄 Generate Term Sheet", type="primary", use_container_width=True):
         # Generate terms
-        loan_terms = generate_loan_terms(company_data, risk_analysis)
+        loan_terms = cached_generate_loan_terms(company_data, risk_analysis)
         
         # Apply custom overrides
         if custom_tenor != "Auto (AI Suggested)":
             loan_terms["tenor"] = custom_tenor
+            loan_terms["tenor_years"] = int(custom_tenor.split()[0])
         
         if custom_margin != "Auto (AI Suggested)":
             loan_terms["interest_margin"] = custom_margin
+            loan_terms["margin_bps"] = int(custom_margin.split()[2])
         
         # Generate explanation
         explanation = generate_explanation(company_data, risk_analysis, loan_terms)
@@ -145,6 +150,21 @@ with col2:
         for covenant in terms["covenants"]:
             st.markdown(f"- {covenant}")
         
+        # Indicative pricing off the SOFR forward curve
+        if company_data.get("loan_amount"):
+            pricing = price_loan(company_data, terms, risk_analysis)
+            
+            col_price1, col_price2, col_price3 = st.columns(3)
+            
+            with col_price1:
+                st.metric("All-in Coupon", f"{pricing['all_in_rate']:.2f}%")
+            
+            with col_price2:
+                st.metric("Yield to Maturity", f"{pricing['ytm']:.2f}%")
+            
+            with col_price3:
+                st.metric("Risk-adjusted Return", f"{pricing['risk_adjusted_return'] * 100:.1f}%", help="Spread over funding less expected loss, per unit of capital")
+        
         st.divider()
         
         # AI Explanation
@@ -199,7 +219,7 @@ Recommendation: {risk_analysis['recommendation']}
         
         with col_btn2:
             # PDF version
-            pdf_buffer = generate_term_sheet_pdf(
+            pdf_buffer = cached_term_sheet_pdf(
                 company_name=company_data.get('company_name'),
                 industry=company_data.get('industry'),
                 loan_amount=company_data.get('loan_amount'),
@@ -236,5 +256,44 @@ Recommendation: {risk_analysis['recommendation']}
     else:
         st.info("👈 Click **Generate Term Sheet** to proceed")
 
+# STRUCTURE OPTIMIZER
+st.divider()
+
+with st.expander("🎯 Structure Optimizer", expanded=False):
+    financial_data = st.session_state.get("financial_data")
+    
+    if not financial_data or not company_data.get("loan_amount"):
+        st.info("📈 Enter the borrower's financials on the **Financial Ratios** page to search loan structures")
+    else:
+        col_opt1, col_opt2, col_opt3 = st.columns(3)
+        
+        with col_opt1:
+            min_dscr = st.number_input("Minimum DSCR (x)", min_value=0.5, value=1.2, step=0.05)
+        
+        with col_opt2:
+            max_leverage = st.number_input("Maximum Debt/EBITDA (x)", min_value=1.0, value=5.0, step=0.25)
+        
+        with col_opt3:
+            target_return = st.number_input("Target Risk-adjusted Return (%)", min_value=0.0, value=12.0, step=1.0)
+        
+        optimized = optimize_loan_structure(
+            company_data["loan_amount"],
+            financial_data,
+            risk_analysis["risk_level"],
+            min_dscr=min_dscr,
+            max_leverage=max_leverage,
+            target_return=target_return / 100
+        )
+        
+        if optimized["pareto"]:
+            pareto_df = pd.DataFrame(optimized["pareto"])
+            pareto_df["risk_adjusted_return"] = pareto_df["risk_adjusted_return"] * 100
+            pareto_df.columns = ["Tenor (years)", "Margin (bps)", "Amortization", "Min DSCR (x)", "YTM (%)", "Risk-adj. Return (%)"]
+            st.dataframe(pareto_df.round(2), use_container_width=True, hide_index=True)
+        else:
+            st.warning(f"⚠️ No structure meets the constraints (Debt/EBITDA at drawdown: {optimized['leverage']:.2f}x)")
+        
+        st.caption(f"{optimized['n_feasible']:,} of {optimized['n_candidates']:,} structures feasible • Pareto-best trade-offs of lender return vs. borrower coverage shown")
+
 st.divider()
 st.caption("📄 Term Sheet Generator - AURA Professional")
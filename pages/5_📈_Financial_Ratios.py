@@ -1,5 +1,9 @@
 import streamlit as st
 from services.financial_calculator import calculate_all_ratios
+from services.covenant_projection import covenant_thresholds, project_covenant_headroom
+from services.pricing import tenor_years
+from services.amortization import STRUCTURES
+from utils.charts import ratio_projection_fan
 import plotly.graph_objects as go
 
 if not st.session_state.get("logged_in"):
@@ -39,6 +43,7 @@ with col1:
         
         ratios = calculate_all_ratios(financial_data)
         st.session_state.financial_ratios = ratios
+        st.session_state.financial_data = financial_data
         st.rerun()
 
 with col2:
@@ -115,5 +120,83 @@ with col2:
     else:
         st.info("👈 Enter financial data and click **Calculate Ratios**")
 
+# COVENANT HEADROOM PROJECTION
+if st.session_state.get("financial_data"):
+    st.divider()
+    st.subheader("🔮 Covenant Headroom Projection")
+    
+    financial_data = st.session_state.financial_data
+    company_data = st.session_state.get("company_data", {})
+    loan_terms = st.session_state.get("loan_terms")
+    
+    covenants = loan_terms["covenants"] if loan_terms else ["Debt Service Coverage Ratio (DSCR) > 1.2x"]
+    thresholds = covenant_thresholds(covenants)
+    
+    col_p1, col_p2, col_p3, col_p4 = st.columns(4)
+    
+    with col_p1:
+        projection_loan = st.number_input("New Loan ($M)", min_value=0.0, value=float(company_data.get("loan_amount") or 10.0), step=1.0)
+    
+    with col_p2:
+        all_in_rate = st.number_input("All-in Rate (%)", min_value=0.0, value=8.0, step=0.25)
+    
+    with col_p3:
+        projection_tenor = st.number_input("Tenor (years)", min_value=1.0, value=tenor_years(loan_terms) if loan_terms else 5.0, step=1.0)
+    
+    with col_p4:
+        structure = st.selectbox("Amortization", list(STRUCTURES), index=list(STRUCTURES).index("quarterly"))
+    
+    col_p5, col_p6, col_p7 = st.columns(3)
+    
+    with col_p5:
+        annual_growth = st.slider("EBITDA Growth (% p.a.)", min_value=-20.0, max_value=20.0, value=3.0, step=0.5)
+    
+    with col_p6:
+        annual_volatility = st.slider("EBITDA Volatility (% p.a.)", min_value=0.0, max_value=50.0, value=10.0, step=1.0)
+    
+    with col_p7:
+        n_scenarios = st.select_slider("Scenarios", options=[100, 250, 500, 1000], value=500)
+    
+    projection = project_covenant_headroom(
+        financial_data,
+        projection_loan,
+        all_in_rate,
+        projection_tenor,
+        thresholds,
+        structure=structure,
+        n_scenarios=n_scenarios,
+        annual_growth=annual_growth / 100,
+        annual_volatility=annual_volatility / 100
+    )
+    summary = projection["summary"]
+    
+    col_m1, col_m2, col_m3 = st.columns(3)
+    
+    with col_m1:
+        st.metric("Breach Probability over Tenor", f"{summary['breach_probability']:.0%}")
+    
+    with col_m2:
+        if summary["median_first_breach_period"] is not None:
+            st.metric("Median First Breach", f"{summary['median_first_breach_period'] / projection['periods_per_year']:.2f} yrs")
+        else:
+            st.metric("Median First Breach", "None")
+    
+    with col_m3:
+        if "dscr" in summary["worst_headroom"]:
+            st.metric("DSCR Headroom (5th pct. low)", f"{summary['worst_headroom']['dscr']:+.0%}")
+    
+    if "dscr" in thresholds:
+        fig = ratio_projection_fan(
+            projection["period"],
+            projection["ratios"]["dscr"],
+            thresholds["dscr"][1],
+            "DSCR",
+            projection["periods_per_year"]
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    tested = [covenant for covenant in covenants if covenant_thresholds([covenant])]
+    st.caption(f"{n_scenarios} EBITDA paths • tested against: {', '.join(tested)}")
+
 st.divider()
 st.caption("📊 Financial Analysis Module - AURA")
\ No newline at end of file
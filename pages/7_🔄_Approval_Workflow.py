@@ -1,5 +1,7 @@
 import streamlit as st
 from datetime import datetime
+from services.llm_batch import generate_llm_explanations
+from services.term_generator import generate_loan_terms
 
 if not st.session_state.get("logged_in"):
     st.warning("Please login first")
@@ -64,6 +66,23 @@ st.divider()
 # Display pending approvals
 st.subheader("📋 Pending Approvals")
 
+# AI explanations for the whole queue, requested concurrently
+explainable = [
+    a for a in st.session_state.pending_approvals
+    if a["status"] == "Pending" and a.get("company_data") and a.get("risk_analysis")
+]
+
+if explainable:
+    if st.button(f"🤖 Generate AI Explanations ({len(explainable)} pending)"):
+        with st.spinner("Generating AI explanations..."):
+            deals = [
+                (a["company_data"], a["risk_analysis"], generate_loan_terms(a["company_data"], a["risk_analysis"]))
+                for a in explainable
+            ]
+            for approval, explanation in zip(explainable, generate_llm_explanations(deals)):
+                approval["ai_explanation"] = explanation
+        st.success(f"✅ Explanations ready for {len(explainable)} applications")
+
 if st.session_state.pending_approvals:
     for approval in st.session_state.pending_approvals:
         if approval["status"] == "Pending":
@@ -81,6 +100,10 @@ if st.session_state.pending_approvals:
                     if approval.get('notes'):
                         st.info(f"**Notes:** {approval['notes']}")
                 
+                if approval.get("ai_explanation"):
+                    st.markdown("**🤖 AI Explanation**")
+                    st.markdown(approval["ai_explanation"])
+                
                 st.divider()
                 
                 # FIX: Get user role with proper fallback and normalization
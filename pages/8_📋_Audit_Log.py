@@ -2,6 +2,7 @@ import streamlit as st
 import json
 from datetime import datetime
 import pandas as pd
+from utils.audit_log import load_audit_log, filter_audit_log
 
 if not st.session_state.get("logged_in"):
     st.warning("Please login first")
@@ -13,11 +14,7 @@ st.markdown("### System Activity & Compliance Tracking")
 st.divider()
 
 # Load audit log
-try:
-    with open("data/audit_log.json", "r") as f:
-        audit_log = json.load(f)
-except:
-    audit_log = []
+audit_log = load_audit_log()
 
 # Filters
 st.subheader("🔍 Filters")
@@ -51,36 +48,13 @@ with col4:
 st.divider()
 
 # Apply filters
-filtered_log = audit_log.copy()
-
-if filter_user != "All Users":
-    filtered_log = [log for log in filtered_log if log["user"] == filter_user]
-
-if filter_action != "All Actions":
-    filtered_log = [log for log in filtered_log if log["action"] == filter_action]
-
-# Date filtering
-if date_filter != "All Time":
-    from datetime import datetime, timedelta
-    now = datetime.now()
-    
-    if date_filter == "Today":
-        cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    elif date_filter == "Last 7 Days":
-        cutoff = now - timedelta(days=7)
-    elif date_filter == "Last 30 Days":
-        cutoff = now - timedelta(days=30)
-    
-    filtered_log = [
-        log for log in filtered_log 
-        if datetime.fromisoformat(log["timestamp"]) >= cutoff
-    ]
-
-# Sort
-if sort_order == "Newest First":
-    filtered_log = sorted(filtered_log, key=lambda x: x["timestamp"], reverse=True)
-else:
-    filtered_log = sorted(filtered_log, key=lambda x: x["timestamp"])
+filtered_log = filter_audit_log(
+    audit_log,
+    user=None if filter_user == "All Users" else filter_user,
+    action=None if filter_action == "All Actions" else filter_action,
+    date_filter=date_filter,
+    newest_first=(sort_order == "Newest First")
+)
 
 # Display audit log
 st.subheader(f"📊 Audit Entries ({len(filtered_log)} records)")
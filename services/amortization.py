@@ -0,0 +1,126 @@
+"""
+Amortization schedules for one loan or a whole portfolio at once
+
+Schedules are (n_loans, n_periods) arrays of interest, principal, payment
+and closing balance on a shared payment grid; loans with fewer periods are
+zero-padded after maturity. Rates are annual percentages and the level
+monthly payment matches utils.helpers.calculate_payment under 30/360.
+
+Structures:
+  monthly    level (annuity) monthly payments
+  quarterly  equal quarterly principal payments plus interest on the balance
+  bullet     quarterly interest only, all principal at maturity
+"""
+
+from datetime import date
+
+import numpy as np
+
+STRUCTURES = {
+    # name: (months per period, principal profile)
+    "monthly": (1, "annuity"),
+    "quarterly": (3, "equal_principal"),
+    "bullet": (3, "bullet")
+}
+
+# Day-count basis in days per year; 30/360 treats every month as 1/12 of a year
+DAY_COUNTS = {"30/360": None, "ACT/360": 360, "ACT/365": 365}
+
+# Term sheet amortization wording -> schedule structure
+AMORTIZATION_STRUCTURES = {
+    "Quarterly principal payments": "quarterly"
+}
+
+def payment_dates(start_date, months_per_period, n_periods):
+    """Start date plus each period end, keeping the start day of month (clipped to month end)"""
+    start = np.datetime64(start_date, "D")
+    months = np.datetime64(start_date, "M") + np.arange(n_periods + 1) * months_per_period
+    month_start = months.astype("datetime64[D]")
+    month_length = ((months + 1).astype("datetime64[D]") - month_start).astype(int)
+    day = (start - np.datetime64(start_date, "M").astype("datetime64[D]")).astype(int)
+    return month_start + np.minimum(day, month_length - 1)
+
+def accrual_factors(day_count, months_per_period, n_periods, start_date=None):
+    """Year fraction of each period under the day-count convention"""
+    if day_count not in DAY_COUNTS:
+        raise ValueError(f"Unknown day count '{day_count}' (expected one of {', '.join(DAY_COUNTS)})")
+
+    basis = DAY_COUNTS[day_count]
+    if basis is None:
+        return np.full(n_periods, months_per_period / 12)
+
+    dates = payment_dates(start_date or date.today(), months_per_period, n_periods)
+    return np.diff(dates).astype(int) / basis
+
+def amortization_schedule(principal, annual_rate, years, structure="monthly", day_count="30/360", start_date=None):
+    """
+    Period-by-period schedule for one or many loans
+
+    principal, annual_rate (percent) and years are scalars or 1-D arrays of the
+    same length. All loans share the structure, day count and start date
+    (needed for the ACT conventions; defaults to today). Returns a dict with
+    1-D "period", "accrual_factor" (and "payment_date" for ACT day counts),
+    2-D "interest", "principal", "payment" and "balance", and "n_periods" per loan.
+    """
+
+    if structure not in STRUCTURES:
+        raise ValueError(f"Unknown structure '{structure}' (expected one of {', '.join(STRUCTURES)})")
+
+    months_per_period, profile = STRUCTURES[structure]
+    periods_per_year = 12 // months_per_period
+
+    principal, annual_rate, years = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(principal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(annual_rate, dtype=np.float64)),
+        np.atleast_1d(np.asarray(years, dtype=np.float64))
+    )
+    n_periods = np.maximum(np.rint(years * periods_per_year).astype(np.int64), 1)
+    max_periods = int(n_periods.max())
+
+    accrual = accrual_factors(day_count, months_per_period, max_periods, start_date)
+    period = np.arange(1, max_periods + 1)
+    active = period[None, :] <= n_periods[:, None]
+    last = period[None, :] == n_periods[:, None]
+    rate = annual_rate[:, None] / 100
+
+    if profile == "annuity":
+        # Level payment from the nominal periodic rate, as in calculate_payment
+        periodic = annual_rate / 100 / periods_per_year
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = (1 + periodic) ** n_periods
+            payment = np.where(periodic == 0, principal / n_periods, principal * periodic * growth / (growth - 1))
+
+        # Balance after k periods: B_k = G_k * (P - pmt * sum_{j<=k} 1 / G_j), G_k = prod (1 + r * a_j)
+        accumulation = np.cumprod(1 + rate * accrual[None, :], axis=1)
+        balance = accumulation * (principal[:, None] - payment[:, None] * np.cumsum(1 / accumulation, axis=1))
+        opening = np.hstack([principal[:, None], balance[:, :-1]])
+        interest = opening * rate * accrual[None, :]
+        principal_paid = np.where(last, opening, payment[:, None] - interest)
+
+    elif profile == "equal_principal":
+        installment = principal / n_periods
+        opening = principal[:, None] - installment[:, None] * (period[None, :] - 1)
+        interest = opening * rate * accrual[None, :]
+        principal_paid = np.broadcast_to(installment[:, None], opening.shape)
+
+    else:
+        opening = np.broadcast_to(principal[:, None], (len(principal), max_periods))
+        interest = opening * rate * accrual[None, :]
+        principal_paid = np.where(last, opening, 0.0)
+
+    interest = np.where(active, interest, 0.0)
+    principal_paid = np.where(active, principal_paid, 0.0)
+    balance = np.where(active, opening - principal_paid, 0.0)
+
+    schedule = {
+        "period": period,
+        "accrual_factor": accrual,
+        "interest": interest,
+        "principal": principal_paid,
+        "payment": interest + principal_paid,
+        "balance": balance,
+        "n_periods": n_periods
+    }
+    if DAY_COUNTS[day_count] is not None:
+        schedule["payment_date"] = payment_dates(start_date or date.today(), months_per_period, max_periods)[1:]
+    return schedule
@@ -0,0 +1,91 @@
+"""
+Reading and checking loan application files
+
+Shared by bulk scoring, batch term sheet generation and the stress test. CSV and JSONL files
+are read one row at a time; a JSONL line that is not a JSON object becomes
+an error row carrying its line number instead of stopping the run. Numeric
+fields are parsed, and values that are not finite numbers are left as
+submitted and reported as errors. Approved deals are read from the
+approval workflow's JSON records.
+"""
+
+import csv
+import json
+import math
+
+from utils.validators import validate_company_data
+
+NUMERIC_FIELDS = ["revenue", "loan_amount", "years_in_business", "employees"]
+# Set by read_applications on a line it could not turn into an application; reported as the row's error
+INPUT_ERROR = "input_error"
+DEFAULT_APPROVALS_PATH = "data/pending_approvals.json"
+
+def file_format(path, override=None):
+    """csv or jsonl, from the explicit option or the file extension"""
+    if override:
+        return override
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+def load_approved_applications(path=DEFAULT_APPROVALS_PATH, status="Approved"):
+    """company_data of every approval record with the given status"""
+    with open(path, "r") as f:
+        approvals = json.load(f)
+    return [approval["company_data"] for approval in approvals if approval.get("status") == status and approval.get("company_data")]
+
+def read_applications(path, input_format):
+    """Yield application dicts one at a time; a bad JSONL line yields an error row with its line number"""
+    with open(path, "r", newline="") as f:
+        if input_format == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    # Bare NaN/Infinity stay strings, so they are reported and written back as valid JSON
+                    row = json.loads(line, parse_constant=str)
+                except ValueError as e:
+                    yield {"line": line_number, INPUT_ERROR: f"line {line_number}: invalid JSON ({e})"}
+                    continue
+                if not isinstance(row, dict):
+                    yield {"line": line_number, INPUT_ERROR: f"line {line_number}: expected a JSON object, got {type(row).__name__}"}
+                    continue
+                yield row
+
+def normalize_application(row):
+    """
+    Convert numeric fields (CSV gives strings); returns (row, parse_errors)
+
+    A value that is not a finite number is left as submitted, so the output
+    shows what was sent, and reported in parse_errors.
+    """
+    if INPUT_ERROR in row:
+        return row, [row.pop(INPUT_ERROR)]
+
+    errors = []
+    for field in NUMERIC_FIELDS:
+        if field not in row:
+            continue
+        value = row[field]
+        if value is None or value == "":
+            row[field] = 0
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            errors.append(f"{field} must be a number (got '{value}')")
+            continue
+        # float() accepts "nan" and "inf", which would score as LOW RISK and write bare NaN to JSONL
+        if not math.isfinite(number):
+            errors.append(f"{field} must be a finite number (got '{value}')")
+            continue
+        row[field] = number
+    return row, errors
+
+def validate_application(row):
+    """normalize_application plus utils.validators.validate_company_data; returns (row, errors)"""
+    row, errors = normalize_application(row)
+    # The validators compare numbers, so rows with unparseable fields stop at the parse errors
+    if not errors:
+        errors = validate_company_data(row)
+    return row, errors
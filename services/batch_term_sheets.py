@@ -0,0 +1,261 @@
+"""
+Batch term sheet generation for a whole pipeline
+
+Each application is scored, structured (generate_loan_terms) and explained
+(generate_explanation) in the parent process, which is cheap; the PDFs are
+rendered by a process pool. Finished documents are written into one ZIP
+archive on disk in input order as they come back, and only a bounded number
+of PDFs are in flight at any time, so memory does not grow with the pipeline.
+
+With --credit-book the same deals go into one multi-page credit committee
+PDF (utils.pdf_generator.generate_portfolio_report_pdf) instead.
+
+Run from the project root (defaults to the approved deals in
+data/pending_approvals.json):
+    python -m services.batch_term_sheets
+    python -m services.batch_term_sheets applications.jsonl term_sheets.zip --workers 4
+    python -m services.batch_term_sheets data/pending_approvals.json credit_book.pdf --credit-book
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from services.application_input import (DEFAULT_APPROVALS_PATH, file_format, load_approved_applications, read_applications,
+                                        validate_application)
+from services.explanation_engine import generate_explanation
+from services.risk_engine import calculate_risk_score
+from services.term_generator import generate_loan_terms
+from utils.pdf_generator import PDF_PROFILES, generate_portfolio_report_pdf, generate_term_sheet_pdf
+
+# Archived and emailed in bulk, so the smallest output profile
+ARCHIVE_PROFILE = "compact"
+MANIFEST_FIELDS = ["file", "company_name", "loan_amount", "risk_score", "risk_level", "tenor", "interest_margin", "errors"]
+
+def json_records_kind(records):
+    """
+    "approvals" or "applications" for the records of a JSON file, checking every record
+    Approval records carry a status (Dashboard demo records have no company_data and are
+    skipped by load_approved_applications); raises ValueError on mixed or unknown shapes.
+    """
+
+    if not isinstance(records, list):
+        raise ValueError(f"expected a JSON list of records, got {type(records).__name__}")
+
+    kinds = set()
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"record {index}: expected a JSON object, got {type(record).__name__}")
+        if "status" in record:
+            kinds.add("approvals")
+        elif record.keys() & {"company_name", "revenue", "loan_amount"}:
+            kinds.add("applications")
+        else:
+            raise ValueError(f"record {index}: neither an approval (no status) nor an application (no company_name, revenue or loan_amount)")
+        if len(kinds) > 1:
+            raise ValueError(f"record {index}: file mixes approval records and raw applications")
+
+    return kinds.pop() if kinds else "applications"
+
+def _load_applications(path):
+    """Applications from an approvals JSON file, or a CSV/JSONL application file like bulk scoring takes"""
+    if path.lower().endswith(".json"):
+        with open(path, "r") as f:
+            records = json.load(f)
+        if json_records_kind(records) == "approvals":
+            applications = load_approved_applications(path)
+            if not applications:
+                raise ValueError("no Approved records with company_data to generate from")
+            return applications
+        return records
+    return read_applications(path, file_format(path))
+
+def _render_pdf(company_data, risk_analysis, loan_terms, profile):
+    """Worker: one term sheet PDF as bytes (bytes pickle back cheaply, a BytesIO does not)"""
+    return generate_term_sheet_pdf(
+        company_data["company_name"],
+        company_data["industry"],
+        company_data["loan_amount"],
+        company_data["purpose"],
+        risk_analysis,
+        loan_terms,
+        profile
+    ).getvalue()
+
+def _render_inline(fn, *args):
+    """workers=0: run in this process (debugging, or where subprocesses are unavailable) as a finished future"""
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+def _safe_name(index, company_name):
+    """Archive-safe, unique stem for one deal"""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", str(company_name)).strip("_")[:60] or "deal"
+    return f"{index + 1:05d}_{slug}"
+
+def _validate(company_data):
+    """Normalized copy of an application and its validation errors"""
+    company_data, errors = validate_application(dict(company_data))
+    company_data.setdefault("purpose", "")
+    return company_data, errors
+
+def prepare_deal(company_data):
+    """Score, structure and explain one application; returns (risk_analysis, loan_terms, explanation)"""
+    risk_analysis = calculate_risk_score(company_data)
+    loan_terms = generate_loan_terms(company_data, risk_analysis)
+    return risk_analysis, loan_terms, generate_explanation(company_data, risk_analysis, loan_terms)
+
+def generate_term_sheet_batch(applications, output_path, workers=None, max_in_flight=None, include_explanations=True,
+                              profile=ARCHIVE_PROFILE):
+    """
+    Term sheets for every application, written to one ZIP archive at output_path
+
+    applications is any iterable of company_data dicts (it is consumed
+    lazily). Invalid applications are listed in the archive's manifest.csv
+    with their validation errors instead of stopping the batch. workers is the
+    process pool size (default: CPU count; 0 renders in this process) and
+    max_in_flight caps PDFs rendered but not yet written (default 2 per
+    worker). profile is a utils.pdf_generator.PDF_PROFILES name. Returns a
+    report with counts and timing.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * max(workers, 1)
+
+    report = {"applications": 0, "generated": 0, "invalid": 0, "bytes": 0}
+    start = time.perf_counter()
+
+    manifest = io.StringIO()
+    manifest_writer = csv.DictWriter(manifest, fieldnames=MANIFEST_FIELDS)
+    manifest_writer.writeheader()
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers else None
+    submit = pool.submit if pool else _render_inline
+    pending = deque()
+
+    def write_oldest(archive):
+        name, future = pending.popleft()
+        pdf_bytes = future.result()
+        archive.writestr(name, pdf_bytes)
+        report["bytes"] += len(pdf_bytes)
+        report["generated"] += 1
+
+    try:
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for index, company_data in enumerate(applications):
+                report["applications"] += 1
+                company_data, errors = _validate(company_data)
+                row = {"company_name": company_data.get("company_name"), "loan_amount": company_data.get("loan_amount")}
+
+                if errors:
+                    report["invalid"] += 1
+                    row["errors"] = "; ".join(errors)
+                    manifest_writer.writerow(row)
+                    continue
+
+                risk_analysis, loan_terms, explanation = prepare_deal(company_data)
+                stem = _safe_name(index, company_data["company_name"])
+
+                pending.append((f"{stem}.pdf", submit(_render_pdf, company_data, risk_analysis, loan_terms, profile)))
+                if include_explanations:
+                    archive.writestr(f"{stem}_explanation.md", explanation)
+
+                row.update({
+                    "file": f"{stem}.pdf",
+                    "risk_score": risk_analysis["risk_score"],
+                    "risk_level": risk_analysis["risk_level"],
+                    "tenor": loan_terms["tenor"],
+                    "interest_margin": loan_terms["interest_margin"]
+                })
+                manifest_writer.writerow(row)
+
+                # Backpressure: write finished PDFs before queueing more
+                while len(pending) >= max_in_flight:
+                    write_oldest(archive)
+
+            while pending:
+                write_oldest(archive)
+
+            archive.writestr("manifest.csv", manifest.getvalue())
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    report["seconds"] = time.perf_counter() - start
+    report["per_second"] = report["generated"] / report["seconds"] if report["seconds"] else 0.0
+    return report
+
+def generate_credit_book(applications, output_path, profile=ARCHIVE_PROFILE):
+    """
+    One portfolio credit report PDF at output_path for every valid application
+
+    Deals are scored and structured up front (the summary page needs them);
+    explanations are generated as the report reaches each deal. Returns a
+    report with counts, page count and timing.
+    """
+
+    start = time.perf_counter()
+    deals = []
+    invalid = 0
+    for company_data in applications:
+        company_data, errors = _validate(company_data)
+        if errors:
+            invalid += 1
+            continue
+        risk_analysis = calculate_risk_score(company_data)
+        deals.append((company_data, risk_analysis, generate_loan_terms(company_data, risk_analysis)))
+
+    pages = generate_portfolio_report_pdf(deals, output_path, explain=generate_explanation, profile=profile)
+
+    return {"deals": len(deals), "invalid": invalid, "pages": pages, "seconds": time.perf_counter() - start}
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate term sheet PDFs for a pipeline into one ZIP archive")
+    parser.add_argument("input", nargs="?", default=DEFAULT_APPROVALS_PATH,
+                        help="approvals JSON (approved deals are used), or a CSV/JSONL application file")
+    parser.add_argument("output", nargs="?", help="ZIP archive (default term_sheets.zip), or the PDF with --credit-book")
+    parser.add_argument("--workers", type=int, help="process pool size (default: CPU count, 0 = no pool)")
+    parser.add_argument("--no-explanations", action="store_true", help="leave the explanation markdown out")
+    parser.add_argument("--credit-book", action="store_true", help="write one multi-page credit committee PDF instead")
+    parser.add_argument("--profile", choices=list(PDF_PROFILES), default=ARCHIVE_PROFILE, help="PDF output profile")
+    args = parser.parse_args()
+
+    try:
+        applications = _load_applications(args.input)
+    except ValueError as e:
+        parser.error(f"{args.input}: {e}")
+
+    if args.credit_book:
+        output = args.output or "credit_book.pdf"
+        report = generate_credit_book(applications, output, args.profile)
+        print(
+            f"Wrote a {report['pages']:,}-page credit book for {report['deals']:,} deals "
+            f"({report['invalid']:,} invalid applications skipped) in {report['seconds']:.2f}s -> {output}",
+            file=sys.stderr
+        )
+        return
+
+    output = args.output or "term_sheets.zip"
+    report = generate_term_sheet_batch(
+        applications, output, args.workers,
+        include_explanations=not args.no_explanations, profile=args.profile
+    )
+
+    print(
+        f"Generated {report['generated']:,} term sheets from {report['applications']:,} applications "
+        f"({report['invalid']:,} invalid) in {report['seconds']:.2f}s - {report['per_second']:,.1f}/s "
+        f"-> {output}",
+        file=sys.stderr
+    )
+
+if __name__ == "__main__":
+    main()
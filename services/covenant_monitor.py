@@ -0,0 +1,189 @@
+"""
+Covenant compliance monitoring for the approved loan book
+
+Keeps the latest ratio state per borrower and covenant. When a new batch of
+financials arrives only borrowers whose inputs (financials or covenants)
+changed are re-tested; those are evaluated together with the panel ratio
+engine. A breach index (covenant -> borrowers in breach, plus the set of all
+borrowers in breach) is maintained on every update so the Dashboard can
+answer "is this borrower in breach" and "how many breaches" in O(1).
+
+Run from the project root:
+    python -m services.covenant_monitor data/quarterly_financials.json
+"""
+
+import argparse
+import json
+from functools import lru_cache
+
+import numpy as np
+
+from services.covenant_projection import covenant_headroom, covenant_thresholds
+from services.financial_calculator import calculate_ratio_panel
+from utils.helpers import load_from_json, save_to_json
+
+DEFAULT_STATE_PATH = "data/covenant_state.json"
+
+# The covenant every generated term sheet carries
+DEFAULT_COVENANTS = ["Debt Service Coverage Ratio (DSCR) > 1.2x"]
+
+FINANCIAL_FIELDS = ["ebitda", "debt_service", "total_debt", "ebit", "interest_expense"]
+
+@lru_cache(maxsize=256)
+def _parse_covenants(covenants):
+    """covenant_thresholds() for a tuple of covenant strings; books reuse a handful of packages"""
+    return covenant_thresholds(covenants)
+
+
+class CovenantMonitor:
+    """Latest covenant test results per borrower with an O(1) breach index"""
+
+    def __init__(self, state=None):
+        self.borrowers = dict((state or {}).get("borrowers", {}))
+        self.breach_index = {}
+        self.in_breach = set()
+        for borrower_id, entry in self.borrowers.items():
+            self._index(borrower_id, entry["breaches"])
+
+    def _index(self, borrower_id, breaches):
+        """Put a borrower's current breaches into the index"""
+        for ratio in breaches:
+            self.breach_index.setdefault(ratio, set()).add(borrower_id)
+        if breaches:
+            self.in_breach.add(borrower_id)
+
+    def _unindex(self, borrower_id, breaches):
+        """Remove a borrower's previous breaches from the index"""
+        for ratio in breaches:
+            self.breach_index[ratio].discard(borrower_id)
+        self.in_breach.discard(borrower_id)
+
+    def update(self, records):
+        """
+        Test covenants for a batch of borrower financials
+
+        Each record has a "borrower_id", the five financial fields, and
+        optionally "period" and "covenants" (covenant strings; defaults to the
+        standard DSCR covenant). Unchanged borrowers are skipped. Returns a
+        report with evaluated/skipped counts and newly breached/cured borrowers.
+        """
+
+        report = {"evaluated": 0, "skipped": 0, "new_breaches": [], "cured": []}
+
+        changed = []
+        for record in records:
+            borrower_id = str(record["borrower_id"])
+            # Plain values rather than a hash: comparing a short list is cheaper than hashing it
+            inputs = [record.get(field, 0) for field in FINANCIAL_FIELDS]
+            inputs.append(list(record.get("covenants") or DEFAULT_COVENANTS))
+
+            entry = self.borrowers.get(borrower_id)
+            if entry is not None and entry["inputs"] == inputs:
+                report["skipped"] += 1
+                continue
+            changed.append((borrower_id, record, _parse_covenants(tuple(inputs[-1])), inputs))
+
+        if not changed:
+            return report
+
+        # Test every changed borrower at once: an (n, 1) panel through the ratio engine
+        panel = {
+            field: np.array([[record.get(field, 0)] for _, record, _, _ in changed], dtype=np.float64)
+            for field in FINANCIAL_FIELDS
+        }
+        ratios = calculate_ratio_panel(panel)
+        ratio_values = {name: values[:, 0] for name, values in ratios.items()}
+        # Python floats/None per row for the stored state
+        ratio_state = {name: values[:, 0].astype(object).filled(None).tolist() for name, values in ratios.items()}
+
+        results = [{} for _ in changed]
+        tests = {}
+        for row, (_, _, covenants, _) in enumerate(changed):
+            for ratio, (direction, threshold) in covenants.items():
+                tests.setdefault((ratio, direction), []).append((row, threshold))
+
+        for (ratio, direction), rows in tests.items():
+            index = np.array([row for row, _ in rows])
+            thresholds = np.array([threshold for _, threshold in rows])
+            headroom, breached = covenant_headroom(ratio_values[ratio][index], direction, thresholds)
+            headroom = headroom.astype(object).filled(None).tolist()
+            for row, threshold, cushion, is_breached in zip(index.tolist(), thresholds.tolist(), headroom, breached.tolist()):
+                results[row][ratio] = {
+                    "direction": direction,
+                    "threshold": threshold,
+                    "headroom": cushion,
+                    "breached": is_breached
+                }
+
+        for row, (borrower_id, record, covenants, inputs) in enumerate(changed):
+            previous = self.borrowers.get(borrower_id)
+            breaches = sorted(ratio for ratio, result in results[row].items() if result["breached"])
+
+            if previous is not None:
+                self._unindex(borrower_id, previous["breaches"])
+            self._index(borrower_id, breaches)
+
+            was_in_breach = bool(previous and previous["breaches"])
+            if breaches and not was_in_breach:
+                report["new_breaches"].append(borrower_id)
+            elif was_in_breach and not breaches:
+                report["cured"].append(borrower_id)
+
+            self.borrowers[borrower_id] = {
+                "inputs": inputs,
+                "period": record.get("period"),
+                "ratios": {name: values[row] for name, values in ratio_state.items()},
+                "covenants": results[row],
+                "breaches": breaches
+            }
+            report["evaluated"] += 1
+
+        return report
+
+    def is_in_breach(self, borrower_id):
+        """True if any covenant of this borrower is currently breached"""
+        return str(borrower_id) in self.in_breach
+
+    def breach_count(self, ratio=None):
+        """Number of borrowers in breach, overall or of one covenant ratio"""
+        if ratio is None:
+            return len(self.in_breach)
+        return len(self.breach_index.get(ratio, ()))
+
+    def breach_summary(self):
+        """Monitored and breached borrower counts, overall and per covenant ratio"""
+        return {
+            "monitored": len(self.borrowers),
+            "in_breach": len(self.in_breach),
+            "by_covenant": {ratio: len(borrowers) for ratio, borrowers in self.breach_index.items() if borrowers}
+        }
+
+    def save(self, path=DEFAULT_STATE_PATH):
+        """Persist borrower state; the breach index is rebuilt on load"""
+        return save_to_json(path, {"borrowers": self.borrowers})
+
+
+def load_covenant_monitor(path=DEFAULT_STATE_PATH):
+    """Monitor restored from saved state (empty if none exists yet)"""
+    return CovenantMonitor(load_from_json(path) or {})
+
+def main():
+    parser = argparse.ArgumentParser(description="Test covenants for a batch of borrower financials")
+    parser.add_argument("financials", help="JSON file with a list of borrower financial records")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH)
+    args = parser.parse_args()
+
+    with open(args.financials, "r") as f:
+        records = json.load(f)
+
+    monitor = load_covenant_monitor(args.state)
+    report = monitor.update(records)
+    monitor.save(args.state)
+
+    summary = monitor.breach_summary()
+    print(f"{report['evaluated']} borrowers tested, {report['skipped']} unchanged; "
+          f"{len(report['new_breaches'])} new breaches, {len(report['cured'])} cured; "
+          f"{summary['in_breach']} of {summary['monitored']} borrowers in breach")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Covenant headroom projection over the loan tenor
+
+Starts from the borrower's current financials (the Financial Ratios page
+inputs), adds the proposed loan's amortization schedule to debt, debt service
+and interest, and grows EBITDA/EBIT along simulated scenario paths. Ratios
+are computed for every scenario and period at once with the panel ratio
+engine, so hundreds of paths per deal take milliseconds.
+"""
+
+import re
+
+import numpy as np
+
+from services.amortization import AMORTIZATION_STRUCTURES, STRUCTURES, amortization_schedule
+from services.financial_calculator import calculate_ratio_panel
+
+# Covenant wording -> ratio key, e.g. "Debt Service Coverage Ratio (DSCR) > 1.2x"
+COVENANT_RATIOS = {
+    "DSCR": "dscr",
+    "Debt/EBITDA": "leverage_ratio",
+    "Interest Coverage": "interest_coverage"
+}
+COVENANT_PATTERN = re.compile(r"\(?(DSCR|Debt/EBITDA|Interest Coverage)\)?\s*([<>])\s*([\d.]+)x")
+
+def covenant_thresholds(covenants):
+    """Ratio covenants found in a list of covenant strings: {ratio: (">" or "<", threshold)}"""
+    thresholds = {}
+    for covenant in covenants:
+        match = COVENANT_PATTERN.search(covenant)
+        if match:
+            label, direction, threshold = match.groups()
+            thresholds[COVENANT_RATIOS[label]] = (direction, float(threshold))
+    return thresholds
+
+def covenant_headroom(values, direction, threshold):
+    """
+    Fractional headroom to a covenant threshold (0.25 = 25% cushion) and breach
+    flags for a masked ratio array. A minimum covenant (">") with an undefined
+    ratio (no debt service) cannot be breached; a maximum covenant ("<")
+    breaches if EBITDA is not positive.
+    """
+    if direction == ">":
+        cushion = values / threshold - 1
+        return cushion, cushion.filled(0.0) < 0
+
+    no_ebitda = np.ma.getmaskarray(values) | (values.filled(0.0) <= 0)
+    cushion = np.ma.array(1 - values.filled(0.0) / threshold, mask=no_ebitda)
+    return cushion, no_ebitda | (cushion.filled(0.0) < 0)
+
+def growth_paths(n_scenarios, n_periods, periods_per_year, annual_growth=0.03, annual_volatility=0.10, seed=0):
+    """EBITDA multipliers versus today, (n_scenarios, n_periods), from a lognormal random walk"""
+    rng = np.random.default_rng(seed)
+    dt = 1 / periods_per_year
+    drift = (np.log1p(annual_growth) - 0.5 * annual_volatility ** 2) * dt
+    shocks = rng.normal(drift, annual_volatility * np.sqrt(dt), (n_scenarios, n_periods))
+    return np.exp(np.cumsum(shocks, axis=1))
+
+def project_covenant_headroom(financial_data, loan_amount, annual_rate, years, covenants,
+                              structure="quarterly", day_count="30/360", n_scenarios=500,
+                              annual_growth=0.03, annual_volatility=0.10, seed=0, growth=None):
+    """
+    Covenant headroom per scenario and period for one deal
+
+    financial_data holds the current ebitda, debt_service, total_debt, ebit and
+    interest_expense before the new loan. covenants is a list of covenant
+    strings (as in generate_loan_terms) or a covenant_thresholds() dict.
+    growth overrides the simulated EBITDA multipliers with an
+    (n_scenarios, n_periods) array. Debt service is the loan's scheduled
+    interest and principal at an annual run rate; a bullet's final principal
+    is assumed refinanced and left out.
+
+    Headroom and breaches follow covenant_headroom(). first_breach_period is
+    the 1-based period of the first breach of any covenant, or 0 if the
+    scenario never breaches.
+    """
+
+    if not isinstance(covenants, dict):
+        covenants = covenant_thresholds(covenants)
+    structure = AMORTIZATION_STRUCTURES.get(structure, structure)
+
+    schedule = amortization_schedule(loan_amount, annual_rate, years, structure, day_count)
+    periods_per_year = 12 // STRUCTURES[structure][0]
+    n_periods = len(schedule["period"])
+
+    if growth is None:
+        growth = growth_paths(n_scenarios, n_periods, periods_per_year, annual_growth, annual_volatility, seed)
+    shape = growth.shape
+
+    # Flows at an annualized run rate so ratios compare with annual covenants; a bullet's
+    # final principal is assumed refinanced, as in the structure optimizer, so it is not debt service
+    service = schedule["interest"][0] if STRUCTURES[structure][1] == "bullet" else schedule["payment"][0]
+    panel = {
+        "ebitda": financial_data.get("ebitda", 0) * growth,
+        "ebit": financial_data.get("ebit", 0) * growth,
+        "debt_service": np.broadcast_to(financial_data.get("debt_service", 0) + service * periods_per_year, shape),
+        "interest_expense": np.broadcast_to(financial_data.get("interest_expense", 0) + schedule["interest"][0] * periods_per_year, shape),
+        "total_debt": np.broadcast_to(financial_data.get("total_debt", 0) + schedule["balance"][0], shape)
+    }
+    ratios = calculate_ratio_panel(panel)
+
+    headroom = {}
+    breached = np.zeros(shape, dtype=bool)
+    for ratio, (direction, threshold) in covenants.items():
+        headroom[ratio], ratio_breached = covenant_headroom(ratios[ratio], direction, threshold)
+        breached |= ratio_breached
+
+    ever_breached = breached.any(axis=1)
+    first_breach = np.where(ever_breached, breached.argmax(axis=1) + 1, 0)
+    breach_probability = np.cumsum(breached, axis=1).astype(bool).mean(axis=0)
+
+    return {
+        "period": schedule["period"],
+        "periods_per_year": periods_per_year,
+        "covenants": covenants,
+        "ratios": ratios,
+        "headroom": headroom,
+        "breached": breached,
+        "first_breach_period": first_breach,
+        "breach_probability": breach_probability,
+        "summary": {
+            "scenarios": shape[0],
+            "breach_probability": float(ever_breached.mean()),
+            "median_first_breach_period": float(np.median(first_breach[ever_breached])) if ever_breached.any() else None,
+            "worst_headroom": {
+                ratio: float(np.percentile(cushion.filled(-1.0 if covenants[ratio][0] == "<" else np.inf).min(axis=1), 5))
+                for ratio, cushion in headroom.items()
+            }
+        }
+    }
@@ -1,3 +1,5 @@
+from services.risk_factors import format_risk_factors
+
 def generate_explanation(company_data, risk_analysis, loan_terms):
     """Generate AI reasoning explanation"""
     
@@ -82,7 +84,7 @@ First lien position provides:
 
 """
     
-    for factor in risk_analysis["risk_factors"]:
+    for factor in format_risk_factors(risk_analysis):
         explanation += f"- {factor}\n"
     
     explanation += f"""
@@ -1,3 +1,5 @@
+import numpy as np
+
 def calculate_dscr(ebitda, debt_service):
     """Calculate Debt Service Coverage Ratio"""
     if debt_service == 0:
@@ -33,4 +35,88 @@ def calculate_all_ratios(financial_data):
         "dscr": dscr,
         "leverage_ratio": leverage,
         "interest_coverage": interest_coverage
-    }
\ No newline at end of file
+    }
+
+# Panel ratios: borrower x period arrays, masked where a ratio is undefined
+
+FLOW_FIELDS = ["ebitda", "debt_service", "ebit", "interest_expense"]
+STOCK_FIELDS = ["total_debt"]
+RATIO_INPUTS = {
+    "dscr": ("ebitda", "debt_service"),
+    "leverage_ratio": ("total_debt", "ebitda"),
+    "interest_coverage": ("ebit", "interest_expense")
+}
+
+def _masked(values):
+    """2-D float masked array; NaN (missing periods) becomes masked"""
+    values = np.ma.masked_invalid(np.ma.asarray(values, dtype=np.float64))
+    values.mask = np.ma.getmaskarray(values)
+    return np.atleast_2d(values)
+
+def _safe_divide(numerator, denominator):
+    """numerator / denominator, masked where the denominator is zero or either side is masked"""
+    mask = np.ma.getmaskarray(numerator) | np.ma.getmaskarray(denominator) | (np.ma.getdata(denominator) == 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.ma.getdata(numerator) / np.where(mask, 1.0, np.ma.getdata(denominator))
+    return np.ma.array(ratio, mask=mask)
+
+def panel_from_frame(df, borrower="borrower_id", period="period"):
+    """
+    Pivot a long DataFrame (one row per borrower and period) into a panel dict
+    of (n_borrowers, n_periods) arrays plus the borrower and period labels.
+    Missing values and borrower/period combinations are NaN and end up masked.
+    """
+    wide = df.set_index([borrower, period])[FLOW_FIELDS + STOCK_FIELDS].unstack(period)
+    panel = {field: wide[field].to_numpy(dtype=np.float64) for field in FLOW_FIELDS + STOCK_FIELDS}
+    return panel, wide.index, wide[FLOW_FIELDS[0]].columns
+
+def calculate_ratio_panel(panel):
+    """
+    DSCR, Debt/EBITDA and interest coverage for every borrower and period at once
+    panel maps each input field to an (n_borrowers, n_periods) array; ratios are
+    masked arrays of the same shape, masked where calculate_all_ratios returns None.
+    """
+    return {
+        ratio: _safe_divide(_masked(panel[numerator]), _masked(panel[denominator]))
+        for ratio, (numerator, denominator) in RATIO_INPUTS.items()
+    }
+
+def trailing_sum(values, window=4):
+    """Rolling sum over the last window periods; masked until window periods of data exist"""
+    values = _masked(values)
+    mask = np.ma.getmaskarray(values)
+    padding = np.zeros((values.shape[0], 1))
+
+    totals = np.cumsum(np.hstack([padding, values.filled(0.0)]), axis=1)
+    missing = np.cumsum(np.hstack([padding, mask]), axis=1)
+
+    result = np.full(values.shape, np.nan)
+    result[:, window - 1:] = totals[:, window:] - totals[:, :-window]
+    incomplete = np.ones(values.shape, dtype=bool)
+    incomplete[:, window - 1:] = (missing[:, window:] - missing[:, :-window]) > 0
+    return np.ma.array(result, mask=incomplete)
+
+def calculate_ttm_ratios(panel, window=4):
+    """
+    Trailing-twelve-month ratios from quarterly data: flows (EBITDA, debt
+    service, EBIT, interest) are summed over the last window periods and total
+    debt is taken at period end
+    """
+    ttm = {field: trailing_sum(panel[field], window) for field in FLOW_FIELDS}
+    for field in STOCK_FIELDS:
+        ttm[field] = _masked(panel[field])
+    return calculate_ratio_panel(ttm)
+
+def period_over_period(ratios, lag=1, relative=False):
+    """
+    Change in each ratio versus lag periods earlier (relative=True gives the
+    fractional change); the first lag periods are masked
+    """
+    changes = {}
+    for name, values in ratios.items():
+        current = values[:, lag:]
+        previous = values[:, :-lag]
+        change = _safe_divide(current - previous, previous) if relative else current - previous
+        padding = np.ma.masked_all((values.shape[0], lag))
+        changes[name] = np.ma.hstack([padding, change])
+    return changes
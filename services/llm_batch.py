@@ -0,0 +1,150 @@
+"""
+Concurrent AI explanations for a batch of deals
+
+generate_llm_explanation sends one request at a time, so explaining a queue
+of pending approvals took the sum of every round trip. The asyncio variant
+here keeps up to `concurrency` requests in flight on one pooled AsyncOpenAI
+client. Token buckets for requests and tokens per minute pace the batch, so
+it stays under the account's rate limits instead of running into 429s.
+Retries of 429 and 5xx responses are left to the OpenAI client
+(max_retries, which honors Retry-After). An item that still fails gets the
+rule-based fallback explanation and does not fail the batch. Results come
+back in input order, and identical requests are served from the response
+cache (services.llm_cache).
+"""
+
+import asyncio
+import os
+import time
+from contextlib import nullcontext
+
+from services.llm_cache import get_llm_cache
+from services.llm_integration import (EXPLANATION_MAX_TOKENS, EXPLANATION_MODEL, EXPLANATION_SYSTEM_PROMPT,
+                                      build_explanation_prompt, explanation_cache_key, explanation_request,
+                                      generate_fallback_explanation)
+from services.openai_client import create_async_openai_client
+
+LLM_CONCURRENCY = int(os.getenv("AURA_LLM_CONCURRENCY", "8"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("AURA_LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("AURA_LLM_TOKENS_PER_MINUTE", "90000"))
+
+# Burst allowance: how many seconds of the per-minute budget may be spent at once
+BURST_SECONDS = 6
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at per_minute / 60 per second"""
+
+    def __init__(self, per_minute, burst_seconds=BURST_SECONDS):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * burst_seconds)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount=1):
+        """Wait until amount tokens are available and take them (waiters are served in order)"""
+        # A request larger than the bucket waits for a full bucket and leaves it in debt,
+        # so later requests wait for the difference and the long-run rate still holds
+        needed = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= needed:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((needed - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets; either may be None for no limit"""
+
+    def __init__(self, requests_per_minute=LLM_REQUESTS_PER_MINUTE, tokens_per_minute=LLM_TOKENS_PER_MINUTE):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def acquire(self, tokens):
+        if self.requests:
+            await self.requests.acquire(1)
+        if self.tokens:
+            await self.tokens.acquire(tokens)
+
+def estimate_tokens(prompt):
+    """Tokens a request counts against the TPM limit: ~4 characters per prompt token plus max_tokens"""
+    return (len(EXPLANATION_SYSTEM_PROMPT) + len(prompt)) // 4 + EXPLANATION_MAX_TOKENS
+
+async def agenerate_llm_explanation(company_data, risk_analysis, loan_terms, client, limiter=None, semaphore=None):
+    """
+    Async generate_llm_explanation on a caller-owned AsyncOpenAI client
+    Falls back to rule-based on any failure
+    """
+
+    try:
+        prompt = build_explanation_prompt(company_data, risk_analysis, loan_terms)
+
+        cache = get_llm_cache()
+        key = explanation_cache_key(prompt)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
+
+        # Rate budget is taken inside the semaphore so only requests about to be sent hold it
+        async with semaphore or nullcontext():
+            if limiter:
+                await limiter.acquire(estimate_tokens(prompt))
+            response = await client.chat.completions.create(**explanation_request(prompt))
+
+        explanation = response.choices[0].message.content
+        if cache and explanation:
+            cache.put(key, explanation, EXPLANATION_MODEL)
+
+        return explanation
+
+    except Exception as e:
+        print(f"LLM Error ({company_data.get('company_name')}): {e}")
+        return generate_fallback_explanation(company_data, risk_analysis, loan_terms)
+
+async def agenerate_llm_explanations(deals, concurrency=LLM_CONCURRENCY, requests_per_minute=LLM_REQUESTS_PER_MINUTE,
+                                     tokens_per_minute=LLM_TOKENS_PER_MINUTE, client=None):
+    """
+    Explanations for (company_data, risk_analysis, loan_terms) deals, in input order
+
+    At most concurrency requests are in flight, paced by the requests and
+    tokens per minute limits. Without OPENAI_API_KEY (and no client passed)
+    every deal gets the rule-based explanation.
+    """
+
+    deals = list(deals)
+    api_key = os.getenv("OPENAI_API_KEY")
+    if client is None and not api_key:
+        return [generate_fallback_explanation(*deal) for deal in deals]
+
+    owns_client = client is None
+    if owns_client:
+        try:
+            client = create_async_openai_client(
+                api_key,
+                os.getenv("OPENAI_BASE_URL") or None,
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency
+            )
+        except Exception as e:
+            print(f"LLM Error: {e}")
+            return [generate_fallback_explanation(*deal) for deal in deals]
+
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+    try:
+        return await asyncio.gather(*(
+            agenerate_llm_explanation(company_data, risk_analysis, loan_terms, client, limiter, semaphore)
+            for company_data, risk_analysis, loan_terms in deals
+        ))
+    finally:
+        if owns_client:
+            await client.close()
+
+def generate_llm_explanations(deals, **kwargs):
+    """Blocking wrapper around agenerate_llm_explanations for scripts and Streamlit pages"""
+    return asyncio.run(agenerate_llm_explanations(deals, **kwargs))
@@ -0,0 +1,172 @@
+"""
+Persistent cache for LLM responses
+
+An identical request (model, system prompt, rendered prompt, temperature and
+token limit) is answered from a local SQLite database instead of another API
+round trip. Entries expire after a TTL, the least recently used ones are
+evicted once the stored responses exceed a size limit, and hit/miss counters
+are kept in the same database, so the cache and its stats survive restarts
+and are shared by every Streamlit session and process on the machine.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.getenv("AURA_LLM_CACHE_PATH", "data/llm_cache.sqlite3")
+DEFAULT_TTL_SECONDS = int(os.getenv("AURA_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_MAX_BYTES = int(os.getenv("AURA_LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+STAT_NAMES = ["hits", "misses", "expired", "evictions", "writes"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+def request_key(model, system_prompt, prompt, temperature, max_tokens=None):
+    """Stable hash of everything that determines an LLM response"""
+    payload = json.dumps([model, system_prompt, prompt, float(temperature), max_tokens])
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response cache with TTL, size-bounded LRU eviction and stats"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_seconds=DEFAULT_TTL_SECONDS, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+            db.executemany("INSERT OR IGNORE INTO stats (name, value) VALUES (?, 0)", [(name,) for name in STAT_NAMES])
+
+    def _connect(self):
+        """One connection per thread (Streamlit serves sessions from several threads)"""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            # WAL lets readers in other processes proceed while one writes
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _count(self, db, name, amount=1):
+        db.execute("UPDATE stats SET value = value + ? WHERE name = ?", (amount, name))
+
+    def get(self, key):
+        """Cached response text or None; expired entries are dropped"""
+        try:
+            return self._get(key)
+        except sqlite3.Error as e:
+            # The cache is an optimization; a locked or unreadable database is a miss
+            print(f"LLM cache error: {e}")
+            return None
+
+    def put(self, key, response, model=""):
+        """Store a response, then evict expired and least recently used entries over max_bytes"""
+        try:
+            self._put(key, response, model)
+        except sqlite3.Error as e:
+            print(f"LLM cache error: {e}")
+
+    def _get(self, key):
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._count(db, "misses")
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._count(db, "expired")
+                self._count(db, "misses")
+                return None
+
+            db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._count(db, "hits")
+            return response
+
+    def _put(self, key, response, model):
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf8")), now, now)
+            )
+            self._count(db, "writes")
+
+            evicted = 0
+            if self.ttl_seconds is not None:
+                evicted += db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)).rowcount
+            # Keep the most recently used entries whose sizes add up to max_bytes
+            evicted += db.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS running FROM responses
+                    ) WHERE running > ?
+                )
+                """,
+                (self.max_bytes,)
+            ).rowcount
+            if evicted:
+                self._count(db, "evictions", evicted)
+
+    def clear(self):
+        """Drop every stored response and reset the counters"""
+        with self._connect() as db:
+            db.execute("DELETE FROM responses")
+            db.execute("UPDATE stats SET value = 0")
+
+    def stats(self):
+        """Counters plus current entry count and size, for every process sharing the database"""
+        with self._connect() as db:
+            stats = dict(db.execute("SELECT name, value FROM stats").fetchall())
+            entries, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = stats["hits"] + stats["misses"]
+        stats.update({
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": stats["hits"] / lookups if lookups else 0.0
+        })
+        return stats
+
+
+_llm_cache = None
+_llm_cache_lock = threading.Lock()
+
+def get_llm_cache():
+    """The shared cache, opened on first use; None if AURA_LLM_CACHE_PATH is set to an empty string"""
+    global _llm_cache
+    if _llm_cache is None and DEFAULT_CACHE_PATH:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = LLMResponseCache()
+    return _llm_cache
+
+def llm_cache_stats():
+    """Stats of the shared cache, or None when caching is disabled"""
+    cache = get_llm_cache()
+    return cache.stats() if cache else None
@@ -1,27 +1,19 @@
-import os
-from dotenv import load_dotenv
+from services.llm_cache import get_llm_cache, request_key
+from services.openai_client import get_openai_client
+from services.risk_factors import format_risk_factors
 
-# Load environment variables
-load_dotenv()
+# Explanation request settings (all part of the response cache key)
+EXPLANATION_MODEL = "gpt-3.5-turbo"
+EXPLANATION_SYSTEM_PROMPT = "You are an expert commercial credit analyst with 20 years of experience in corporate lending."
+EXPLANATION_TEMPERATURE = 0.7
+EXPLANATION_MAX_TOKENS = 1500
 
-def generate_llm_explanation(company_data, risk_analysis, loan_terms):
+def build_explanation_prompt(company_data, risk_analysis, loan_terms):
     """
-    Generate AI-powered explanation using OpenAI
-    Falls back to rule-based if API key not available
+    User prompt for the credit decision explanation
     """
     
-    try:
-        import openai
-        
-        api_key = os.getenv("OPENAI_API_KEY")
-        
-        if not api_key:
-            return generate_fallback_explanation(company_data, risk_analysis, loan_terms)
-        
-        # NEW OpenAI syntax (v1.0+)
-        client = openai.OpenAI(api_key=api_key)
-        
-        prompt = f"""
+    return f"""
 You are a senior credit analyst at a commercial bank. Analyze the following loan application and provide a detailed, professional explanation of the credit decision.
 
 Company Information:
@@ -36,7 +28,7 @@ Risk Assessment:
 - Risk Level: {risk_analysis['risk_level']}
 - Risk Score: {risk_analysis['risk_score']}/100
 - Key Risk Factors:
-{chr(10).join('  - ' + factor for factor in risk_analysis['risk_factors'])}
+{chr(10).join('  - ' + factor for factor in format_risk_factors(risk_analysis))}
 
 Proposed Loan Terms:
 - Tenor: {loan_terms['tenor']}
@@ -52,19 +44,54 @@ Please provide:
 
 Use professional banking terminology. Be concise but thorough.
 """
+
+def explanation_request(prompt):
+    """chat.completions.create arguments for an explanation prompt"""
+    return {
+        "model": EXPLANATION_MODEL,
+        "messages": [
+            {"role": "system", "content": EXPLANATION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": EXPLANATION_TEMPERATURE,
+        "max_tokens": EXPLANATION_MAX_TOKENS
+    }
+
+def explanation_cache_key(prompt):
+    """Response cache key for an explanation prompt"""
+    return request_key(EXPLANATION_MODEL, EXPLANATION_SYSTEM_PROMPT, prompt, EXPLANATION_TEMPERATURE, EXPLANATION_MAX_TOKENS)
+
+def generate_llm_explanation(company_data, risk_analysis, loan_terms):
+    """
+    Generate AI-powered explanation using OpenAI
+    Identical requests are answered from the persistent response cache
+    Falls back to rule-based if API key not available
+    """
+    
+    try:
+        # Shared pooled client; None when no API key is configured
+        client = get_openai_client()
+        
+        if client is None:
+            return generate_fallback_explanation(company_data, risk_analysis, loan_terms)
+        
+        prompt = build_explanation_prompt(company_data, risk_analysis, loan_terms)
+        
+        cache = get_llm_cache()
+        key = explanation_cache_key(prompt)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            return cached
         
         # UPDATED API CALL (new syntax)
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "You are an expert commercial credit analyst with 20 years of experience in corporate lending."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=1500
-        )
+        response = client.chat.completions.create(**explanation_request(prompt))
         
-        return response.choices[0].message.content
+        explanation = response.choices[0].message.content
+        # Only real model output is cached, never the rule-based fallback
+        if cache and explanation:
+            cache.put(key, explanation, EXPLANATION_MODEL)
+        
+        return explanation
     
     except Exception as e:
         print(f"LLM Error: {e}")
@@ -99,7 +126,7 @@ Based on our comprehensive analysis of **{company_data['company_name']}**, we ha
 
 """
     
-    for factor in risk_analysis["risk_factors"]:
+    for factor in format_risk_factors(risk_analysis):
         explanation += f"- {factor}\n"
     
     explanation += f"""
@@ -289,16 +316,11 @@ def generate_chat_response(user_message, context=None):
     """
     
     try:
-        import openai
-        
-        api_key = os.getenv("OPENAI_API_KEY")
+        client = get_openai_client()
         
-        if not api_key:
+        if client is None:
             return "I'm currently operating in offline mode. Please configure your OpenAI API key to enable AI-powered responses."
         
-        # NEW OpenAI syntax (v1.0+)
-        client = openai.OpenAI(api_key=api_key)
-        
         system_prompt = """
 You are AURA (AI Unified Risk & Loan Origination Assistant), an expert AI assistant for commercial lending and credit analysis.
 
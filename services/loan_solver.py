@@ -0,0 +1,120 @@
+"""
+Reverse solver: how much can a company borrow and stay within a risk band?
+
+For a fixed revenue, industry and purpose the only input that moves with the
+loan amount is the loan-to-revenue ratio, so the score is a step function of
+loan_amount that changes only at the rulebook's leverage thresholds. The
+solver computes those breakpoints in closed form and then nudges each one by
+single floating-point steps so it is the exact largest loan_amount that
+calculate_risk_score still places in the lower band.
+"""
+
+import math
+
+import numpy as np
+
+from services.rulebook import get_active_rulebook, prepare_batch_inputs
+
+def _exact_breakpoints(revenue, edges):
+    """Largest loan with (loan / revenue) * 100 <= edge, per row and edge, in float64"""
+    revenue = revenue[:, None]
+    edges = edges[None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        loan = edges * revenue / 100
+
+        # The ratio is monotone in loan, so walk down then up one ulp at a time
+        for _ in range(64):
+            too_high = (loan / revenue) * 100 > edges
+            if not too_high.any():
+                break
+            loan = np.where(too_high, np.nextafter(loan, -np.inf), loan)
+
+        for _ in range(64):
+            step = np.nextafter(loan, np.inf)
+            fits = (step / revenue) * 100 <= edges
+            if not fits.any():
+                break
+            loan = np.where(fits, step, loan)
+
+    return loan
+
+def loan_breakpoints_batch(data, rulebook=None):
+    """
+    Loan amount breakpoints and maximum loan per risk band for many companies
+
+    data is a DataFrame or dict of arrays with revenue, industry and purpose
+    (loan_amount is ignored). Returns:
+      breakpoints  (n, n_leverage_edges) largest loan still inside each leverage band
+      band_levels  (n, n_leverage_bands) risk level index reached in each leverage band
+      max_loan     (n, n_levels) largest loan that keeps every amount from 0 up to it
+                   at or below that level; nan if unattainable, inf if unbounded
+    """
+
+    rulebook = rulebook or get_active_rulebook()
+
+    inputs = prepare_batch_inputs(data)
+    revenue = inputs["revenue"]
+    n = len(revenue)
+    inputs["loan_amount"] = np.zeros(n)
+
+    # Score at loan = 0, minus the first leverage band, leaves the loan-independent part
+    has_revenue = revenue > 0
+    leverage_points = np.array(rulebook.leverage_points, dtype=np.int16)
+    base = rulebook.evaluate_batch(inputs)["risk_score"] - np.where(has_revenue, leverage_points[0], 0).astype(np.int16)
+
+    # Without revenue there is no leverage factor, so every band scores the base
+    band_scores = base[:, None] + np.where(has_revenue[:, None], leverage_points[None, :], 0)
+    band_levels = np.searchsorted(np.array(rulebook.level_edges), band_scores, side="left")
+
+    breakpoints = _exact_breakpoints(revenue, np.array(rulebook.leverage_edges, dtype=np.float64))
+    breakpoints[~has_revenue] = np.inf
+    upper = np.concatenate([breakpoints, np.full((n, 1), np.inf)], axis=1)
+
+    max_loan = np.full((n, len(rulebook.levels)), np.nan)
+    for level in range(len(rulebook.levels)):
+        exceeds = band_levels > level
+        first = np.where(exceeds.any(axis=1), exceeds.argmax(axis=1), band_levels.shape[1])
+        # first == 0: even a zero loan is above this level; no band exceeds it: upper is inf
+        reachable = first > 0
+        max_loan[reachable, level] = upper[reachable, first[reachable] - 1]
+
+    return {
+        "breakpoints": breakpoints,
+        "band_levels": band_levels,
+        "max_loan": max_loan,
+        "levels": list(rulebook.levels)
+    }
+
+def solve_max_loan(company_data, rulebook=None):
+    """
+    Maximum loan_amount per risk band for one company (loan_amount is ignored)
+
+    Returns {"max_loan": {level: amount}, "segments": [...]} where amount is
+    None if the band is unattainable and math.inf if any amount stays within it.
+    Each segment covers loan amounts up to "up_to" (inclusive) since the previous one.
+    """
+
+    rulebook = rulebook or get_active_rulebook()
+
+    result = loan_breakpoints_batch({
+        "revenue": [company_data.get("revenue", 0)],
+        "industry": [company_data.get("industry", "")],
+        "purpose": [company_data.get("purpose")]
+    }, rulebook)
+
+    max_loan = {}
+    for level, amount in zip(result["levels"], result["max_loan"][0]):
+        max_loan[level] = None if math.isnan(amount) else float(amount)
+
+    upper = list(result["breakpoints"][0]) + [math.inf]
+    segments = []
+    for up_to, level in zip(upper, result["band_levels"][0]):
+        if segments and segments[-1]["risk_level"] == rulebook.levels[level]:
+            segments[-1]["up_to"] = float(up_to)
+        else:
+            segments.append({"up_to": float(up_to), "risk_level": rulebook.levels[level]})
+        if math.isinf(up_to):
+            break
+
+    return {"max_loan": max_loan, "segments": segments}
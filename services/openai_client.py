@@ -0,0 +1,89 @@
+"""
+Shared, pooled OpenAI client
+
+Constructing openai.OpenAI for every request throws its HTTP connection pool
+away, so each explanation or chat reply paid a new TCP and TLS handshake.
+get_openai_client() builds one client per (API key, base URL) on first use,
+with a keep-alive connection pool and explicit timeouts and retries, and hands
+the same warm client to every caller in the process, i.e. to every Streamlit
+session. OPENAI_BASE_URL points it at a proxy or at
+benchmarks/mock_openai_server.py.
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+OPENAI_TIMEOUT = float(os.getenv("AURA_OPENAI_TIMEOUT", "30"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("AURA_OPENAI_CONNECT_TIMEOUT", "5"))
+OPENAI_MAX_RETRIES = int(os.getenv("AURA_OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("AURA_OPENAI_MAX_CONNECTIONS", "20"))
+OPENAI_KEEPALIVE_CONNECTIONS = int(os.getenv("AURA_OPENAI_KEEPALIVE_CONNECTIONS", "10"))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("AURA_OPENAI_KEEPALIVE_EXPIRY", "60"))
+
+def _http_settings(timeout, connect_timeout, max_connections, max_keepalive_connections, keepalive_expiry):
+    """httpx client options shared by the sync and async clients"""
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(timeout, connect=connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        ),
+        "follow_redirects": True
+    }
+
+def create_openai_client(api_key, base_url=None, timeout=OPENAI_TIMEOUT, connect_timeout=OPENAI_CONNECT_TIMEOUT,
+                         max_retries=OPENAI_MAX_RETRIES, max_connections=OPENAI_MAX_CONNECTIONS,
+                         max_keepalive_connections=OPENAI_KEEPALIVE_CONNECTIONS, keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY):
+    """A new openai.OpenAI on its own keep-alive connection pool (use get_openai_client to share one)"""
+    import httpx
+    import openai
+
+    settings = _http_settings(timeout, connect_timeout, max_connections, max_keepalive_connections, keepalive_expiry)
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=settings["timeout"],
+        max_retries=max_retries,
+        http_client=httpx.Client(**settings)
+    )
+
+def create_async_openai_client(api_key, base_url=None, timeout=OPENAI_TIMEOUT, connect_timeout=OPENAI_CONNECT_TIMEOUT,
+                               max_retries=OPENAI_MAX_RETRIES, max_connections=OPENAI_MAX_CONNECTIONS,
+                               max_keepalive_connections=OPENAI_KEEPALIVE_CONNECTIONS, keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY):
+    """
+    A new openai.AsyncOpenAI on its own keep-alive connection pool
+
+    Async connections belong to the event loop that opened them, so this
+    client is not shared process-wide: create one per batch (per
+    asyncio.run) and close it when the batch is done.
+    """
+    import httpx
+    import openai
+
+    settings = _http_settings(timeout, connect_timeout, max_connections, max_keepalive_connections, keepalive_expiry)
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=settings["timeout"],
+        max_retries=max_retries,
+        http_client=httpx.AsyncClient(**settings)
+    )
+
+@lru_cache(maxsize=4)
+def _shared_client(api_key, base_url):
+    return create_openai_client(api_key, base_url)
+
+def get_openai_client():
+    """The process-wide client for the configured key and base URL, or None without OPENAI_API_KEY"""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    # A rotated key or new base URL gets its own client
+    return _shared_client(api_key, os.getenv("OPENAI_BASE_URL") or None)
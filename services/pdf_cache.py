@@ -0,0 +1,196 @@
+"""
+Content-addressed cache for generated term sheet PDFs
+
+A ReportLab build on every Streamlit rerun is the slowest part of the Term
+Sheet page. Documents are keyed by a hash of the inputs the template reads
+plus the template version, kept in a byte-bounded in-memory LRU and, if a
+directory is configured (AURA_PDF_CACHE_DIR), in a size-bounded disk tier
+that survives restarts and is shared between processes. Cached documents
+are built without the generation time and document ID, so a cache hit never
+serves a stale timestamp or repeats another download's document ID.
+"""
+
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from services.scoring_cache import canonical_key
+from utils.pdf_generator import TEMPLATE_VERSION, generate_term_sheet_pdf
+
+DEFAULT_MEMORY_BYTES = int(os.getenv("AURA_PDF_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+DEFAULT_DISK_BYTES = int(os.getenv("AURA_PDF_CACHE_DISK_BYTES", str(512 * 1024 * 1024)))
+DEFAULT_CACHE_DIR = os.getenv("AURA_PDF_CACHE_DIR")
+
+# On-screen downloads favor build time; see utils.pdf_generator.PDF_PROFILES
+INTERACTIVE_PROFILE = os.getenv("AURA_PDF_INTERACTIVE_PROFILE", "fast")
+
+
+class PDFCache:
+    """Two-tier (memory, optional disk) LRU of document bytes bounded by total size"""
+
+    def __init__(self, max_memory_bytes=DEFAULT_MEMORY_BYTES, cache_dir=DEFAULT_CACHE_DIR, max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.memory_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _remember(self, key, data):
+        """Put bytes in the memory tier, evicting least recently used documents over the size limit"""
+        if key in self._entries:
+            self.memory_bytes -= len(self._entries.pop(key))
+        if len(data) > self.max_memory_bytes:
+            return
+        self._entries[key] = data
+        self.memory_bytes += len(data)
+        while self.memory_bytes > self.max_memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    def get(self, key):
+        """Cached bytes or None; a disk hit is promoted to memory"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+
+            if self.cache_dir:
+                try:
+                    with open(self._path(key), "rb") as f:
+                        data = f.read()
+                    # Touch so disk eviction sees it as recently used
+                    os.utime(self._path(key))
+                except OSError:
+                    data = None
+                if data is not None:
+                    self._remember(key, data)
+                    self.disk_hits += 1
+                    return data
+
+            self.misses += 1
+            return None
+
+    def put(self, key, data):
+        """Store bytes in memory and, if configured, on disk"""
+        with self._lock:
+            self._remember(key, data)
+
+        if self.cache_dir:
+            # Write then rename so other processes never read a partial file
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete least recently used files until the directory is under max_disk_bytes"""
+        files = []
+        total = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf"):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+
+    def clear(self):
+        """Drop memory entries, disk files and counters"""
+        with self._lock:
+            self._entries.clear()
+            self.memory_bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+            if self.cache_dir:
+                for name in os.listdir(self.cache_dir):
+                    if name.endswith(".pdf"):
+                        os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        """Hit/miss counters and sizes for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "memory_bytes": self.memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "cache_dir": self.cache_dir,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0
+            }
+
+
+_pdf_cache = PDFCache()
+
+def term_sheet_key(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms, profile=INTERACTIVE_PROFILE):
+    """Hash of everything the term sheet template reads, plus its version and output profile"""
+    return canonical_key({
+        "template_version": TEMPLATE_VERSION,
+        "profile": profile,
+        "company_name": company_name,
+        "industry": industry,
+        "loan_amount": loan_amount,
+        "purpose": purpose,
+        "risk_level": risk_analysis["risk_level"],
+        "risk_score": risk_analysis["risk_score"],
+        "recommendation": risk_analysis["recommendation"],
+        "tenor": loan_terms["tenor"],
+        "interest_margin": loan_terms["interest_margin"],
+        "amortization": loan_terms["amortization"],
+        "collateral": loan_terms["collateral"],
+        "covenants": list(loan_terms["covenants"])
+    })
+
+def cached_term_sheet_pdf(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms, profile=INTERACTIVE_PROFILE):
+    """generate_term_sheet_pdf, unstamped, served from the cache when the inputs are unchanged; returns a BytesIO"""
+
+    key = term_sheet_key(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms, profile)
+    data = _pdf_cache.get(key)
+    if data is None:
+        data = generate_term_sheet_pdf(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms, profile, stamped=False).getvalue()
+        _pdf_cache.put(key, data)
+
+    return io.BytesIO(data)
+
+def configure_pdf_cache(max_memory_bytes=None, cache_dir=None, max_disk_bytes=None):
+    """Replace the shared cache, e.g. to enable the disk tier at startup"""
+    global _pdf_cache
+    _pdf_cache = PDFCache(
+        max_memory_bytes if max_memory_bytes is not None else DEFAULT_MEMORY_BYTES,
+        cache_dir,
+        max_disk_bytes if max_disk_bytes is not None else DEFAULT_DISK_BYTES
+    )
+
+def clear_pdf_cache():
+    """Empty the shared cache"""
+    _pdf_cache.clear()
+
+def pdf_cache_stats():
+    """Hit/miss counters for the shared PDF cache"""
+    return _pdf_cache.stats()
@@ -0,0 +1,191 @@
+"""
+Loan pricing off the SOFR forward curve
+
+The forward curve is read from a local CSV (assets/sofr_forward_curve.csv, or
+AURA_SOFR_CURVE_PATH) once per file version and its interpolator is cached.
+Coupons float: each period pays the forward SOFR rate at the start of the
+period plus the margin, on the balance outstanding. The principal profile
+comes from services.amortization. Everything is vectorized over loans, so one
+call prices a single deal or a whole pipeline.
+"""
+
+import csv
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from services.amortization import AMORTIZATION_STRUCTURES, STRUCTURES, amortization_schedule
+
+DEFAULT_CURVE_PATH = os.getenv(
+    "AURA_SOFR_CURVE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "sofr_forward_curve.csv")
+)
+
+# Annual probability of default per risk level, loss given default and capital held per unit of exposure
+DEFAULT_PD = {"LOW RISK": 0.01, "MODERATE RISK": 0.03, "HIGH RISK": 0.08}
+DEFAULT_LGD = 0.45
+CAPITAL_RATIO = 0.08
+
+MARGIN_PATTERN = re.compile(r"([\d.]+)\s*bps")
+
+
+class ForwardCurve:
+    """Piecewise-linear forward SOFR curve (percent) by time in years, flat beyond the ends"""
+
+    def __init__(self, tenors, rates):
+        order = np.argsort(tenors)
+        self.tenors = np.asarray(tenors, dtype=np.float64)[order]
+        self.rates = np.asarray(rates, dtype=np.float64)[order]
+
+    def __call__(self, years):
+        return np.interp(years, self.tenors, self.rates)
+
+
+@lru_cache(maxsize=4)
+def _load_curve(path, mtime):
+    """Parse the curve file; cached per path and modification time"""
+    tenors = []
+    rates = []
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            tenors.append(float(row["tenor_years"]))
+            rates.append(float(row["forward_rate"]))
+    return ForwardCurve(tenors, rates)
+
+def get_forward_curve(path=None):
+    """The cached forward curve interpolator; re-read only if the file changes"""
+    path = path or DEFAULT_CURVE_PATH
+    return _load_curve(path, os.path.getmtime(path))
+
+def margin_bps(loan_terms):
+    """Margin in basis points from loan terms, numeric field first, else the display string"""
+    if loan_terms.get("margin_bps") is not None:
+        return float(loan_terms["margin_bps"])
+    return float(MARGIN_PATTERN.search(loan_terms["interest_margin"]).group(1))
+
+def tenor_years(loan_terms):
+    """Tenor in years from loan terms, numeric field first, else the display string ("5 years")"""
+    if loan_terms.get("tenor_years") is not None:
+        return float(loan_terms["tenor_years"])
+    return float(str(loan_terms["tenor"]).split()[0])
+
+def _discount_factors(rates, accrual):
+    """Cumulative discount factors for per-period annual rates in percent"""
+    return 1 / np.cumprod(1 + rates / 100 * accrual[None, :], axis=1)
+
+def solve_yield(cash_flows, price, periods_per_year, guess=0.02, tol=1e-12, max_iter=50):
+    """
+    Vectorized Newton solve for the periodic yield y with
+    sum_k cash_flows[:, k] / (1 + y)^(k + 1) = price, returned as an annual
+    nominal rate in percent (y * periods_per_year * 100). Rows that fail to
+    converge are nan.
+    """
+    cash_flows = np.atleast_2d(cash_flows)
+    price = np.broadcast_to(np.asarray(price, dtype=np.float64), cash_flows.shape[:1])
+    k = np.arange(1, cash_flows.shape[1] + 1)
+    y = np.full(cash_flows.shape[0], guess)
+    converged = np.zeros(cash_flows.shape[0], dtype=bool)
+
+    for _ in range(max_iter):
+        discount = (1 + y[:, None]) ** -k
+        f = (cash_flows * discount).sum(axis=1) - price
+        df = -(k * cash_flows * discount / (1 + y[:, None])).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = np.where(converged, 0.0, f / df)
+        y = np.maximum(y - step, -0.99)
+        converged |= np.abs(step) < tol
+        if converged.all():
+            break
+
+    return np.where(converged, y * periods_per_year * 100, np.nan)
+
+def price_loans(principal, margin, years, risk_level=None, structure="quarterly", fee_bps=0.0,
+                funding_spread_bps=0.0, pd=None, lgd=DEFAULT_LGD, curve=None):
+    """
+    Price one or many floating-rate loans
+
+    principal, margin (bps over SOFR) and years are scalars or 1-D arrays;
+    risk_level is a level name or array of names used to look up the annual
+    probability of default (pd overrides it). structure is an amortization
+    structure or term sheet wording. fee_bps is an upfront fee, so the lender
+    funds principal * (1 - fee). Discounting uses forward SOFR plus
+    funding_spread_bps, not the coupon rate, so NPV is the present value of
+    the margin over funding net of the fee: positive whenever the margin
+    exceeds funding_spread_bps, even on a flat curve.
+
+    Returns per-period "coupon_rate" (percent), "interest", "principal",
+    "cash_flow" and "discount_factor" arrays of shape (n_loans, n_periods),
+    plus per-loan "all_in_rate" (first coupon), "npv", "ytm" (percent),
+    "expected_loss" (percent a year) and "risk_adjusted_return" (RAROC).
+    """
+
+    curve = curve or get_forward_curve()
+    structure = AMORTIZATION_STRUCTURES.get(structure, structure)
+    months_per_period = STRUCTURES[structure][0]
+    periods_per_year = 12 // months_per_period
+
+    principal = np.atleast_1d(np.asarray(principal, dtype=np.float64))
+    margin = np.atleast_1d(np.asarray(margin, dtype=np.float64))
+    principal, margin, years = np.broadcast_arrays(principal, margin, np.atleast_1d(np.asarray(years, dtype=np.float64)))
+
+    # Principal profile from the amortization engine at the opening all-in rate
+    opening_rate = curve(0.0) + margin / 100
+    schedule = amortization_schedule(principal, opening_rate, years, structure)
+    accrual = schedule["accrual_factor"]
+    active = schedule["period"][None, :] <= schedule["n_periods"][:, None]
+    opening_balance = schedule["balance"] + schedule["principal"]
+
+    period_start = np.concatenate([[0.0], np.cumsum(accrual)[:-1]])
+    sofr = curve(period_start)
+    coupon_rate = sofr[None, :] + margin[:, None] / 100
+    interest = np.where(active, opening_balance * coupon_rate / 100 * accrual[None, :], 0.0)
+    cash_flow = interest + schedule["principal"]
+
+    discount_factor = _discount_factors(np.broadcast_to(sofr + funding_spread_bps / 100, coupon_rate.shape), accrual)
+    funded = principal * (1 - fee_bps / 10_000)
+    npv = (cash_flow * discount_factor).sum(axis=1) - funded
+    ytm = solve_yield(cash_flow, funded, periods_per_year)
+
+    # Risk-adjusted return on capital: spread over funding, less expected loss, per unit of capital
+    if pd is None:
+        levels = np.broadcast_to(np.asarray(risk_level if risk_level is not None else "MODERATE RISK", dtype=object), principal.shape)
+        pd = np.array([DEFAULT_PD.get(level, DEFAULT_PD["MODERATE RISK"]) for level in levels])
+    expected_loss = np.broadcast_to(np.asarray(pd, dtype=np.float64) * lgd * 100, principal.shape)
+    weights = opening_balance * accrual[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        funding_rate = (weights * (sofr[None, :] + funding_spread_bps / 100)).sum(axis=1) / weights.sum(axis=1)
+    risk_adjusted_return = (ytm - funding_rate - expected_loss) / (CAPITAL_RATIO * 100)
+
+    return {
+        "period": schedule["period"],
+        "coupon_rate": np.where(active, coupon_rate, 0.0),
+        "interest": interest,
+        "principal": schedule["principal"],
+        "cash_flow": cash_flow,
+        "discount_factor": discount_factor,
+        "all_in_rate": coupon_rate[:, 0],
+        "npv": npv,
+        "ytm": ytm,
+        "expected_loss": expected_loss,
+        "risk_adjusted_return": risk_adjusted_return
+    }
+
+def price_loan(company_data, loan_terms, risk_analysis=None, **kwargs):
+    """
+    Price one deal from its company data and generated loan terms; returns floats
+    NPV discounts at forward SOFR plus funding_spread_bps (default 0), not at the coupon rate
+    """
+    result = price_loans(
+        company_data.get("loan_amount", 0),
+        margin_bps(loan_terms),
+        tenor_years(loan_terms),
+        risk_level=(risk_analysis or {}).get("risk_level"),
+        structure=loan_terms.get("amortization", "quarterly"),
+        **kwargs
+    )
+    return {
+        name: float(result[name][0])
+        for name in ["all_in_rate", "npv", "ytm", "expected_loss", "risk_adjusted_return"]
+    }
@@ -0,0 +1,210 @@
+"""
+Incremental portfolio re-scoring
+
+When credit policy changes, only applications whose inputs changed or whose
+applicable rules changed are re-scored. For every application we remember
+the exact rule entries it hit (its revenue band with both bounds, leverage
+band, industry treatment, purpose penalty and risk level band). A new
+rulebook re-scores an application only if one of those entries no longer
+exists verbatim; since bands partition the number line, an unchanged band
+still contains the same unchanged input.
+
+Run from the project root:
+    python -m services.rescoring data/applications.json
+"""
+
+import argparse
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from services.risk_engine import calculate_risk_score
+from services.rulebook import compile_rulebook, get_active_rulebook
+from utils.helpers import load_from_json, save_to_json
+
+DEFAULT_STATE_PATH = "data/rescoring_state.json"
+DEFAULT_DELTAS_PATH = "data/rescoring_deltas.jsonl"
+
+INPUT_FIELDS = ["revenue", "loan_amount", "industry", "purpose"]
+
+def _fingerprint(value):
+    """Short stable hash of any JSON-serializable value"""
+    payload = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+def _band_fingerprints(bands, key):
+    """Fingerprint each band together with its lower and upper bound"""
+    fingerprints = []
+    lower = None
+    for band in bands:
+        fingerprints.append(_fingerprint([lower, band]))
+        lower = band[key]
+    return fingerprints
+
+
+class RuleIndex:
+    """Fingerprints of every rule entry in a compiled rulebook, for O(1) dependency checks"""
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        rulebook = compiled.rulebook
+        self.revenue_bands = _band_fingerprints(rulebook["revenue_bands"], "below")
+        self.leverage_bands = _band_fingerprints(rulebook["leverage_bands"], "max")
+        self.risk_levels = _band_fingerprints(rulebook["risk_levels"], "max_score")
+        self.entries = set(self.revenue_bands) | set(self.leverage_bands) | set(self.risk_levels)
+
+    def industry_rule(self, industry):
+        """How the rulebook treats this industry"""
+        if industry in self.compiled.high_risk_industries:
+            return _fingerprint(["high_risk", self.compiled.industry_penalty])
+        return _fingerprint(["standard"])
+
+    def purpose_rule(self, purpose):
+        """How the rulebook treats this loan purpose"""
+        return _fingerprint(self.compiled.rulebook["purpose_penalties"].get(purpose))
+
+    def dependencies(self, company_data, result):
+        """The rule entries one scored application depends on"""
+        compiled = self.compiled
+        revenue = company_data.get("revenue", 0)
+
+        deps = {
+            "revenue_band": self.revenue_bands[bisect_right(compiled.revenue_edges, revenue)],
+            "industry": self.industry_rule(company_data.get("industry", "")),
+            "purpose": self.purpose_rule(company_data.get("purpose")),
+            "risk_level": self.risk_levels[bisect_left(compiled.level_edges, result["risk_score"])]
+        }
+
+        # Same "thresholds exceeded" rule as the scorer, so NaN lands in band 0
+        if result.get("ltv") is not None:
+            band = sum(1 for edge in compiled.leverage_edges if result["ltv"] > edge)
+            deps["leverage_band"] = self.leverage_bands[band]
+
+        return deps
+
+    def still_applies(self, company_data, deps):
+        """True if every rule entry an application depended on is unchanged in this rulebook"""
+        for name, fingerprint in deps.items():
+            if name == "industry":
+                if fingerprint != self.industry_rule(company_data.get("industry", "")):
+                    return False
+            elif name == "purpose":
+                if fingerprint != self.purpose_rule(company_data.get("purpose")):
+                    return False
+            elif fingerprint not in self.entries:
+                return False
+        return True
+
+
+def _company_data(application):
+    """Applications from the approval workflow nest their inputs under company_data"""
+    return application.get("company_data", application)
+
+def rescore_portfolio(applications, rulebook=None, state_path=DEFAULT_STATE_PATH, deltas_path=DEFAULT_DELTAS_PATH):
+    """
+    Re-score only the applications affected by input or policy changes
+
+    applications is a list of dicts with an "id" plus the risk inputs (or a
+    nested "company_data"). rulebook is a rulebook dict or CompiledRulebook;
+    defaults to the active one. Score/level changes are appended to deltas_path
+    as JSON lines and the per-application dependency state is saved to state_path.
+    Returns a report with skipped vs re-scored counts.
+    """
+
+    if rulebook is None:
+        compiled = get_active_rulebook()
+    elif isinstance(rulebook, dict):
+        compiled = compile_rulebook(rulebook)
+    else:
+        compiled = rulebook
+
+    index = RuleIndex(compiled)
+    state = load_from_json(state_path) or {}
+    previous = state.get("applications", {})
+
+    report = {
+        "rulebook_version": compiled.version,
+        "total": len(applications),
+        "skipped": 0,
+        "rescored": 0,
+        "new": 0,
+        "inputs_changed": 0,
+        "rules_changed": 0,
+        "deltas": 0
+    }
+
+    tracked = {}
+    deltas = []
+    timestamp = datetime.now().isoformat()
+
+    for application in applications:
+        app_id = str(application["id"])
+        company_data = _company_data(application)
+        inputs = _fingerprint([company_data.get(field) for field in INPUT_FIELDS])
+        entry = previous.get(app_id)
+
+        if entry is None:
+            report["new"] += 1
+        elif entry["inputs"] != inputs:
+            report["inputs_changed"] += 1
+        elif not index.still_applies(company_data, entry["deps"]):
+            report["rules_changed"] += 1
+        else:
+            report["skipped"] += 1
+            tracked[app_id] = entry
+            continue
+
+        result = calculate_risk_score(company_data, compiled)
+        report["rescored"] += 1
+        tracked[app_id] = {
+            "inputs": inputs,
+            "deps": index.dependencies(company_data, result),
+            "risk_score": result["risk_score"],
+            "risk_level": result["risk_level"]
+        }
+
+        if entry is None or entry["risk_score"] != result["risk_score"] or entry["risk_level"] != result["risk_level"]:
+            deltas.append({
+                "id": app_id,
+                "timestamp": timestamp,
+                "rulebook_version": compiled.version,
+                "old_risk_score": entry["risk_score"] if entry else None,
+                "new_risk_score": result["risk_score"],
+                "old_risk_level": entry["risk_level"] if entry else None,
+                "new_risk_level": result["risk_level"]
+            })
+
+    if deltas:
+        with open(deltas_path, "a") as f:
+            for delta in deltas:
+                f.write(json.dumps(delta) + "\n")
+    report["deltas"] = len(deltas)
+
+    save_to_json(state_path, {"rulebook_version": compiled.version, "applications": tracked})
+
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally re-score stored applications")
+    parser.add_argument("applications", help="JSON file with a list of applications")
+    parser.add_argument("--rulebook", help="Rulebook JSON file (defaults to the active rulebook)")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH)
+    parser.add_argument("--deltas", default=DEFAULT_DELTAS_PATH)
+    args = parser.parse_args()
+
+    with open(args.applications, "r") as f:
+        applications = json.load(f)
+
+    rulebook = None
+    if args.rulebook:
+        with open(args.rulebook, "r") as f:
+            rulebook = json.load(f)
+
+    report = rescore_portfolio(applications, rulebook, args.state, args.deltas)
+    print(f"Rulebook {report['rulebook_version']}: {report['rescored']} re-scored, {report['skipped']} skipped "
+          f"({report['new']} new, {report['inputs_changed']} input changes, {report['rules_changed']} rule changes), "
+          f"{report['deltas']} deltas written")
+
+if __name__ == "__main__":
+    main()
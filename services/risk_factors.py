@@ -0,0 +1,59 @@
+"""Compact risk factor codes shared by the scalar and batch risk engines, and their display text"""
+
+# Slot 0 is reserved for "no factor" so code arrays can be zero-filled
+FACTOR_NONE = 0
+
+# Revenue analysis
+FACTOR_LOW_REVENUE = 1
+FACTOR_MODERATE_REVENUE = 2
+FACTOR_STRONG_REVENUE = 3
+
+# Loan-to-revenue ratio
+FACTOR_HIGH_LEVERAGE = 4
+FACTOR_MODERATE_LEVERAGE = 5
+FACTOR_CONSERVATIVE_LEVERAGE = 6
+
+# Industry risk
+FACTOR_INDUSTRY_VOLATILITY = 7
+FACTOR_INDUSTRY_STABILITY = 8
+
+# Purpose risk
+FACTOR_WORKING_CAPITAL = 9
+
+# Column order of the batch factor code matrix
+FACTOR_SLOTS = ["revenue", "leverage", "industry", "purpose"]
+
+# Display text for each code; {ltv} and {industry} come from the risk analysis
+FACTOR_TEXT = {
+    FACTOR_LOW_REVENUE: "⚠️ Low revenue base (<$10M)",
+    FACTOR_MODERATE_REVENUE: "ℹ️ Moderate revenue ($10M-$50M)",
+    FACTOR_STRONG_REVENUE: "✅ Strong revenue base (>$50M)",
+    FACTOR_HIGH_LEVERAGE: "⚠️ High loan-to-revenue ratio ({ltv:.1f}%)",
+    FACTOR_MODERATE_LEVERAGE: "ℹ️ Moderate leverage ({ltv:.1f}%)",
+    FACTOR_CONSERVATIVE_LEVERAGE: "✅ Conservative leverage ({ltv:.1f}%)",
+    FACTOR_INDUSTRY_VOLATILITY: "⚠️ {industry} sector volatility",
+    FACTOR_INDUSTRY_STABILITY: "✅ {industry} sector stability",
+    FACTOR_WORKING_CAPITAL: "ℹ️ Working capital refinancing risk"
+}
+
+def format_factor_codes(factor_codes, ltv=None, industry=""):
+    """Render factor codes to display text, skipping FACTOR_NONE slots"""
+    return [
+        FACTOR_TEXT[int(code)].format(ltv=ltv, industry=industry)
+        for code in factor_codes
+        if code != FACTOR_NONE
+    ]
+
+def format_risk_factors(risk_analysis):
+    """
+    Display text for a risk analysis result
+    Older records and demo data carry pre-rendered "risk_factors" strings; those are returned as-is
+    """
+    if "factor_codes" not in risk_analysis:
+        return risk_analysis.get("risk_factors", [])
+    
+    return format_factor_codes(
+        risk_analysis["factor_codes"],
+        risk_analysis.get("ltv"),
+        risk_analysis.get("industry", "")
+    )
@@ -0,0 +1,336 @@
+"""
+Declarative credit policy rulebook for the risk engine
+
+Credit policy lives in a versioned dict (or a JSON file with the same shape)
+and is compiled once into a generated function and lookup tables, so changing
+a threshold never touches code and the hot path never re-reads the policy.
+"""
+
+import copy
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from services import risk_factors
+
+DEFAULT_RULEBOOK = {
+    "version": "2024.1",
+    # Annual revenue in $M; the first band whose "below" exceeds revenue applies
+    "revenue_bands": [
+        {"below": 10, "points": 30, "factor": "LOW_REVENUE"},
+        {"below": 50, "points": 15, "factor": "MODERATE_REVENUE"},
+        {"below": None, "points": 0, "factor": "STRONG_REVENUE"}
+    ],
+    # Loan-to-revenue in %; the first band whose "max" is >= the ratio applies
+    "leverage_bands": [
+        {"max": 25, "points": 0, "factor": "CONSERVATIVE_LEVERAGE"},
+        {"max": 50, "points": 10, "factor": "MODERATE_LEVERAGE"},
+        {"max": None, "points": 25, "factor": "HIGH_LEVERAGE"}
+    ],
+    "high_risk_industries": ["Energy", "Hospitality", "Retail"],
+    "industry_penalty": 20,
+    "purpose_penalties": {
+        "Working Capital": {"points": 10, "factor": "WORKING_CAPITAL"}
+    },
+    # Total score; the first level whose "max_score" is >= the score applies
+    "risk_levels": [
+        {"max_score": 35, "level": "LOW RISK", "color": "🟢", "recommendation": "Proceed"},
+        {"max_score": 60, "level": "MODERATE RISK", "color": "🟡", "recommendation": "Proceed with standard terms"},
+        {"max_score": None, "level": "HIGH RISK", "color": "🔴", "recommendation": "Proceed with caution"}
+    ]
+}
+
+def load_rulebook(path=None):
+    """
+    Load a rulebook dict
+    Uses path, then the AURA_RULEBOOK_PATH environment variable, then DEFAULT_RULEBOOK
+    """
+    path = path or os.getenv("AURA_RULEBOOK_PATH")
+
+    if not path:
+        return copy.deepcopy(DEFAULT_RULEBOOK)
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _factor_code(name):
+    """Resolve a rulebook factor name such as "LOW_REVENUE" to its integer code"""
+    code = getattr(risk_factors, f"FACTOR_{name}", None)
+    if code is None:
+        raise ValueError(f"Unknown risk factor '{name}' in rulebook")
+    return code
+
+def _band_edges(bands, key):
+    """Split an ordered band list into (edges, bands); only the last band may be open-ended"""
+    edges = [band[key] for band in bands[:-1]]
+
+    if not bands or bands[-1][key] is not None:
+        raise ValueError(f"The last band must have {key}=None")
+    if None in edges or edges != sorted(edges):
+        raise ValueError(f"Band '{key}' values must be ascending")
+
+    return tuple(edges)
+
+def _emit_chain(lines, indent, branches, default):
+    """Append an if/elif/else chain of (condition, statements) branches to generated source"""
+    for i, (condition, statements) in enumerate(branches):
+        lines.append(f"{indent}{'if' if i == 0 else 'elif'} {condition}:")
+        lines.extend(f"{indent}    {statement}" for statement in statements)
+
+    if branches:
+        lines.append(f"{indent}else:")
+        indent += "    "
+    lines.extend(f"{indent}{statement}" for statement in default)
+
+
+class CompiledRulebook:
+    """
+    A rulebook compiled into a generated scoring function and lookup tables
+
+    evaluate() is Python source generated from the rulebook with every
+    threshold inlined as a constant, so the scalar path is a plain if/elif
+    chain; evaluate_batch() scores parsed column arrays with searchsorted
+    and per-category point tables.
+    """
+
+    def __init__(self, rulebook):
+        self.version = str(rulebook["version"])
+        self.rulebook = copy.deepcopy(rulebook)
+
+        revenue_bands = rulebook["revenue_bands"]
+        self.revenue_edges = _band_edges(revenue_bands, "below")
+        self.revenue_points = tuple(band["points"] for band in revenue_bands)
+        self.revenue_factors = tuple(_factor_code(band["factor"]) for band in revenue_bands)
+
+        leverage_bands = rulebook["leverage_bands"]
+        self.leverage_edges = _band_edges(leverage_bands, "max")
+        self.leverage_points = tuple(band["points"] for band in leverage_bands)
+        self.leverage_factors = tuple(_factor_code(band["factor"]) for band in leverage_bands)
+
+        self.high_risk_industries = frozenset(rulebook["high_risk_industries"])
+        self.industry_penalty = rulebook["industry_penalty"]
+
+        self.purpose_penalties = {
+            purpose: (rule["points"], _factor_code(rule["factor"]))
+            for purpose, rule in rulebook["purpose_penalties"].items()
+        }
+
+        risk_levels = rulebook["risk_levels"]
+        self.level_edges = _band_edges(risk_levels, "max_score")
+        self.levels = tuple(level["level"] for level in risk_levels)
+        self.colors = tuple(level["color"] for level in risk_levels)
+        self.recommendations = tuple(level["recommendation"] for level in risk_levels)
+
+        # NumPy copies of the tables for the batch path
+        self._revenue_edges_arr = np.array(self.revenue_edges, dtype=np.float64)
+        self._revenue_points_arr = np.array(self.revenue_points, dtype=np.int16)
+        self._revenue_factors_arr = np.array(self.revenue_factors, dtype=np.uint8)
+        self._leverage_edges_arr = np.array(self.leverage_edges, dtype=np.float64)
+        self._leverage_points_arr = np.array(self.leverage_points, dtype=np.int16)
+        self._leverage_factors_arr = np.array(self.leverage_factors, dtype=np.uint8)
+        self._level_edges_arr = np.array(self.level_edges, dtype=np.int16)
+        self._levels_arr = np.array(self.levels, dtype=object)
+
+        self.evaluate = self._generate_evaluator()
+
+    def _generate_evaluator(self):
+        """Generate evaluate(revenue, loan_amount, industry, purpose) -> (risk_score, level_index, factor_codes, ltv)"""
+
+        lines = ["def evaluate(revenue, loan_amount, industry, purpose):"]
+
+        # Revenue analysis
+        _emit_chain(lines, "    ", [
+            (f"revenue < {edge!r}", [f"risk_score = {self.revenue_points[i]!r}", f"factor_codes = [{self.revenue_factors[i]!r}]"])
+            for i, edge in enumerate(self.revenue_edges)
+        ], [f"risk_score = {self.revenue_points[-1]!r}", f"factor_codes = [{self.revenue_factors[-1]!r}]"])
+
+        # Loan-to-revenue ratio, tested from the top band down
+        lines.append("    ltv = None")
+        lines.append("    if revenue > 0:")
+        lines.append("        ltv = (loan_amount / revenue) * 100")
+        _emit_chain(lines, "        ", [
+            (f"ltv > {self.leverage_edges[i - 1]!r}", [f"risk_score += {self.leverage_points[i]!r}", f"factor_codes.append({self.leverage_factors[i]!r})"])
+            for i in range(len(self.leverage_edges), 0, -1)
+        ], [f"risk_score += {self.leverage_points[0]!r}", f"factor_codes.append({self.leverage_factors[0]!r})"])
+
+        # Industry risk
+        lines.append("    if industry in HIGH_RISK_INDUSTRIES:")
+        lines.append(f"        risk_score += {self.industry_penalty!r}")
+        lines.append(f"        factor_codes.append({risk_factors.FACTOR_INDUSTRY_VOLATILITY!r})")
+        lines.append("    else:")
+        lines.append(f"        factor_codes.append({risk_factors.FACTOR_INDUSTRY_STABILITY!r})")
+
+        # Purpose risk
+        lines.append("    penalty = PURPOSE_PENALTIES.get(purpose)")
+        lines.append("    if penalty is not None:")
+        lines.append("        risk_score += penalty[0]")
+        lines.append("        factor_codes.append(penalty[1])")
+
+        # Determine risk level, tested from the top level down
+        _emit_chain(lines, "    ", [
+            (f"risk_score > {self.level_edges[i - 1]!r}", [f"return risk_score, {i}, factor_codes, ltv"])
+            for i in range(len(self.level_edges), 0, -1)
+        ], ["return risk_score, 0, factor_codes, ltv"])
+
+        namespace = {
+            "HIGH_RISK_INDUSTRIES": self.high_risk_industries,
+            "PURPOSE_PENALTIES": self.purpose_penalties
+        }
+        self.source = "\n".join(lines)
+        exec(compile(self.source, f"<rulebook {self.version}>", "exec"), namespace)
+        return namespace["evaluate"]
+
+    def evaluate_batch(self, inputs):
+        """
+        Score columns parsed by prepare_batch_inputs(); returns a dict of arrays
+        section_points holds each rule section's contribution so callers such as
+        shadow scoring can swap in one section without re-running the others.
+        """
+
+        revenue = inputs["revenue"]
+        n = len(revenue)
+        factor_codes = np.zeros((n, len(risk_factors.FACTOR_SLOTS)), dtype=np.uint8)
+        slot = risk_factors.FACTOR_SLOTS.index
+
+        # Revenue analysis
+        revenue_points, factor_codes[:, slot("revenue")] = self.revenue_section(revenue)
+
+        # Loan-to-revenue ratio
+        has_revenue = revenue > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ltv = np.where(has_revenue, (inputs["loan_amount"] / revenue) * 100, np.nan)
+        leverage_points, factor_codes[:, slot("leverage")] = self.leverage_section(ltv, has_revenue)
+
+        # Industry and purpose risk: one lookup per distinct value, then a table gather
+        volatile, purpose_points, factor_codes[:, slot("purpose")] = self.category_tables(inputs)
+        industry_points = np.where(volatile, self.industry_penalty, 0).astype(np.int16)
+        factor_codes[:, slot("industry")] = np.where(
+            volatile, risk_factors.FACTOR_INDUSTRY_VOLATILITY, risk_factors.FACTOR_INDUSTRY_STABILITY
+        )
+
+        risk_score = revenue_points + leverage_points + industry_points + purpose_points
+
+        # Determine risk level
+        level = self.level_of(risk_score)
+
+        return {
+            "risk_score": risk_score,
+            "risk_level": self._levels_arr[level],
+            "band": level,
+            "ltv": ltv,
+            "factor_codes": factor_codes,
+            "section_points": {
+                "revenue": revenue_points,
+                "leverage": leverage_points,
+                "industry": industry_points,
+                "purpose": purpose_points
+            }
+        }
+
+    def revenue_section(self, revenue):
+        """Points and factor codes from the revenue bands"""
+        band = np.searchsorted(self._revenue_edges_arr, revenue, side="right")
+        return self._revenue_points_arr[band], self._revenue_factors_arr[band]
+
+    def leverage_section(self, ltv, has_revenue):
+        """Points and factor codes from the leverage bands; rows without revenue get neither"""
+        # Count of thresholds exceeded, so a NaN ratio lands in band 0 like the scalar path
+        band = np.zeros(ltv.shape, dtype=np.intp)
+        for edge in self.leverage_edges:
+            band += ltv > edge
+        points = np.where(has_revenue, self._leverage_points_arr[band], 0).astype(np.int16)
+        factors = np.where(has_revenue, self._leverage_factors_arr[band], risk_factors.FACTOR_NONE).astype(np.uint8)
+        return points, factors
+
+    def level_of(self, risk_score):
+        """Risk level index for an array of scores"""
+        return np.searchsorted(self._level_edges_arr, risk_score, side="left").astype(np.int8)
+
+    def category_tables(self, inputs):
+        """Per-row high-risk industry flags, purpose points and purpose factor codes for parsed inputs"""
+
+        volatile_lut = np.array(
+            [industry in self.high_risk_industries for industry in inputs["industry_uniques"]] + [False]
+        )
+
+        penalties = [self.purpose_penalties.get(purpose, (0, risk_factors.FACTOR_NONE)) for purpose in inputs["purpose_uniques"]]
+        penalties.append((0, risk_factors.FACTOR_NONE))
+        points_lut = np.array([points for points, _ in penalties], dtype=np.int16)
+        factors_lut = np.array([code for _, code in penalties], dtype=np.uint8)
+
+        return (
+            volatile_lut[inputs["industry_codes"]],
+            points_lut[inputs["purpose_codes"]],
+            factors_lut[inputs["purpose_codes"]]
+        )
+
+    def score_arrays(self, revenue, loan_amount, volatile, purpose_points):
+        """
+        Score and level only, for arrays of any broadcastable shape
+        Used by simulations that perturb inputs and need no factor codes.
+        """
+
+        risk_score = self.revenue_section(revenue)[0]
+
+        has_revenue = revenue > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ltv = (loan_amount / revenue) * 100
+        risk_score = risk_score + self.leverage_section(ltv, has_revenue)[0]
+
+        risk_score += np.where(volatile, self.industry_penalty, 0).astype(np.int16)
+        risk_score += purpose_points
+
+        level = self.level_of(risk_score)
+        return risk_score, level
+
+
+def compile_rulebook(rulebook):
+    """Compile a rulebook dict into a CompiledRulebook"""
+    return CompiledRulebook(rulebook)
+
+def prepare_batch_inputs(data):
+    """
+    Parse a DataFrame or dict of column arrays once for batch evaluation
+    Industry and purpose are factorized so rules are looked up per distinct value,
+    not per row; a missing value gets code -1, which hits the trailing table slot.
+    """
+    n = len(data["revenue"]) if "revenue" in data else len(data["loan_amount"])
+
+    def column(name, default, dtype):
+        if name not in data:
+            return np.full(n, default, dtype=dtype)
+        values = data[name]
+        if isinstance(values, pd.Series):
+            values = values.to_numpy()
+        return np.asarray(values, dtype=dtype)
+
+    industry = column("industry", "", object)
+    purpose = column("purpose", None, object)
+    industry_codes, industry_uniques = pd.factorize(industry)
+    purpose_codes, purpose_uniques = pd.factorize(purpose)
+
+    return {
+        "revenue": column("revenue", 0, np.float64),
+        "loan_amount": column("loan_amount", 0, np.float64),
+        "industry_codes": industry_codes,
+        "industry_uniques": list(industry_uniques),
+        "purpose_codes": purpose_codes,
+        "purpose_uniques": list(purpose_uniques)
+    }
+
+_active_rulebook = None
+
+def get_active_rulebook():
+    """The compiled rulebook used by the risk engine, compiled on first use"""
+    global _active_rulebook
+    if _active_rulebook is None:
+        _active_rulebook = compile_rulebook(load_rulebook())
+    return _active_rulebook
+
+def set_active_rulebook(rulebook):
+    """Compile and activate a new rulebook dict; returns the compiled rulebook"""
+    global _active_rulebook
+    _active_rulebook = compile_rulebook(rulebook)
+    return _active_rulebook
@@ -0,0 +1,155 @@
+"""
+Memoized risk scoring and loan term generation
+
+Streamlit reruns pages on every widget change, so the same company_data is
+scored over and over. These wrappers key a bounded LRU cache on a canonical
+hash of the fields each function actually reads, and drop every entry when
+the active rulebook version changes.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from services.risk_engine import calculate_risk_score
+from services.rulebook import get_active_rulebook
+from services.term_generator import generate_loan_terms
+
+DEFAULT_CACHE_SIZE = int(os.getenv("AURA_SCORING_CACHE_SIZE", "1024"))
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with hit/miss counters, tied to one rulebook version"""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """Return the cached value or None; a new rulebook version empties the cache first"""
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, version):
+        """Store a value computed under the given rulebook version"""
+        with self._lock:
+            if version != self.version:
+                return
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize):
+        """Change the maximum size, evicting least recently used entries if needed"""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "rulebook_version": self.version
+            }
+
+
+_risk_cache = LRUCache()
+_terms_cache = LRUCache()
+
+def canonical_key(fields):
+    """Stable hash of a dict of input fields; numbers are normalized so 25 and 25.0 share a key"""
+    normalized = {
+        name: float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+        for name, value in fields.items()
+    }
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+def cached_calculate_risk_score(company_data):
+    """calculate_risk_score with memoization on revenue, loan_amount, industry and purpose"""
+
+    version = get_active_rulebook().version
+    key = canonical_key({
+        "revenue": company_data.get("revenue", 0),
+        "loan_amount": company_data.get("loan_amount", 0),
+        "industry": company_data.get("industry", ""),
+        "purpose": company_data.get("purpose")
+    })
+
+    result = _risk_cache.get(key, version)
+    if result is None:
+        result = calculate_risk_score(company_data)
+        _risk_cache.put(key, result, version)
+
+    # Callers own their copy, so later edits never leak into the cache
+    return dict(result, factor_codes=list(result["factor_codes"]))
+
+def cached_generate_loan_terms(company_data, risk_analysis):
+    """generate_loan_terms with memoization on risk_score and purpose"""
+
+    version = get_active_rulebook().version
+    key = canonical_key({
+        "risk_score": risk_analysis["risk_score"],
+        "purpose": company_data.get("purpose")
+    })
+
+    result = _terms_cache.get(key, version)
+    if result is None:
+        result = generate_loan_terms(company_data, risk_analysis)
+        _terms_cache.put(key, result, version)
+
+    # The Term Sheet page overrides tenor/margin in place, so hand out a copy
+    return dict(result, covenants=list(result["covenants"]))
+
+def configure_scoring_cache(maxsize):
+    """Set the maximum number of entries for both caches"""
+    _risk_cache.resize(maxsize)
+    _terms_cache.resize(maxsize)
+
+def clear_scoring_cache():
+    """Empty both caches and reset their counters"""
+    _risk_cache.clear()
+    _terms_cache.clear()
+
+def scoring_cache_stats():
+    """Hit/miss counters for the risk and loan term caches"""
+    return {
+        "risk_score": _risk_cache.stats(),
+        "loan_terms": _terms_cache.stats()
+    }
@@ -0,0 +1,49 @@
+"""
+What-if sensitivity grids for the risk engine
+
+Evaluates every revenue x loan_amount combination (optionally across several
+industries and purposes) in one vectorized pass through the compiled rulebook.
+"""
+
+import numpy as np
+
+from services.rulebook import get_active_rulebook
+
+def risk_sensitivity_grid(revenues, loan_amounts, industries=("",), purposes=(None,), rulebook=None):
+    """
+    Score a full grid of applications at once
+    
+    Returns risk_score and band arrays shaped
+    (len(industries), len(purposes), len(loan_amounts), len(revenues)),
+    so grid["band"][0, 0] is a loan_amount x revenue heatmap.
+    """
+    
+    rulebook = rulebook or get_active_rulebook()
+    
+    revenues = np.asarray(revenues, dtype=np.float64)
+    loan_amounts = np.asarray(loan_amounts, dtype=np.float64)
+    shape = (len(industries), len(purposes), len(loan_amounts), len(revenues))
+    
+    # Every axis is already a distinct value, so the factorized inputs are just broadcast indices
+    industry_idx, purpose_idx, loan_idx, revenue_idx = np.indices(shape).reshape(4, -1)
+    inputs = {
+        "revenue": revenues[revenue_idx],
+        "loan_amount": loan_amounts[loan_idx],
+        "industry_codes": industry_idx,
+        "industry_uniques": list(industries),
+        "purpose_codes": purpose_idx,
+        "purpose_uniques": list(purposes)
+    }
+    
+    result = rulebook.evaluate_batch(inputs)
+    
+    return {
+        "revenues": revenues,
+        "loan_amounts": loan_amounts,
+        "industries": list(industries),
+        "purposes": list(purposes),
+        "risk_score": result["risk_score"].reshape(shape),
+        "band": result["band"].reshape(shape),
+        "levels": list(rulebook.levels),
+        "rulebook_version": rulebook.version
+    }
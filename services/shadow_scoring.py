@@ -0,0 +1,215 @@
+"""
+Shadow scoring: evaluate a challenger rulebook alongside the champion
+
+Inputs are parsed once and shared. The champion is scored normally; the
+challenger only recomputes the rule sections whose definitions differ from
+the champion's and reuses the champion's per-section points for the rest.
+Band disagreements go into a compact diff store (row index, both bands and
+both scores as small integer arrays) that can be saved as a .npz file and
+summarized into a report.
+"""
+
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from services.rulebook import compile_rulebook, get_active_rulebook, load_rulebook, prepare_batch_inputs
+
+# Rulebook keys that feed each score section
+SECTION_KEYS = {
+    "revenue": ["revenue_bands"],
+    "leverage": ["leverage_bands"],
+    "industry": ["high_risk_industries", "industry_penalty"],
+    "purpose": ["purpose_penalties"]
+}
+
+def changed_sections(champion, challenger):
+    """Score sections whose rule definitions differ between two compiled rulebooks"""
+    return [
+        section for section, keys in SECTION_KEYS.items()
+        if any(champion.rulebook[key] != challenger.rulebook[key] for key in keys)
+    ]
+
+
+class ShadowDiffStore:
+    """
+    Accumulates champion/challenger band disagreements as compact integer arrays
+
+    levels are the champion's risk levels; challenger_levels defaults to the
+    same list. The confusion matrix is champion levels x challenger levels,
+    so rulebooks with a different number of bands are counted correctly.
+    """
+
+    def __init__(self, champion_version, challenger_version, levels, challenger_levels=None):
+        self.champion_version = champion_version
+        self.challenger_version = challenger_version
+        self.levels = list(levels)
+        self.challenger_levels = list(challenger_levels) if challenger_levels is not None else list(levels)
+        self.rows_scored = 0
+        self.confusion = np.zeros((len(self.levels), len(self.challenger_levels)), dtype=np.int64)
+        self._chunks = []
+        # With different bands, a disagreement is a different level name, not a different index
+        self._same_levels = self.levels == self.challenger_levels
+        self._champion_names = np.array(self.levels, dtype=object)
+        self._challenger_names = np.array(self.challenger_levels, dtype=object)
+
+    def record(self, offset, champion_band, challenger_band, champion_score, challenger_score):
+        """Add one scored batch; offset is the index of its first row in the overall stream"""
+        n_champion, n_challenger = self.confusion.shape
+        self.rows_scored += len(champion_band)
+        self.confusion += np.bincount(
+            champion_band.astype(np.intp) * n_challenger + challenger_band, minlength=n_champion * n_challenger
+        ).reshape(n_champion, n_challenger)
+
+        if self._same_levels:
+            rows = np.flatnonzero(champion_band != challenger_band)
+        else:
+            rows = np.flatnonzero(self._champion_names[champion_band] != self._challenger_names[challenger_band])
+        if len(rows):
+            self._chunks.append((
+                (rows + offset).astype(np.int64),
+                champion_band[rows].astype(np.int8),
+                challenger_band[rows].astype(np.int8),
+                champion_score[rows].astype(np.int16),
+                challenger_score[rows].astype(np.int16)
+            ))
+
+    def disagreements(self):
+        """All recorded disagreements as a dict of arrays"""
+        names = ["row", "champion_band", "challenger_band", "champion_score", "challenger_score"]
+        dtypes = [np.int64, np.int8, np.int8, np.int16, np.int16]
+        if not self._chunks:
+            return {name: np.zeros(0, dtype=dtype) for name, dtype in zip(names, dtypes)}
+        return {name: np.concatenate([chunk[i] for chunk in self._chunks]) for i, name in enumerate(names)}
+
+    def save(self, path):
+        """Write the diff store to a compressed .npz file"""
+        np.savez_compressed(
+            path,
+            champion_version=self.champion_version,
+            challenger_version=self.challenger_version,
+            levels=np.array(self.levels),
+            challenger_levels=np.array(self.challenger_levels),
+            rows_scored=self.rows_scored,
+            confusion=self.confusion,
+            **self.disagreements()
+        )
+
+    def summary(self):
+        """Disagreement counts, rate and direction"""
+        diff = self.disagreements()
+        n_diff = len(diff["row"])
+        # Band position from 0 (lowest) to 1 (highest), comparable across rulebooks with different band counts
+        champion_rank = diff["champion_band"] / max(len(self.levels) - 1, 1)
+        challenger_rank = diff["challenger_band"] / max(len(self.challenger_levels) - 1, 1)
+        return {
+            "champion_version": self.champion_version,
+            "challenger_version": self.challenger_version,
+            "rows_scored": self.rows_scored,
+            "disagreements": n_diff,
+            "disagreement_rate": n_diff / self.rows_scored if self.rows_scored else 0.0,
+            "challenger_stricter": int((challenger_rank > champion_rank).sum()),
+            "challenger_looser": int((challenger_rank < champion_rank).sum()),
+            "mean_score_delta": float((diff["challenger_score"] - diff["champion_score"]).mean()) if n_diff else 0.0,
+            "confusion": {
+                champion_level: dict(zip(self.challenger_levels, (int(count) for count in row)))
+                for champion_level, row in zip(self.levels, self.confusion)
+            }
+        }
+
+
+@lru_cache(maxsize=8)
+def _compile_file(path, mtime):
+    """Load and compile a rulebook file; cached per path and modification time"""
+    return compile_rulebook(load_rulebook(path))
+
+@lru_cache(maxsize=8)
+def _compile_json(rulebook_json):
+    """Compile a rulebook from its JSON text; cached so each distinct dict is compiled once"""
+    return compile_rulebook(json.loads(rulebook_json))
+
+def _compiled(rulebook):
+    """
+    Accept a rulebook dict, a rulebook JSON path or an already compiled rulebook
+    Dicts and files are compiled once and reused, since shadow scoring runs per live request
+    """
+    if isinstance(rulebook, (str, os.PathLike)):
+        path = os.fspath(rulebook)
+        return _compile_file(path, os.path.getmtime(path))
+    if isinstance(rulebook, dict):
+        return _compile_json(json.dumps(rulebook))
+    return rulebook
+
+def shadow_score_batch(data, challenger, champion=None, store=None, offset=0):
+    """
+    Score a batch with the champion and, in the same pass, the challenger
+
+    Returns (champion_result, store). champion_result is exactly what
+    calculate_risk_scores_batch would return; disagreements go into store,
+    which is created on first use. Call repeatedly with increasing offset to
+    shadow a stream of batches into one store.
+    """
+
+    champion = _compiled(champion) if champion is not None else get_active_rulebook()
+    challenger = _compiled(challenger)
+
+    if store is None:
+        store = ShadowDiffStore(champion.version, challenger.version, champion.levels, challenger.levels)
+
+    inputs = prepare_batch_inputs(data)
+    result = champion.evaluate_batch(inputs)
+
+    # Swap in only the challenger sections that differ
+    challenger_score = result["risk_score"]
+    sections = changed_sections(champion, challenger)
+    if sections:
+        challenger_score = challenger_score.copy()
+        points = result["section_points"]
+        revenue = inputs["revenue"]
+        if "revenue" in sections:
+            challenger_score += challenger.revenue_section(revenue)[0] - points["revenue"]
+        if "leverage" in sections:
+            challenger_score += challenger.leverage_section(result["ltv"], revenue > 0)[0] - points["leverage"]
+        if "industry" in sections or "purpose" in sections:
+            volatile, purpose_points, _ = challenger.category_tables(inputs)
+            if "industry" in sections:
+                challenger_score += np.where(volatile, challenger.industry_penalty, 0).astype(np.int16) - points["industry"]
+            if "purpose" in sections:
+                challenger_score += purpose_points - points["purpose"]
+
+    if sections or champion.level_edges != challenger.level_edges:
+        challenger_band = challenger.level_of(challenger_score)
+    else:
+        challenger_band = result["band"]
+
+    store.record(offset, result["band"], challenger_band, result["risk_score"], challenger_score)
+    return result, store
+
+def shadow_calculate_risk_score(company_data, challenger, store, champion=None):
+    """
+    Live-traffic variant: champion calculate_risk_score result, with the
+    challenger evaluated by its generated scalar function and any band
+    disagreement recorded in store (the row is store.rows_scored)
+    """
+    from services.risk_engine import calculate_risk_score
+
+    champion = _compiled(champion) if champion is not None else get_active_rulebook()
+    challenger = _compiled(challenger)
+    result = calculate_risk_score(company_data, champion)
+
+    challenger_score, challenger_level, _, _ = challenger.evaluate(
+        company_data.get("revenue", 0),
+        company_data.get("loan_amount", 0),
+        company_data.get("industry", ""),
+        company_data.get("purpose")
+    )
+    champion_level = champion.levels.index(result["risk_level"])
+
+    store.record(
+        store.rows_scored,
+        np.array([champion_level]), np.array([challenger_level]),
+        np.array([result["risk_score"]]), np.array([challenger_score])
+    )
+    return result
@@ -0,0 +1,101 @@
+"""
+Loan structure optimizer over tenor x margin x amortization
+
+Every allowed combination is priced in one vectorized call per amortization
+structure (services.pricing), tested against the borrower's DSCR and leverage
+constraints and the lender's target risk-adjusted return, and the feasible
+candidates are reduced to the Pareto front of lender return versus borrower
+debt service coverage.
+"""
+
+import numpy as np
+
+from services.amortization import STRUCTURES
+from services.pricing import price_loans
+
+DEFAULT_TENORS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+DEFAULT_MARGINS_BPS = list(range(100, 505, 5))
+
+def pareto_front(objective_a, objective_b):
+    """Indices of points not dominated when maximizing both objectives, best objective_a first"""
+    if len(objective_a) == 0:
+        return np.empty(0, dtype=np.intp)
+    order = np.lexsort((-objective_b, -objective_a))
+    best_b = np.maximum.accumulate(objective_b[order])
+    # A point is on the front if its b beats every point with a higher a
+    on_front = np.concatenate([[True], objective_b[order][1:] > best_b[:-1]])
+    return order[on_front]
+
+def optimize_loan_structure(loan_amount, financial_data, risk_level="MODERATE RISK", tenors=DEFAULT_TENORS,
+                            margins_bps=DEFAULT_MARGINS_BPS, structures=tuple(STRUCTURES), min_dscr=1.2,
+                            max_leverage=5.0, target_return=0.12, curve=None):
+    """
+    Search every tenor x margin x structure for one loan
+
+    financial_data holds the borrower's current ebitda, debt_service and
+    total_debt (the Financial Ratios page inputs). DSCR is EBITDA over existing
+    debt service plus the new loan's annualized scheduled payments in its
+    heaviest period; a bullet's final principal is assumed refinanced and left
+    out. Leverage is (total debt + loan) / EBITDA at drawdown. A candidate is
+    feasible if it meets min_dscr, max_leverage and target_return (RAROC).
+
+    Returns the full candidate grid as arrays and "pareto", the feasible
+    candidates that no other feasible candidate beats on both risk-adjusted
+    return and minimum DSCR, highest return first.
+    """
+
+    ebitda = financial_data.get("ebitda", 0)
+    existing_service = financial_data.get("debt_service", 0)
+    leverage = (financial_data.get("total_debt", 0) + loan_amount) / ebitda if ebitda > 0 else np.inf
+
+    tenor_grid, margin_grid = np.meshgrid(np.asarray(tenors, dtype=np.float64), np.asarray(margins_bps, dtype=np.float64), indexing="ij")
+    tenor_grid = tenor_grid.ravel()
+    margin_grid = margin_grid.ravel()
+
+    columns = {"tenor_years": [], "margin_bps": [], "structure": [], "min_dscr": [], "ytm": [], "risk_adjusted_return": []}
+
+    for structure in structures:
+        priced = price_loans(loan_amount, margin_grid, tenor_grid, risk_level, structure=structure, curve=curve)
+        periods_per_year = 12 // STRUCTURES[structure][0]
+
+        service = priced["interest"] if STRUCTURES[structure][1] == "bullet" else priced["cash_flow"]
+        peak_service = existing_service + service.max(axis=1) * periods_per_year
+        with np.errstate(divide="ignore"):
+            dscr = np.where(peak_service > 0, ebitda / peak_service, np.inf)
+
+        columns["tenor_years"].append(tenor_grid)
+        columns["margin_bps"].append(margin_grid)
+        columns["structure"].append(np.full(len(tenor_grid), structure, dtype=object))
+        columns["min_dscr"].append(dscr)
+        columns["ytm"].append(priced["ytm"])
+        columns["risk_adjusted_return"].append(priced["risk_adjusted_return"])
+
+    candidates = {name: np.concatenate(values) for name, values in columns.items()}
+    candidates["feasible"] = (
+        (candidates["min_dscr"] >= min_dscr)
+        & (leverage <= max_leverage)
+        & (candidates["risk_adjusted_return"] >= target_return)
+    )
+
+    feasible = np.flatnonzero(candidates["feasible"])
+    front = feasible[pareto_front(candidates["risk_adjusted_return"][feasible], candidates["min_dscr"][feasible])]
+
+    pareto = [
+        {
+            "tenor_years": int(candidates["tenor_years"][i]) if float(candidates["tenor_years"][i]).is_integer() else float(candidates["tenor_years"][i]),
+            "margin_bps": int(candidates["margin_bps"][i]),
+            "structure": candidates["structure"][i],
+            "min_dscr": float(candidates["min_dscr"][i]),
+            "ytm": float(candidates["ytm"][i]),
+            "risk_adjusted_return": float(candidates["risk_adjusted_return"][i])
+        }
+        for i in front
+    ]
+
+    return {
+        "candidates": candidates,
+        "leverage": float(leverage),
+        "n_candidates": len(candidates["feasible"]),
+        "n_feasible": len(feasible),
+        "pareto": pareto
+    }
@@ -5,19 +5,19 @@ def generate_loan_terms(company_data, risk_analysis):
     
     # Determine tenor
     if risk_score > 60:
-        tenor = "3 years"
+        tenor_years = 3
     elif risk_score > 35:
-        tenor = "5 years"
+        tenor_years = 5
     else:
-        tenor = "7 years"
+        tenor_years = 7
     
     # Determine interest margin
     if risk_score > 60:
-        margin = "SOFR + 350 bps"
+        margin_bps = 350
     elif risk_score > 35:
-        margin = "SOFR + 250 bps"
+        margin_bps = 250
     else:
-        margin = "SOFR + 175 bps"
+        margin_bps = 175
     
     # Base covenants
     covenants = ["Debt Service Coverage Ratio (DSCR) > 1.2x"]
@@ -39,8 +39,10 @@ def generate_loan_terms(company_data, risk_analysis):
         covenants.append("Inventory turnover monitoring")
     
     return {
-        "tenor": tenor,
-        "interest_margin": margin,
+        "tenor": f"{tenor_years} years",
+        "interest_margin": f"SOFR + {margin_bps} bps",
+        "tenor_years": tenor_years,
+        "margin_bps": margin_bps,
         "amortization": "Quarterly principal payments",
         "collateral": "First lien on all company assets",
         "covenants": covenants
@@ -0,0 +1,50 @@
+"""
+Input format detection of the batch term sheet loader
+"""
+
+import json
+
+import pytest
+
+from services.batch_term_sheets import _load_applications, json_records_kind
+
+APPLICATION = {"company_name": "ABC Manufacturing Corp", "industry": "Manufacturing", "revenue": 25.0, "loan_amount": 8.0, "purpose": "Working Capital"}
+# As the Approval Workflow page records them
+APPROVAL = {"id": 1, "status": "Approved", "company_data": APPLICATION}
+# As the Dashboard demo generator writes them: approvals without application data
+DEMO_APPROVAL = {"id": "LOAN-2026-1001", "company": "Tech Innovations Inc", "loan_amount": 0.5, "status": "Approved"}
+
+def write_json(tmp_path, records):
+    path = tmp_path / "input.json"
+    path.write_text(json.dumps(records))
+    return str(path)
+
+def test_kind_checks_every_record():
+    assert json_records_kind([APPLICATION, dict(APPLICATION, company_name="Harbor Hotels LLC")]) == "applications"
+    assert json_records_kind([APPROVAL, dict(APPROVAL, status="Rejected"), DEMO_APPROVAL]) == "approvals"
+    assert json_records_kind([]) == "applications"
+
+@pytest.mark.parametrize("records, message", [
+    ([APPLICATION, APPROVAL], "mixes approval records and raw applications"),
+    ([DEMO_APPROVAL, APPLICATION], "mixes approval records and raw applications"),
+    ([APPLICATION, {"id": 7}], "record 1: neither an approval"),
+    ([APPLICATION, ["not", "an", "object"]], "record 1: expected a JSON object"),
+    ({"company_name": "ABC"}, "expected a JSON list")
+])
+def test_kind_rejects_mixed_and_unknown_shapes(records, message):
+    with pytest.raises(ValueError, match=message):
+        json_records_kind(records)
+
+def test_approvals_file_is_filtered_by_status(tmp_path):
+    rejected = {"status": "Rejected", "company_data": dict(APPLICATION, company_name="Declined Co")}
+    path = write_json(tmp_path, [DEMO_APPROVAL, rejected, APPROVAL])
+    assert _load_applications(path) == [APPLICATION]
+
+def test_demo_approvals_file_fails_clearly(tmp_path):
+    path = write_json(tmp_path, [DEMO_APPROVAL, dict(DEMO_APPROVAL, status="Pending Review")])
+    with pytest.raises(ValueError, match="no Approved records with company_data"):
+        _load_applications(path)
+
+def test_raw_applications_file_is_used_as_is(tmp_path):
+    path = write_json(tmp_path, [APPLICATION])
+    assert _load_applications(path) == [APPLICATION]
@@ -0,0 +1,49 @@
+"""
+Covenant projection per amortization structure
+
+A healthy borrower must not breach under any structure; a bullet's final
+principal is assumed refinanced, as in the structure optimizer.
+"""
+
+import numpy as np
+import pytest
+
+from services.amortization import STRUCTURES
+from services.covenant_projection import project_covenant_headroom
+
+FINANCIALS = {"ebitda": 20.0, "debt_service": 2.0, "total_debt": 10.0, "ebit": 15.0, "interest_expense": 1.0}
+COVENANTS = ["Debt Service Coverage Ratio (DSCR) > 1.2x", "Maximum Debt/EBITDA < 3.5x", "Interest Coverage > 2.0x"]
+
+def project(structure, **kwargs):
+    return project_covenant_headroom(FINANCIALS, 10.0, 6.5, 5, COVENANTS, structure=structure, **kwargs)
+
+@pytest.mark.parametrize("structure", list(STRUCTURES))
+def test_healthy_borrower_never_breaches(structure):
+    projection = project(structure)
+    assert projection["summary"]["breach_probability"] == 0.0
+    assert not projection["first_breach_period"].any()
+
+def test_bullet_debt_service_excludes_the_balloon():
+    flat = np.ones((1, 20))
+    bullet = project("bullet", n_scenarios=1, growth=flat)
+    quarterly = project("quarterly", n_scenarios=1, growth=flat)
+
+    # 10M at 6.5%: 0.1625 interest a quarter, 0.65 a year, on top of the existing 2.0
+    np.testing.assert_allclose(bullet["ratios"]["dscr"][0], 20.0 / 2.65)
+    # Amortizing service includes principal, so its coverage is lower until the balance runs down
+    assert quarterly["ratios"]["dscr"][0, 0] < bullet["ratios"]["dscr"][0, 0]
+    assert quarterly["ratios"]["dscr"][0, -1] < bullet["ratios"]["dscr"][0, -1]
+
+def test_amortizing_debt_service_is_the_annualized_scheduled_payment():
+    monthly = project("monthly", n_scenarios=1, growth=np.ones((1, 60)))
+    quarterly = project("quarterly", n_scenarios=1, growth=np.ones((1, 20)))
+
+    # Level monthly payment on 10M at 6.5% over 60 months
+    rate = 0.065 / 12
+    payment = 10.0 * rate / (1 - (1 + rate) ** -60)
+    np.testing.assert_allclose(monthly["ratios"]["dscr"][0], 20.0 / (2.0 + payment * 12))
+
+    # Equal quarterly principal of 0.5 plus interest on the opening balance
+    opening_balance = 10.0 - 0.5 * np.arange(20)
+    service = 0.5 + opening_balance * 0.065 / 4
+    np.testing.assert_allclose(quarterly["ratios"]["dscr"][0], 20.0 / (2.0 + service * 4))
@@ -0,0 +1,48 @@
+"""
+Cached term sheets carry no generation time or document ID
+"""
+
+import re
+import zlib
+
+from services.pdf_cache import cached_term_sheet_pdf, configure_pdf_cache
+from services.risk_engine import calculate_risk_score
+from services.term_generator import generate_loan_terms
+from utils.pdf_generator import generate_term_sheet_pdf
+
+APPLICATION = {"company_name": "ABC Manufacturing Corp", "industry": "Manufacturing", "revenue": 25.0, "loan_amount": 8.0, "purpose": "Working Capital"}
+
+def page_text(pdf_bytes):
+    """Content stream text of a PDF, inflating compressed streams"""
+    text = []
+    for stream in re.findall(rb"stream\r?\n(.*?)endstream", pdf_bytes, re.S):
+        try:
+            stream = zlib.decompress(stream)
+        except zlib.error:
+            pass
+        text.append(stream.decode("latin-1"))
+    return "".join(text)
+
+def term_sheet_args():
+    risk_analysis = calculate_risk_score(APPLICATION)
+    loan_terms = generate_loan_terms(APPLICATION, risk_analysis)
+    return APPLICATION["company_name"], APPLICATION["industry"], APPLICATION["loan_amount"], APPLICATION["purpose"], risk_analysis, loan_terms
+
+def test_cached_term_sheet_has_no_document_id(tmp_path):
+    configure_pdf_cache(cache_dir=str(tmp_path))
+    try:
+        first = cached_term_sheet_pdf(*term_sheet_args()).getvalue()
+        second = cached_term_sheet_pdf(*term_sheet_args()).getvalue()
+    finally:
+        configure_pdf_cache()
+
+    assert first == second
+    text = page_text(first)
+    assert "Document ID" not in text and "AURA-20" not in text
+    assert "Generated:" not in text and "Document generated on" not in text
+    assert "DRAFT - FOR DISCUSSION PURPOSES ONLY" in text
+
+def test_uncached_term_sheet_is_stamped():
+    text = page_text(generate_term_sheet_pdf(*term_sheet_args(), profile="fast").getvalue())
+    assert "Document ID" in text and "AURA-20" in text
+    assert "Document generated on" in text
@@ -0,0 +1,90 @@
+"""
+Every PDF output profile renders a real term sheet and credit book
+
+The embedded profile is only offered when AURA_PDF_FONT_PATH points to a
+TrueType font, so it is exercised in a subprocess with the Vera font that
+ships with ReportLab.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+import reportlab
+
+from services.risk_engine import calculate_risk_score
+from services.term_generator import generate_loan_terms
+from utils.pdf_generator import PDF_PROFILES, generate_portfolio_report_pdf, generate_term_sheet_pdf
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VERA_FONT = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf")
+
+APPLICATIONS = [
+    {"company_name": "ABC Manufacturing Corp", "industry": "Manufacturing", "revenue": 25.0, "loan_amount": 8.0, "purpose": "Working Capital"},
+    {"company_name": "Harbor Hotels LLC", "industry": "Hospitality", "revenue": 8.0, "loan_amount": 6.5, "purpose": "Refinancing"}
+]
+
+def make_deals():
+    deals = []
+    for company_data in APPLICATIONS:
+        risk_analysis = calculate_risk_score(company_data)
+        deals.append((company_data, risk_analysis, generate_loan_terms(company_data, risk_analysis)))
+    return deals
+
+def render_term_sheet(profile):
+    company_data, risk_analysis, loan_terms = make_deals()[0]
+    return generate_term_sheet_pdf(
+        company_data["company_name"], company_data["industry"], company_data["loan_amount"], company_data["purpose"],
+        risk_analysis, loan_terms, profile=profile
+    ).getvalue()
+
+def run_with_font(font_path, code):
+    env = dict(os.environ, AURA_PDF_FONT_PATH=font_path)
+    return subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+
+@pytest.mark.parametrize("profile", list(PDF_PROFILES))
+def test_term_sheet_renders_with_each_profile(profile):
+    pdf = render_term_sheet(profile)
+    assert pdf.startswith(b"%PDF-")
+    assert pdf.rstrip().endswith(b"%%EOF")
+    assert b"/Type /Page" in pdf
+
+@pytest.mark.parametrize("profile", list(PDF_PROFILES))
+def test_credit_book_renders_with_each_profile(profile, tmp_path):
+    path = tmp_path / f"credit_book_{profile}.pdf"
+    pages = generate_portfolio_report_pdf(make_deals(), str(path), profile=profile)
+    assert pages >= 2
+    assert path.read_bytes().startswith(b"%PDF-")
+
+def test_fast_profile_leaves_page_content_uncompressed():
+    assert b"/FlateDecode" not in render_term_sheet("fast")
+    assert b"/FlateDecode" in render_term_sheet("compact")
+
+def test_embedded_profile_is_not_offered_without_a_font(tmp_path):
+    result = run_with_font(str(tmp_path / "missing.ttf"), "from utils.pdf_generator import PDF_PROFILES; print(sorted(PDF_PROFILES))")
+    assert result.returncode == 0, result.stderr
+    assert "embedded" not in result.stdout
+
+    cli = run_with_font(
+        str(tmp_path / "missing.ttf"),
+        "import sys; from services.batch_term_sheets import main; "
+        "sys.argv = ['batch_term_sheets', 'in.jsonl', 'out.zip', '--profile', 'embedded']; main()"
+    )
+    assert cli.returncode == 2
+    assert "invalid choice: 'embedded'" in cli.stderr
+
+def test_embedded_profile_renders_with_a_configured_font(tmp_path):
+    code = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})
+from test_pdf_profiles import render_term_sheet
+from utils.pdf_generator import PDF_PROFILES
+assert "embedded" in PDF_PROFILES
+open({str(tmp_path / "embedded.pdf")!r}, "wb").write(render_term_sheet("embedded"))
+"""
+    result = run_with_font(VERA_FONT, code)
+    assert result.returncode == 0, result.stderr
+    pdf = (tmp_path / "embedded.pdf").read_bytes()
+    assert pdf.startswith(b"%PDF-")
+    assert b"/FontFile2" in pdf
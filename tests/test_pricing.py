@@ -0,0 +1,53 @@
+"""
+Pricing on a flat SOFR curve, checked against hand-computed values
+
+With 30/360 quarterly accrual every period is exactly 0.25 years, so the
+cash flows and discount factors have closed forms.
+"""
+
+import pytest
+
+from services.pricing import ForwardCurve, price_loan, price_loans
+
+SOFR = 4.0
+FLAT_CURVE = ForwardCurve([0.0, 30.0], [SOFR, SOFR])
+
+def test_bullet_npv_on_flat_curve_is_the_discounted_margin():
+    # 10M bullet, 5 years quarterly, SOFR 4% + 250 bps, discounted at SOFR (no funding spread)
+    principal, margin, periods = 10.0, 250, 20
+    coupon = principal * (SOFR + margin / 100) / 100 * 0.25
+    per_period_discount = 1 + SOFR / 100 * 0.25
+    pv = coupon * (1 - per_period_discount ** -periods) / (SOFR / 100 * 0.25) + principal * per_period_discount ** -periods
+    expected_npv = pv - principal  # 0.1625 * 18.04555 + 10 * 0.81954 - 10 = 1.12785
+
+    result = price_loans(principal, margin, 5, structure="bullet", curve=FLAT_CURVE)
+
+    assert expected_npv == pytest.approx(1.127847, abs=1e-6)
+    assert result["npv"][0] == pytest.approx(expected_npv, rel=1e-12)
+    assert result["ytm"][0] == pytest.approx(SOFR + margin / 100, rel=1e-9)
+
+def test_amortizing_npv_on_flat_curve_matches_hand_computation():
+    # 10M, 250 bps, 3 years of equal quarterly principal repayments
+    principal, margin, periods = 10.0, 250, 12
+    repayment = principal / periods
+    expected_npv = -principal
+    for k in range(1, periods + 1):
+        opening_balance = principal - repayment * (k - 1)
+        cash_flow = opening_balance * (SOFR + margin / 100) / 100 * 0.25 + repayment
+        expected_npv += cash_flow / (1 + SOFR / 100 * 0.25) ** k
+
+    result = price_loans(principal, margin, 3, structure="quarterly", curve=FLAT_CURVE)
+
+    assert expected_npv > 0
+    assert result["npv"][0] == pytest.approx(expected_npv, rel=1e-12)
+
+def test_npv_is_zero_only_when_margin_equals_funding_spread():
+    result = price_loans(10.0, 250, 5, structure="quarterly", funding_spread_bps=250, curve=FLAT_CURVE)
+    assert result["npv"][0] == pytest.approx(0.0, abs=1e-9)
+
+def test_price_loan_reads_term_sheet_fields():
+    loan_terms = {"interest_margin": "SOFR + 250 bps", "tenor": "5 years", "amortization": "Quarterly principal payments"}
+    single = price_loan({"loan_amount": 10.0}, loan_terms, {"risk_level": "MODERATE RISK"}, curve=FLAT_CURVE)
+    batch = price_loans(10.0, 250, 5, risk_level="MODERATE RISK", structure="quarterly", curve=FLAT_CURVE)
+    assert single["npv"] == pytest.approx(float(batch["npv"][0]))
+    assert single["all_in_rate"] == pytest.approx(SOFR + 2.5)
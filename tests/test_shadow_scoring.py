@@ -0,0 +1,47 @@
+"""
+Challenger rulebooks passed as dicts or paths are compiled once
+"""
+
+import copy
+import json
+import os
+
+from services.rulebook import DEFAULT_RULEBOOK
+from services.shadow_scoring import ShadowDiffStore, _compiled, shadow_calculate_risk_score
+
+APPLICATION = {"company_name": "ABC Manufacturing Corp", "industry": "Manufacturing", "revenue": 25.0, "loan_amount": 8.0, "purpose": "Working Capital"}
+
+def challenger_rulebook():
+    rulebook = copy.deepcopy(DEFAULT_RULEBOOK)
+    rulebook["version"] = "challenger"
+    rulebook["industry_penalty"] += 5
+    return rulebook
+
+def test_dict_challenger_is_compiled_once():
+    rulebook = challenger_rulebook()
+    compiled = _compiled(rulebook)
+    assert _compiled(copy.deepcopy(rulebook)) is compiled
+
+    rulebook["industry_penalty"] += 5
+    assert _compiled(rulebook) is not compiled
+
+def test_path_challenger_is_recompiled_only_when_the_file_changes(tmp_path):
+    path = tmp_path / "challenger.json"
+    path.write_text(json.dumps(challenger_rulebook()))
+    compiled = _compiled(str(path))
+    assert _compiled(path) is compiled
+
+    changed = challenger_rulebook()
+    changed["version"] = "challenger-2"
+    path.write_text(json.dumps(changed))
+    os.utime(path, (0, os.path.getmtime(path) + 10))
+    assert _compiled(str(path)).version == "challenger-2"
+
+def test_live_shadow_scoring_accepts_a_dict_challenger():
+    rulebook = challenger_rulebook()
+    challenger = _compiled(rulebook)
+    store = ShadowDiffStore("2024.1", challenger.version, challenger.levels)
+    for _ in range(3):
+        result = shadow_calculate_risk_score(dict(APPLICATION), rulebook, store)
+    assert store.rows_scored == 3
+    assert "risk_score" in result
@@ -0,0 +1,33 @@
+"""
+The stress test CLI loads the approved deals from an approvals file
+"""
+
+import json
+
+from services.stress_test import load_approved_book, run_stress_test
+
+APPROVALS = [
+    {"status": "Approved", "company_data": {"company_name": "ABC Manufacturing Corp", "industry": "Manufacturing", "revenue": 25.0, "loan_amount": 8.0, "purpose": "Working Capital"}},
+    {"status": "Approved", "company_data": {"company_name": "Harbor Hotels LLC", "industry": "Hospitality", "revenue": "8", "loan_amount": 6.5, "purpose": "Refinancing"}},
+    {"status": "Approved", "company_data": {"company_name": "Bad Revenue Ltd", "industry": "Retail", "revenue": "nan", "loan_amount": 2.0}},
+    {"status": "Rejected", "company_data": {"company_name": "Declined Co", "industry": "Retail", "revenue": 5.0, "loan_amount": 4.0}},
+    {"status": "Approved", "company": "Dashboard demo record without company_data"}
+]
+
+def test_load_approved_book(tmp_path):
+    path = tmp_path / "pending_approvals.json"
+    path.write_text(json.dumps(APPROVALS))
+
+    loans, invalid = load_approved_book(str(path))
+
+    assert loans == {
+        "revenue": [25.0, 8.0],
+        "loan_amount": [8.0, 6.5],
+        "industry": ["Manufacturing", "Hospitality"],
+        "purpose": ["Working Capital", "Refinancing"]
+    }
+    assert invalid == 1
+
+    result = run_stress_test(loans, n_scenarios=50, max_workers=1)
+    assert result["n_loans"] == 2
+    assert result["summary"]["total_exposure"] == 14.5
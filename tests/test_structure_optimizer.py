@@ -0,0 +1,36 @@
+"""
+Pareto front of the loan structure optimizer
+"""
+
+import numpy as np
+
+from services.structure_optimizer import optimize_loan_structure, pareto_front
+
+def test_pareto_front_keeps_only_undominated_points():
+    objective_a = np.array([0.10, 0.20, 0.15, 0.20, 0.05])
+    objective_b = np.array([3.0, 1.0, 2.0, 0.5, 2.5])
+    # 0.20/0.5 is dominated by 0.20/1.0 and 0.05/2.5 by 0.10/3.0
+    assert pareto_front(objective_a, objective_b).tolist() == [1, 2, 0]
+
+def test_pareto_front_of_nothing_is_empty():
+    front = pareto_front(np.array([]), np.array([]))
+    assert front.dtype == np.intp
+    assert len(front) == 0
+
+def test_feasible_structures_form_a_front():
+    result = optimize_loan_structure(10.0, {"ebitda": 20.0, "debt_service": 2.0, "total_debt": 10.0})
+    pareto = result["pareto"]
+
+    assert result["n_feasible"] > 0
+    assert pareto
+    returns = [candidate["risk_adjusted_return"] for candidate in pareto]
+    dscrs = [candidate["min_dscr"] for candidate in pareto]
+    # Highest return first, and each step down in return buys more coverage
+    assert returns == sorted(returns, reverse=True)
+    assert all(later > earlier for earlier, later in zip(dscrs, dscrs[1:]))
+    assert all(candidate["min_dscr"] >= 1.2 and candidate["risk_adjusted_return"] >= 0.12 for candidate in pareto)
+
+def test_no_feasible_structure_returns_an_empty_front():
+    result = optimize_loan_structure(15.0, {"ebitda": 1.0, "debt_service": 3.0, "total_debt": 30.0})
+    assert result["n_feasible"] == 0
+    assert result["pareto"] == []
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+import json
+
+AUDIT_LOG_PATH = "data/audit_log.json"
+
+def load_audit_log(path=AUDIT_LOG_PATH):
+    """Load audit log entries, or an empty list if the file is missing or unreadable"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def period_cutoff(date_filter, now=None):
+    """Earliest timestamp included by a Time Period option, or None for All Time"""
+    now = now or datetime.now()
+
+    if date_filter == "Today":
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif date_filter == "Last 7 Days":
+        return now - timedelta(days=7)
+    elif date_filter == "Last 30 Days":
+        return now - timedelta(days=30)
+    return None
+
+def filter_audit_log(audit_log, user=None, action=None, date_filter="All Time", newest_first=True, now=None):
+    """Filter audit entries by user, action and time period, then sort by timestamp"""
+
+    filtered_log = audit_log
+
+    if user is not None:
+        filtered_log = [log for log in filtered_log if log["user"] == user]
+
+    if action is not None:
+        filtered_log = [log for log in filtered_log if log["action"] == action]
+
+    # ISO timestamps sort and compare chronologically as strings
+    cutoff = period_cutoff(date_filter, now)
+    if cutoff is not None:
+        cutoff = cutoff.isoformat()
+        filtered_log = [log for log in filtered_log if log["timestamp"] >= cutoff]
+
+    return sorted(filtered_log, key=lambda x: x["timestamp"], reverse=newest_first)
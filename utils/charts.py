@@ -0,0 +1,75 @@
+import numpy as np
+import plotly.graph_objects as go
+
+# Colors per risk band, matching utils.helpers.get_risk_color
+BAND_COLORS = ["#28a745", "#ffc107", "#dc3545"]
+
+def risk_band_heatmap(scores, bands, revenues, loan_amounts, levels, current=None):
+    """Heatmap of risk bands over revenue (x) and loan amount (y), with scores on hover"""
+    
+    n_bands = len(levels)
+    # Discrete colorscale: one flat color block per band
+    colorscale = []
+    for i in range(n_bands):
+        color = BAND_COLORS[min(i, len(BAND_COLORS) - 1)]
+        colorscale.append([i / n_bands, color])
+        colorscale.append([(i + 1) / n_bands, color])
+    
+    fig = go.Figure(go.Heatmap(
+        z=bands,
+        x=revenues,
+        y=loan_amounts,
+        customdata=scores,
+        zmin=-0.5,
+        zmax=n_bands - 0.5,
+        colorscale=colorscale,
+        colorbar=dict(tickvals=list(range(n_bands)), ticktext=list(levels), title="Risk Band"),
+        hovertemplate="Revenue: $%{x:.1f}M<br>Loan: $%{y:.1f}M<br>Score: %{customdata}<extra></extra>"
+    ))
+    
+    if current:
+        fig.add_trace(go.Scatter(
+            x=[current[0]],
+            y=[current[1]],
+            mode="markers",
+            marker=dict(symbol="x", size=14, color="black"),
+            name="Current application",
+            hovertemplate="Current application<extra></extra>"
+        ))
+    
+    fig.update_layout(
+        xaxis_title="Annual Revenue ($M)",
+        yaxis_title="Loan Amount ($M)",
+        height=450,
+        margin=dict(t=20, b=0, l=0, r=0),
+        showlegend=False
+    )
+    
+    return fig
+
+def ratio_projection_fan(periods, ratio_paths, threshold, ratio_label, periods_per_year=4):
+    """Median and 5th-95th percentile band of a projected ratio across scenarios, with the covenant line"""
+    
+    years = np.asarray(periods) / periods_per_year
+    # Undefined ratios (no debt service) are excluded from the percentiles
+    values = np.ma.filled(np.ma.asarray(ratio_paths, dtype=float), np.nan)
+    p5, p50, p95 = np.nanpercentile(values, [5, 50, 95], axis=0)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=years, y=p95, mode="lines", line=dict(width=0), showlegend=False, hoverinfo="skip"))
+    fig.add_trace(go.Scatter(
+        x=years, y=p5, mode="lines", line=dict(width=0), fill="tonexty",
+        fillcolor="rgba(31, 71, 136, 0.2)", name="5th-95th percentile"
+    ))
+    fig.add_trace(go.Scatter(x=years, y=p50, mode="lines", line=dict(color="darkblue", width=2), name="Median"))
+    fig.add_hline(y=threshold, line=dict(color="red", width=2, dash="dash"), annotation_text=f"Covenant {threshold:.2f}x")
+    
+    fig.update_layout(
+        xaxis_title="Years from Drawdown",
+        yaxis_title=f"{ratio_label} (x)",
+        height=400,
+        margin=dict(t=20, b=0, l=0, r=0),
+        legend=dict(orientation="h", y=1.1)
+    )
+    
+    return fig
@@ -1,202 +1,631 @@
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, KeepTogether, Image
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFName, PDFStream
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.lib import colors
+from PIL import Image as PILImage
+from xml.sax.saxutils import escape
 from datetime import datetime
+from functools import lru_cache, partial
+import copy
 import io
+import os
+import re
+import zlib
 
-def generate_term_sheet_pdf(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms):
-    """Generate professional bank-style PDF term sheet"""
+# Bump whenever the layout or content of a generated document changes, so cached PDFs are rebuilt
+TEMPLATE_VERSION = "2"
+
+BRAND_COLOR = colors.HexColor("#1f4788")
+PAGE_MARGIN = 50
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+LOGO_PATH = os.getenv("AURA_PDF_LOGO_PATH", os.path.join(ASSETS_DIR, "logo.png"))
+LOGO_WIDTH = 1.2 * inch
+
+# TrueType fonts for the "embedded" font setting; bold falls back to the regular face
+FONT_PATH = os.getenv("AURA_PDF_FONT_PATH", os.path.join(ASSETS_DIR, "fonts", "AURASans.ttf"))
+BOLD_FONT_PATH = os.getenv("AURA_PDF_BOLD_FONT_PATH", os.path.join(ASSETS_DIR, "fonts", "AURASans-Bold.ttf"))
+
+# Output profiles
+#   compression: None keeps ReportLab's default (deflate + ASCII85 text encoding), 0 writes page
+#                content uncompressed, 1-9 deflates binary page streams at that zlib level
+#   fonts:       "standard" uses the base-14 fonts every viewer has (nothing embedded),
+#                "embedded" embeds subsets of the TrueType fonts above
+#   image_dpi:   images such as the logo are downsampled to at most this resolution
+# Run python -m benchmarks.bench_pdf_profiles for size and build time per profile.
+PDF_PROFILES = {
+    "standard": {"compression": None, "fonts": "standard", "image_dpi": 300},
+    "fast": {"compression": 0, "fonts": "standard", "image_dpi": 150},
+    "compact": {"compression": 9, "fonts": "standard", "image_dpi": 96}
+}
+# No font ships with the app, so the embedded profile is only offered when one is configured
+if os.path.exists(FONT_PATH):
+    PDF_PROFILES["embedded"] = {"compression": 9, "fonts": "embedded", "image_dpi": 150}
+DEFAULT_PROFILE = os.getenv("AURA_PDF_PROFILE", "standard")
+
+STANDARD_FONTS = {"regular": "Helvetica", "bold": "Helvetica-Bold"}
+
+TERM_SHEET_DISCLAIMER = """
+<b>IMPORTANT DISCLAIMER:</b><br/>
+This term sheet is indicative only and does not constitute a commitment to lend. Final terms are subject to
+satisfactory completion of due diligence, credit approval, documentation, and fulfillment of conditions precedent.
+This document is confidential and intended solely for the use of the addressee. AURA AI system recommendations
+are for guidance purposes and all credit decisions require human oversight and approval.
+"""
+
+INTERNAL_DISCLAIMER = """
+<b>INTERNAL USE ONLY:</b><br/>
+This document is prepared for credit committee review and does not constitute a commitment to lend.
+Risk scores and recommendations are generated by the AURA AI system for guidance purposes; all credit
+decisions require human oversight and approval.
+"""
+
+# Document types: title line and the disclaimer that closes the document
+DOCUMENT_TYPES = {
+    "term_sheet": {"title": "CONFIDENTIAL TERM SHEET", "disclaimer": TERM_SHEET_DISCLAIMER},
+    "credit_memo": {"title": "CREDIT MEMORANDUM", "disclaimer": INTERNAL_DISCLAIMER},
+    "portfolio_report": {"title": "PORTFOLIO CREDIT REPORT", "disclaimer": INTERNAL_DISCLAIMER}
+}
+
+
+class StaticParagraph(Paragraph):
+    """
+    Paragraph whose line breaking is shared between documents
+
+    Boilerplate text is laid out the same way in every document, so the
+    result of wrap() is remembered per available width and reused by every
+    copy of the fragment instead of breaking the lines again.
+    """
+
+    def __init__(self, *args, **kwargs):
+        Paragraph.__init__(self, *args, **kwargs)
+        self._layouts = {}
+
+    def wrap(self, availWidth, availHeight):
+        layout = self._layouts.get(availWidth)
+        if layout is None:
+            Paragraph.wrap(self, availWidth, availHeight)
+            self._layouts[availWidth] = (self.blPara, self._wrapWidths, self.height)
+        else:
+            self.width = availWidth
+            self.blPara, self._wrapWidths, self.height = layout
+        return self.width, self.height
+
+class StreamingCanvas(Canvas):
+    """
+    Canvas that compresses each page's content stream as soon as the page is done
+
+    ReportLab keeps every page in memory until save() and normally compresses
+    (and ASCII85-encodes) them only then; deflating at showPage() keeps what
+    is held per page close to its final size in the file, and lets each
+    document choose its own zlib level.
+    """
+
+    def __init__(self, *args, compression_level=6, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.compression_level = compression_level
+
+    def showPage(self):
+        Canvas.showPage(self)
+        page = self._doc.Pages.pages[-1]
+        if page.stream and not page.Contents:
+            contents = PDFStream(content=zlib.compress(page.stream.encode("utf8"), self.compression_level))
+            # A preset Filter tells ReportLab the content is already encoded
+            contents.dictionary["Filter"] = PDFArray([PDFName("FlateDecode")])
+            page.Contents = contents
+            page.stream = None
+
+
+class DocumentTemplate:
+    """Styles, table styles and static story fragments for one document type, built once per process"""
+
+    def __init__(self, doc_type, profile, fonts, styles, table_styles):
+        self.doc_type = doc_type
+        self.profile = profile
+        self.fonts = fonts
+        self.styles = styles
+        self.table_styles = table_styles
+
+        settings = DOCUMENT_TYPES[doc_type]
+        logo = _logo_image(LOGO_PATH, PDF_PROFILES[profile]["image_dpi"])
+        self._header = [logo] if logo else []
+        self._header += [
+            StaticParagraph("🏦 AURA", styles["title"]),
+            StaticParagraph("AI Unified Risk & Loan Origination Assistant", styles["subtitle"]),
+            StaticParagraph(f"<b>{settings['title']}</b>", styles["title"]),
+            Spacer(1, 20)
+        ]
+        self._closing = [
+            StaticParagraph(settings["disclaimer"], styles["disclaimer"]),
+            Spacer(1, 20),
+            StaticParagraph("Generated by AURA - AI Unified Risk & Loan Origination Assistant", styles["footer"])
+        ]
+        self._headings = {}
+
+    def header(self):
+        """Logo, subtitle and document title"""
+        return [copy.copy(flowable) for flowable in self._header]
+
+    def closing(self, generated_at=None, dated=True):
+        """Disclaimer and footer, ending with the generation date unless dated is False"""
+        generated_at = generated_at or datetime.now()
+        story = [copy.copy(flowable) for flowable in self._closing]
+        if dated:
+            story.append(Paragraph(f"Document generated on {generated_at.strftime('%B %d, %Y')}", self.styles["footer"]))
+        return story
+
+    def heading(self, text):
+        """Section heading; headings repeat across documents, so they are laid out once"""
+        if text not in self._headings:
+            self._headings[text] = StaticParagraph(text, self.styles["heading"])
+        return copy.copy(self._headings[text])
+
+    def key_value_table(self, rows, style="key_value"):
+        """Two-column label/value table in the house style"""
+        table = Table(rows, colWidths=[150, 320])
+        table.setStyle(self.table_styles[style])
+        return table
+
+    def new_document(self, output, **kwargs):
+        """SimpleDocTemplate on A4 with the house margins, writing to a buffer or file path"""
+        settings = dict(pagesize=A4, rightMargin=PAGE_MARGIN, leftMargin=PAGE_MARGIN, topMargin=PAGE_MARGIN, bottomMargin=PAGE_MARGIN)
+        compression = PDF_PROFILES[self.profile]["compression"]
+        if compression is not None:
+            settings["pageCompression"] = 1 if compression else 0
+        settings.update(kwargs)
+        return SimpleDocTemplate(output, **settings)
+
+    @property
+    def canvasmaker(self):
+        """Canvas class for pdf.build() that applies the profile's compression"""
+        compression = PDF_PROFILES[self.profile]["compression"]
+        if compression:
+            return partial(StreamingCanvas, compression_level=compression)
+        return Canvas
+
+
+@lru_cache(maxsize=None)
+def _logo_image_data(path, mtime, max_pixels):
+    """Logo as PNG bytes no wider than max_pixels, or None if there is no usable image"""
+    try:
+        with PILImage.open(path) as image:
+            image.load()
+            if image.width > max_pixels:
+                image = image.resize((max_pixels, round(image.height * max_pixels / image.width)), PILImage.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG", optimize=True)
+            return buffer.getvalue(), image.width, image.height
+    except (OSError, ValueError):
+        return None
+
+def _logo_image(path, image_dpi):
+    """Header logo flowable downsampled to image_dpi, or None if the logo file is missing or empty"""
+    if not os.path.exists(path):
+        return None
+    logo = _logo_image_data(path, os.path.getmtime(path), max(1, round(LOGO_WIDTH / inch * image_dpi)))
+    if logo is None:
+        return None
+    data, width, height = logo
+    return Image(io.BytesIO(data), width=LOGO_WIDTH, height=LOGO_WIDTH * height / width)
+
+@lru_cache(maxsize=None)
+def _font_names(fonts):
+    """Regular and bold font names for a font setting, registering the embedded TrueType fonts once"""
+    if fonts == "standard":
+        return STANDARD_FONTS
+    if fonts != "embedded":
+        raise ValueError(f"Unknown font setting '{fonts}'")
+    if not os.path.exists(FONT_PATH):
+        raise FileNotFoundError(f"Embedded font profile needs a TrueType font at {FONT_PATH} (set AURA_PDF_FONT_PATH)")
+
+    bold_path = BOLD_FONT_PATH if os.path.exists(BOLD_FONT_PATH) else FONT_PATH
+    pdfmetrics.registerFont(TTFont("AURASans", FONT_PATH))
+    pdfmetrics.registerFont(TTFont("AURASans-Bold", bold_path))
+    pdfmetrics.registerFontFamily("AURASans", normal="AURASans", bold="AURASans-Bold", italic="AURASans", boldItalic="AURASans-Bold")
+    return {"regular": "AURASans", "bold": "AURASans-Bold"}
+
+@lru_cache(maxsize=None)
+def _build_styles(fonts="standard"):
+    """Paragraph and table styles shared by every document type, for one font setting"""
+
+    sample = getSampleStyleSheet()
+    font_names = _font_names(fonts)
+    regular = font_names["regular"]
+    bold = font_names["bold"]
+
+    styles = {
+        "normal": sample["Normal"] if fonts == "standard" else ParagraphStyle("BodyText", parent=sample["Normal"], fontName=regular),
+        "title": ParagraphStyle(
+            "CustomTitle",
+            parent=sample["Heading1"],
+            fontName=bold,
+            alignment=TA_CENTER,
+            fontSize=18,
+            textColor=BRAND_COLOR,
+            spaceAfter=20
+        ),
+        "subtitle": ParagraphStyle(
+            "Subtitle",
+            parent=sample["Normal"],
+            fontName=regular,
+            alignment=TA_CENTER,
+            fontSize=12,
+            textColor=colors.grey,
+            spaceAfter=30
+        ),
+        "heading": ParagraphStyle(
+            "CustomHeading",
+            parent=sample["Heading2"],
+            fontName=bold,
+            fontSize=14,
+            textColor=BRAND_COLOR,
+            spaceAfter=10,
+            spaceBefore=15
+        ),
+        "subheading": ParagraphStyle(
+            "CustomSubheading",
+            parent=sample["Heading3"],
+            fontName=bold,
+            fontSize=11,
+            textColor=BRAND_COLOR,
+            spaceAfter=4,
+            spaceBefore=8
+        ),
+        "bullet": ParagraphStyle(
+            "Bullet",
+            parent=sample["Normal"],
+            fontName=regular,
+            leftIndent=14,
+            bulletIndent=4
+        ),
+        "disclaimer": ParagraphStyle(
+            "Disclaimer",
+            parent=sample["Normal"],
+            fontName=regular,
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=TA_LEFT
+        ),
+        "footer": ParagraphStyle(
+            "Footer",
+            parent=sample["Normal"],
+            fontName=regular,
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        )
+    }
+
+    key_value = [
+        ('FONTNAME', (0, 0), (-1, -1), regular),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('FONTNAME', (0, 0), (0, -1), bold),
+        ('TEXTCOLOR', (0, 0), (0, -1), BRAND_COLOR),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.lightgrey),
+    ]
+
+    table_styles = {
+        "meta": TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), regular),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+        ]),
+        "key_value": TableStyle(key_value)
+    }
+
+    # Risk tables highlight the first value in the risk level's color
+    for level, risk_color in [("HIGH RISK", colors.red), ("MODERATE RISK", colors.orange), ("LOW RISK", colors.green)]:
+        table_styles[level] = TableStyle(key_value[:4] + [
+            ('TEXTCOLOR', (1, 0), (1, 0), risk_color),
+            ('FONTNAME', (1, 0), (1, 0), bold),
+        ] + key_value[4:])
+
+    return styles, table_styles, font_names
+
+@lru_cache(maxsize=None)
+def get_template(doc_type="term_sheet", profile=None):
+    """The prebuilt template for a document type (term_sheet, credit_memo, portfolio_report) and output profile"""
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PDF_PROFILES:
+        raise ValueError(f"Unknown PDF profile '{profile}'; choose from {', '.join(PDF_PROFILES)}")
+    styles, table_styles, font_names = _build_styles(PDF_PROFILES[profile]["fonts"])
+    return DocumentTemplate(doc_type, profile, font_names, styles, table_styles)
+
+def risk_table_style(risk_level):
+    """Table style name for a risk level; anything not high or moderate is shown as low"""
+    return risk_level if risk_level in ("HIGH RISK", "MODERATE RISK") else "LOW RISK"
+
+def generate_term_sheet_pdf(company_name, industry, loan_amount, purpose, risk_analysis, loan_terms, profile=None, stamped=True):
+    """
+    Generate professional bank-style PDF term sheet; profile is a PDF_PROFILES name
+    stamped=False leaves out the generation time and document ID, for copies that are cached and served again
+    """
     
+    template = get_template("term_sheet", profile)
     buffer = io.BytesIO()
-    
-    pdf = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=50,
-        leftMargin=50,
-        topMargin=50,
-        bottomMargin=50
-    )
-    
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        alignment=TA_CENTER,
-        fontSize=18,
-        textColor=colors.HexColor("#1f4788"),
-        spaceAfter=20
-    )
-    
-    subtitle_style = ParagraphStyle(
-        "Subtitle",
-        parent=styles["Normal"],
-        alignment=TA_CENTER,
-        fontSize=12,
-        textColor=colors.grey,
-        spaceAfter=30
-    )
-    
-    heading_style = ParagraphStyle(
-        "CustomHeading",
-        parent=styles["Heading2"],
-        fontSize=14,
-        textColor=colors.HexColor("#1f4788"),
-        spaceAfter=10,
-        spaceBefore=15
-    )
+    pdf = template.new_document(buffer)
+    now = datetime.now()
     
     # Header
-    story.append(Paragraph("🏦 AURA", title_style))
-    story.append(Paragraph("AI Unified Risk & Loan Origination Assistant", subtitle_style))
-    story.append(Paragraph("<b>CONFIDENTIAL TERM SHEET</b>", title_style))
-    story.append(Spacer(1, 20))
+    story = template.header()
     
     # Metadata
     meta_data = [
-        ["Generated:", datetime.now().strftime('%B %d, %Y at %H:%M')],
-        ["Document ID:", f"AURA-{datetime.now().strftime('%Y%m%d%H%M%S')}"],
+        ["Generated:", now.strftime('%B %d, %Y at %H:%M')],
+        ["Document ID:", f"AURA-{now.strftime('%Y%m%d%H%M%S')}"],
+        ["Status:", "DRAFT - FOR DISCUSSION PURPOSES ONLY"]
+    ] if stamped else [
         ["Status:", "DRAFT - FOR DISCUSSION PURPOSES ONLY"]
     ]
     
     meta_table = Table(meta_data, colWidths=[120, 350])
-    meta_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-    ]))
+    meta_table.setStyle(template.table_styles["meta"])
     
     story.append(meta_table)
     story.append(Spacer(1, 25))
     
     # Borrower Information
-    story.append(Paragraph("BORROWER INFORMATION", heading_style))
-    
-    borrower_data = [
+    story.append(template.heading("BORROWER INFORMATION"))
+    story.append(template.key_value_table([
         ["Company Name:", company_name],
         ["Industry:", industry],
         ["Loan Amount:", f"${loan_amount} Million"],
         ["Purpose:", purpose]
-    ]
-    
-    borrower_table = Table(borrower_data, colWidths=[150, 320])
-    borrower_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor("#1f4788")),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.lightgrey),
     ]))
-    
-    story.append(borrower_table)
     story.append(Spacer(1, 20))
     
     # Risk Assessment
-    story.append(Paragraph("RISK ASSESSMENT", heading_style))
-    
-    risk_color = colors.red if risk_analysis["risk_level"] == "HIGH RISK" else colors.orange if risk_analysis["risk_level"] == "MODERATE RISK" else colors.green
-    
-    risk_data = [
+    story.append(template.heading("RISK ASSESSMENT"))
+    story.append(template.key_value_table([
         ["Risk Level:", risk_analysis["risk_level"]],
         ["Risk Score:", f"{risk_analysis['risk_score']}/100"],
         ["Recommendation:", risk_analysis["recommendation"]]
-    ]
-    
-    risk_table = Table(risk_data, colWidths=[150, 320])
-    risk_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor("#1f4788")),
-        ('TEXTCOLOR', (1, 0), (1, 0), risk_color),
-        ('FONTNAME', (1, 0), (1, 0), 'Helvetica-Bold'),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.lightgrey),
-    ]))
-    
-    story.append(risk_table)
+    ], style=risk_table_style(risk_analysis["risk_level"])))
     story.append(Spacer(1, 20))
     
     # Proposed Loan Terms
-    story.append(Paragraph("PROPOSED LOAN TERMS", heading_style))
-    
-    terms_data = [
+    story.append(template.heading("PROPOSED LOAN TERMS"))
+    story.append(template.key_value_table([
         ["Tenor:", loan_terms["tenor"]],
         ["Interest Rate:", loan_terms["interest_margin"]],
         ["Amortization:", loan_terms["amortization"]],
         ["Collateral:", loan_terms["collateral"]]
-    ]
-    
-    terms_table = Table(terms_data, colWidths=[150, 320])
-    terms_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor("#1f4788")),
-        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('LINEBELOW', (0, -1), (-1, -1), 1, colors.lightgrey),
     ]))
-    
-    story.append(terms_table)
     story.append(Spacer(1, 20))
     
     # Financial Covenants
-    story.append(Paragraph("FINANCIAL COVENANTS", heading_style))
+    story.append(template.heading("FINANCIAL COVENANTS"))
     
     for covenant in loan_terms["covenants"]:
-        story.append(Paragraph(f"• {covenant}", styles["Normal"]))
+        story.append(Paragraph(f"• {covenant}", template.styles["normal"]))
     
     story.append(Spacer(1, 30))
     
-    # Disclaimer
-    disclaimer_style = ParagraphStyle(
-        "Disclaimer",
-        parent=styles["Normal"],
-        fontSize=8,
-        textColor=colors.grey,
-        alignment=TA_LEFT
-    )
-    
-    disclaimer_text = """
-<b>IMPORTANT DISCLAIMER:</b><br/>
-This term sheet is indicative only and does not constitute a commitment to lend. Final terms are subject to 
-satisfactory completion of due diligence, credit approval, documentation, and fulfillment of conditions precedent. 
-This document is confidential and intended solely for the use of the addressee. AURA AI system recommendations 
-are for guidance purposes and all credit decisions require human oversight and approval.
-"""
-    
-    story.append(Paragraph(disclaimer_text, disclaimer_style))
-    
-    # Footer
-    story.append(Spacer(1, 20))
-    footer_style = ParagraphStyle(
-        "Footer",
-        parent=styles["Normal"],
-        fontSize=8,
-        textColor=colors.grey,
-        alignment=TA_CENTER
-    )
-    
-    story.append(Paragraph("Generated by AURA - AI Unified Risk & Loan Origination Assistant", footer_style))
-    story.append(Paragraph(f"Document generated on {datetime.now().strftime('%B %d, %Y')}", footer_style))
+    # Disclaimer and footer
+    story.extend(template.closing(now, dated=stamped))
     
     # Build PDF
-    pdf.build(story)
+    pdf.build(story, canvasmaker=template.canvasmaker)
     buffer.seek(0)
     
-    return buffer
\ No newline at end of file
+    return buffer
+
+
+# Portfolio credit book
+
+RISK_COLORS = {"LOW RISK": colors.green, "MODERATE RISK": colors.orange, "HIGH RISK": colors.red}
+
+# Risk factor markers the standard PDF fonts cannot draw; any other non-Latin-1 symbol is dropped
+SYMBOL_REPLACEMENTS = {"✅": "+", "⚠️": "!", "ℹ️": "i"}
+BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+ITALIC_PATTERN = re.compile(r"(?<!\*)\*([^*]+)\*(?!\*)")
+
+
+class LazyStory(list):
+    """
+    Story list that pulls flowables from a generator as the build consumes them
+
+    The platypus build loop only looks at the first few flowables and deletes
+    them once placed, so refilling a short buffer on demand keeps just a few
+    sections of flowables alive at a time however long the document is.
+    """
+
+    def __init__(self, flowables, lookahead=64):
+        list.__init__(self)
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+        self._exhausted = False
+
+    def _fill(self):
+        while not self._exhausted and list.__len__(self) < self._lookahead:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._exhausted = True
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+def markdown_flowables(text, template):
+    """Paragraphs for the markdown subset explanations use: headings, bullets, bold/italic, rules"""
+    flowables = []
+    paragraph = []
+
+    def flush():
+        if paragraph:
+            flowables.append(Paragraph(" ".join(paragraph), template.styles["normal"]))
+            paragraph.clear()
+
+    for line in text.splitlines():
+        line = line.strip()
+        for symbol, replacement in SYMBOL_REPLACEMENTS.items():
+            line = line.replace(symbol, replacement)
+        line = line.encode("latin-1", "ignore").decode("latin-1").strip()
+        markup = ITALIC_PATTERN.sub(r"<i>\1</i>", BOLD_PATTERN.sub(r"<b>\1</b>", escape(line)))
+
+        if not line or line == "---":
+            flush()
+        elif line.startswith("#"):
+            flush()
+            flowables.append(Paragraph(markup.lstrip("#").strip(), template.styles["subheading"]))
+        elif line.startswith("- "):
+            flush()
+            flowables.append(Paragraph(markup[2:], template.styles["bullet"], bulletText="•"))
+        else:
+            paragraph.append(markup)
+
+    flush()
+    return flowables
+
+def _portfolio_charts(deals, fonts):
+    """Vector charts of the book: risk level mix and exposure by industry"""
+
+    levels = {}
+    exposure = {}
+    for company_data, risk_analysis, _ in deals:
+        levels[risk_analysis["risk_level"]] = levels.get(risk_analysis["risk_level"], 0) + 1
+        industry = company_data.get("industry") or "Other"
+        exposure[industry] = exposure.get(industry, 0) + company_data.get("loan_amount", 0)
+
+    drawing = Drawing(495, 220)
+
+    pie = Pie()
+    pie.x, pie.y, pie.width, pie.height = 60, 30, 140, 140
+    pie.data = list(levels.values())
+    pie.labels = [f"{level} ({count})" for level, count in levels.items()]
+    pie.simpleLabels = 1
+    pie.slices.fontName = fonts["regular"]
+    pie.slices.strokeColor = colors.white
+    for i, level in enumerate(levels):
+        pie.slices[i].fillColor = RISK_COLORS.get(level, colors.grey)
+    drawing.add(pie)
+    drawing.add(String(130, 200, "Deals by risk level", fontName=fonts["bold"], fontSize=10, textAnchor="middle"))
+
+    industries = sorted(exposure, key=exposure.get, reverse=True)[:8]
+    bars = VerticalBarChart()
+    bars.x, bars.y, bars.width, bars.height = 300, 60, 185, 130
+    bars.data = [[exposure[industry] for industry in industries]]
+    bars.categoryAxis.categoryNames = industries
+    bars.categoryAxis.labels.angle = 30
+    bars.categoryAxis.labels.boxAnchor = "ne"
+    bars.categoryAxis.labels.fontSize = 7
+    bars.categoryAxis.labels.fontName = fonts["regular"]
+    bars.valueAxis.valueMin = 0
+    bars.valueAxis.labels.fontSize = 7
+    bars.valueAxis.labels.fontName = fonts["regular"]
+    bars.bars[0].fillColor = BRAND_COLOR
+    drawing.add(bars)
+    drawing.add(String(392, 200, "Exposure by industry ($M)", fontName=fonts["bold"], fontSize=10, textAnchor="middle"))
+
+    return drawing
+
+def _deal_section(template, index, company_data, risk_analysis, loan_terms, explanation):
+    """Flowables for one deal: borrower, risk, terms, covenants and explanation"""
+
+    yield PageBreak()
+    yield Paragraph(f"{index}. {escape(str(company_data.get('company_name', 'Unknown')))}", template.styles["title"])
+
+    yield template.heading("BORROWER")
+    yield template.key_value_table([
+        ["Industry:", company_data.get("industry", "")],
+        ["Loan Amount:", f"${company_data.get('loan_amount', 0)} Million"],
+        ["Purpose:", company_data.get("purpose", "")]
+    ])
+
+    yield template.heading("RISK ASSESSMENT")
+    yield template.key_value_table([
+        ["Risk Level:", risk_analysis["risk_level"]],
+        ["Risk Score:", f"{risk_analysis['risk_score']}/100"],
+        ["Recommendation:", risk_analysis["recommendation"]]
+    ], style=risk_table_style(risk_analysis["risk_level"]))
+
+    yield template.heading("TERMS")
+    yield template.key_value_table([
+        ["Tenor:", loan_terms["tenor"]],
+        ["Interest Rate:", loan_terms["interest_margin"]],
+        ["Amortization:", loan_terms["amortization"]],
+        ["Collateral:", loan_terms["collateral"]]
+    ])
+
+    yield KeepTogether(
+        [template.heading("COVENANTS")]
+        + [Paragraph(escape(covenant), template.styles["bullet"], bulletText="•") for covenant in loan_terms["covenants"]]
+    )
+
+    if explanation:
+        yield template.heading("CREDIT RATIONALE")
+        yield from markdown_flowables(explanation, template)
+
+def _portfolio_story(template, deals, explain, generated_at):
+    """The whole report as a generator: summary page first, then one section per deal"""
+
+    yield from template.header()
+
+    total = sum(company_data.get("loan_amount", 0) for company_data, _, _ in deals)
+    yield template.heading("PORTFOLIO SUMMARY")
+    yield template.key_value_table([
+        ["Deals:", f"{len(deals):,}"],
+        ["Total Exposure:", f"${total:,.1f} Million"],
+        ["Average Risk Score:", f"{sum(risk['risk_score'] for _, risk, _ in deals) / max(len(deals), 1):.1f}/100"],
+        ["Prepared:", generated_at.strftime('%B %d, %Y at %H:%M')]
+    ])
+    yield Spacer(1, 20)
+    if deals:
+        yield _portfolio_charts(deals, template.fonts)
+    yield Spacer(1, 20)
+    yield from template.closing(generated_at)
+
+    for index, (company_data, risk_analysis, loan_terms) in enumerate(deals, start=1):
+        explanation = explain(company_data, risk_analysis, loan_terms) if explain else None
+        yield from _deal_section(template, index, company_data, risk_analysis, loan_terms, explanation)
+
+def _page_number(canvas, doc, fonts=STANDARD_FONTS):
+    """Footer on every page of the credit book"""
+    canvas.saveState()
+    canvas.setFont(fonts["regular"], 8)
+    canvas.setFillColor(colors.grey)
+    canvas.drawCentredString(A4[0] / 2, PAGE_MARGIN / 2, f"AURA Portfolio Credit Report - Page {doc.page} - Confidential")
+    canvas.restoreState()
+
+def generate_portfolio_report_pdf(deals, output_path, explain=None, profile="compact"):
+    """
+    Multi-page credit committee book written straight to output_path
+
+    deals is a sequence of (company_data, risk_analysis, loan_terms); explain,
+    if given, is called per deal as the document reaches it (e.g.
+    services.explanation_engine.generate_explanation) and its markdown is
+    rendered as the credit rationale. Flowables are generated lazily and,
+    with a compressing profile, finished pages are deflated straight away,
+    so memory stays close to the size of the output file. Returns the page
+    count.
+    """
+
+    template = get_template("portfolio_report", profile)
+    pdf = template.new_document(output_path, title="AURA Portfolio Credit Report")
+    story = LazyStory(_portfolio_story(template, deals, explain, datetime.now()))
+    footer = partial(_page_number, fonts=template.fonts)
+
+    pdf.build(story, onFirstPage=footer, onLaterPages=footer, canvasmaker=template.canvasmaker)
+
+    return pdf.page